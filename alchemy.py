@@ -1,17 +1,85 @@
 import logging
-from datetime import datetime
+from datetime import datetime, time, timedelta
 
-from sqlalchemy import Column, Float, Integer, String, Text, create_engine
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Float,
+    Integer,
+    String,
+    Text,
+    and_,
+    bindparam,
+    case,
+    create_engine,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from logging_setup import get_logger
+from utils import default_db_path
 
 logger = get_logger(__name__)
 
 Base = declarative_base()
-engine = create_engine("sqlite:///timetracker.db")
-Session = sessionmaker(bind=engine)
+Session = sessionmaker()
+
+# Applied to every new SQLite connection. WAL lets readers and the background
+# sync writers work alongside the UI, and synchronous=NORMAL only fsyncs at
+# checkpoints instead of on every commit.
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # ms to wait on a locked database
+    "cache_size": -16000,  # negative values are KiB, so ~16 MB
+    "mmap_size": 64 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+
+def configure_engine(db_path=None, **pragmas):
+    """
+    Create the database engine and bind the session factory to it
+
+    Args:
+        db_path: SQLite database file. Defaults to ``default_db_path()``
+        **pragmas: Overrides for ``DEFAULT_PRAGMAS``; pass None to skip one
+
+    Returns:
+        Engine: The new engine, also stored as ``alchemy.engine``
+    """
+    global engine
+
+    db_path = db_path or default_db_path()
+    settings = {**DEFAULT_PRAGMAS, **pragmas}
+    settings = {name: value for name, value in settings.items() if value is not None}
+
+    new_engine = create_engine(f"sqlite:///{db_path}")
+
+    @event.listens_for(new_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in settings.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    engine = new_engine
+    Session.configure(bind=engine)
+    logger.info(f"Using database {db_path}")
+    return engine
+
+
+engine = configure_engine()
 
 
 class Task(Base):
@@ -24,10 +92,63 @@ class Task(Base):
     duration = Column(Float)
     jira_key = Column(String)
     created_date = Column(String, nullable=False)
+    created_at = Column(DateTime, index=True)
     task_id_required = Column(Integer, default=0)
     synced = Column(Integer, default=0)
     notes = Column(Text)
-    worklog_id = Column(Integer)
+    worklog_id = Column(Integer, index=True)
+
+
+class WorklogOutbox(Base):
+    """Worklogs waiting to be posted to JIRA by the background drainer"""
+
+    __tablename__ = "worklog_outbox"
+
+    outbox_id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False, unique=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, index=True)
+    last_error = Column(Text)
+    created_at = Column(DateTime, nullable=False)
+
+
+class TaskSegment(Base):
+    """A continuous interval of work on a task, between a start/resume and a
+    pause/stop. ``end_time`` is NULL while the segment is running."""
+
+    __tablename__ = "task_segments"
+
+    segment_id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False, index=True)
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, index=True)
+
+
+class DailyRollup(Base):
+    """Per-day totals of tasks by JIRA key and task name. Functions that change
+    tasks refresh the rows of the affected days, so reports read these instead
+    of scanning every task."""
+
+    __tablename__ = "daily_rollups"
+
+    rollup_id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False, index=True)
+    jira_key = Column(String)
+    task_name = Column(String, nullable=False)
+    total_duration = Column(Float, nullable=False, default=0.0)
+    synced_duration = Column(Float, nullable=False, default=0.0)
+    task_count = Column(Integer, nullable=False, default=0)
+
+
+# Task fields that feed into the daily rollups
+ROLLUP_FIELDS = {"task_name", "duration", "jira_key", "synced"}
+
+
+def segment_hours(now=None):
+    """SQL expression for the length of a segment in hours; open segments are
+    measured up to ``now``"""
+    end = func.coalesce(TaskSegment.end_time, now or datetime.now())
+    return (func.julianday(end) - func.julianday(TaskSegment.start_time)) * 24
 
 
 def get_db_connection():
@@ -38,24 +159,193 @@ def get_db_connection():
 def init_db():
     """Initialize the database and create the tasks table if it doesn't exist"""
     try:
+        new_tables = set(Base.metadata.tables) - set(inspect(engine).get_table_names())
         Base.metadata.create_all(engine)
+        migrate_db()
+        if TaskSegment.__tablename__ in new_tables:
+            # Keep the time of tasks recorded before segments existed
+            with engine.begin() as connection:
+                count = seed_segments(connection)
+            if count:
+                logger.info(f"Added {count} segments for existing tasks")
+        if DailyRollup.__tablename__ in new_tables:
+            # Fill the rollups once for tasks recorded before they existed
+            rebuild_daily_rollups()
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
         raise
 
 
+def migrate_db():
+    """
+    Bring an existing database up to the current schema.
+
+    Databases created before the indexed ``created_at`` column existed get the
+    column and its index added, and the value is backfilled from the ISO
+    formatted ``created_date`` string. ``worklog_id`` is indexed so imports
+    can skip worklogs that are already stored, and segment ``end_time`` so
+    running tasks are found without a scan.
+    """
+    columns = {column["name"] for column in inspect(engine).get_columns("tasks")}
+
+    with engine.begin() as connection:
+        if "created_at" not in columns:
+            logger.info("Adding created_at column to tasks table")
+            connection.execute(text("ALTER TABLE tasks ADD COLUMN created_at DATETIME"))
+            connection.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_tasks_created_at "
+                    "ON tasks (created_at)"
+                )
+            )
+
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_tasks_worklog_id ON tasks (worklog_id)"
+            )
+        )
+        connection.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_task_segments_end_time "
+                "ON task_segments (end_time)"
+            )
+        )
+
+        # SQLAlchemy stores DateTime values as "YYYY-MM-DD HH:MM:SS.ffffff" on
+        # SQLite. isoformat() omits the microseconds when they are zero, so pad
+        # them back in to keep string comparisons on the column correct.
+        result = connection.execute(
+            text(
+                "UPDATE tasks SET created_at = "
+                "substr(replace(created_date, 'T', ' ') || '.000000', 1, 26) "
+                "WHERE created_at IS NULL AND created_date IS NOT NULL"
+            )
+        )
+        if result.rowcount:
+            logger.info(f"Backfilled created_at for {result.rowcount} tasks")
+
+
+def day_bounds(date):
+    """Return the [start, end) datetime range covering the given date"""
+    start = datetime.combine(date, time.min)
+    return start, start + timedelta(days=1)
+
+
+def _rollup_query(start=None, end=None):
+    """SELECT producing daily rollup rows from tasks, optionally for tasks
+    created in [start, end)"""
+    day = func.date(Task.created_at)
+    query = (
+        select(
+            day,
+            Task.jira_key,
+            Task.task_name,
+            func.coalesce(func.sum(Task.duration), 0.0),
+            func.coalesce(
+                func.sum(case((Task.synced == 1, Task.duration), else_=0.0)), 0.0
+            ),
+            func.count(Task.task_id),
+        )
+        .where(Task.created_at.is_not(None))
+        .group_by(day, Task.jira_key, Task.task_name)
+    )
+    if start is not None:
+        query = query.where(Task.created_at >= start, Task.created_at < end)
+    return query
+
+
+ROLLUP_COLUMNS = [
+    "day",
+    "jira_key",
+    "task_name",
+    "total_duration",
+    "synced_duration",
+    "task_count",
+]
+
+
+def task_days(session, task_ids):
+    """Return the dates the given tasks were created on"""
+    task_ids = list(task_ids)
+    days = set()
+    # Chunked to stay below SQLite's limit on bound parameters
+    for i in range(0, len(task_ids), 500):
+        rows = session.query(Task.created_at).filter(
+            Task.task_id.in_(task_ids[i : i + 500]), Task.created_at.is_not(None)
+        )
+        days.update(row.created_at.date() for row in rows)
+    return days
+
+
+# Statements refreshing the rollups of a range of days, built once since they
+# run on every task change
+_delete_rollups = delete(DailyRollup).where(
+    DailyRollup.day >= bindparam("first"), DailyRollup.day <= bindparam("last")
+)
+_insert_rollups = insert(DailyRollup).from_select(
+    ROLLUP_COLUMNS, _rollup_query(bindparam("start"), bindparam("end"))
+)
+
+# Above this many days, recomputing the whole span between the first and last
+# day in two statements is cheaper than two statements per day
+ROLLUP_SPAN_THRESHOLD = 100
+
+
+def refresh_daily_rollups(session, days):
+    """
+    Recompute the daily rollup rows of the given dates from their tasks
+
+    Runs in the caller's session so the rollups are committed together with
+    the task changes that made them stale.
+    """
+    days = sorted(set(days))
+    if len(days) > ROLLUP_SPAN_THRESHOLD:
+        spans = [(days[0], days[-1])]
+    else:
+        spans = [(day, day) for day in days]
+
+    connection = session.connection()
+    for first, last in spans:
+        start, _ = day_bounds(first)
+        _, end = day_bounds(last)
+        connection.execute(_delete_rollups, {"first": first, "last": last})
+        connection.execute(_insert_rollups, {"start": start, "end": end})
+
+
+def rebuild_daily_rollups():
+    """Recompute all daily rollups from the tasks table; returns the row count"""
+    try:
+        session = Session()
+        session.execute(delete(DailyRollup))
+        session.execute(
+            insert(DailyRollup).from_select(ROLLUP_COLUMNS, _rollup_query())
+        )
+        session.commit()
+        count = session.query(func.count(DailyRollup.rollup_id)).scalar()
+        session.close()
+        logger.info(f"Rebuilt daily rollups: {count} rows")
+        return count
+    except Exception as e:
+        logger.error(f"Error rebuilding daily rollups: {e}")
+        raise
+
+
 def create_task(task_name, jira_key=None, notes=None):
     """Create a new task and return its ID"""
     try:
         session = Session()
+        now = datetime.now()
         new_task = Task(
             task_name=task_name,
-            created_date=datetime.now().isoformat(),
+            created_date=now.isoformat(),
+            created_at=now,
             jira_key=jira_key,
             notes=notes,
         )
         session.add(new_task)
+        session.flush()
+        refresh_daily_rollups(session, [now.date()])
         session.commit()
         task_id = new_task.task_id
         session.close()
@@ -70,10 +360,10 @@ def get_tasks_for_today():
     """Retrieve all tasks for today"""
     try:
         session = Session()
-        today = datetime.now().date().isoformat()
+        start, end = day_bounds(datetime.now().date())
         tasks = (
             session.query(Task)
-            .filter(Task.created_date.like(f"{today}%"))
+            .filter(Task.created_at >= start, Task.created_at < end)
             .order_by(Task.task_id.desc())
             .all()
         )
@@ -84,20 +374,22 @@ def get_tasks_for_today():
         raise
 
 
+# Task fields that may be changed through update_task/bulk_update_tasks
+UPDATABLE_FIELDS = {
+    "task_name",
+    "start_time",
+    "end_time",
+    "duration",
+    "jira_key",
+    "synced",
+    "notes",
+    "worklog_id",
+}
+
+
 def update_task(task_id, **kwargs):
     """Update task fields"""
-    valid_fields = {
-        "task_name",
-        "start_time",
-        "end_time",
-        "duration",
-        "jira_key",
-        "synced",
-        "notes",
-        "worklog_id",
-    }
-
-    update_fields = {k: v for k, v in kwargs.items() if k in valid_fields}
+    update_fields = {k: v for k, v in kwargs.items() if k in UPDATABLE_FIELDS}
     if not update_fields:
         return
 
@@ -106,6 +398,9 @@ def update_task(task_id, **kwargs):
         task = session.query(Task).filter_by(task_id=task_id).first()
         for key, value in update_fields.items():
             setattr(task, key, value)
+        if ROLLUP_FIELDS.intersection(update_fields) and task.created_at:
+            session.flush()
+            refresh_daily_rollups(session, [task.created_at.date()])
         session.commit()
         session.close()
         logger.info(f"Updated task {task_id}")
@@ -114,6 +409,38 @@ def update_task(task_id, **kwargs):
         raise
 
 
+def bulk_update_tasks(updates):
+    """
+    Update many tasks in a single transaction
+
+    Rows are applied as executemany UPDATE statements keyed by primary key,
+    without loading the tasks first.
+
+    Args:
+        updates: List of dicts, each with a ``task_id`` and the fields to set
+    """
+    rows = []
+    for update_data in updates:
+        fields = {k: v for k, v in update_data.items() if k in UPDATABLE_FIELDS}
+        if fields:
+            rows.append({"task_id": update_data["task_id"], **fields})
+    if not rows:
+        return
+
+    try:
+        session = Session()
+        session.execute(update(Task), rows)
+        rollup_task_ids = [row["task_id"] for row in rows if ROLLUP_FIELDS & set(row)]
+        if rollup_task_ids:
+            refresh_daily_rollups(session, task_days(session, rollup_task_ids))
+        session.commit()
+        session.close()
+        logger.info(f"Updated {len(rows)} tasks")
+    except Exception as e:
+        logger.error(f"Error updating tasks: {e}")
+        raise
+
+
 def get_task(task_id):
     """Retrieve a specific task by ID"""
     try:
@@ -140,30 +467,435 @@ def get_task(task_id):
         raise
 
 
-def get_tasks_for_date(date):
-    """Retrieve all tasks for a specific date"""
+def get_tasks_by_ids(task_ids):
+    """Retrieve multiple tasks by their IDs in a single query"""
     try:
         session = Session()
         tasks = (
             session.query(Task)
-            .filter(Task.created_date.like(f"{date.isoformat()}%"))
-            .order_by(Task.task_id.desc())
+            .filter(Task.task_id.in_(list(task_ids)))
+            .order_by(Task.task_id)
+            .all()
+        )
+        session.close()
+        return tasks
+    except Exception as e:
+        logger.error(f"Error retrieving tasks {task_ids}: {e}")
+        raise
+
+
+def mark_tasks_synced(worklog_ids):
+    """
+    Store JIRA worklog IDs and mark the tasks as synced in one transaction
+
+    Args:
+        worklog_ids: Mapping of task ID to the JIRA worklog ID created for it
+    """
+    bulk_update_tasks(
+        [
+            {"task_id": task_id, "worklog_id": worklog_id, "synced": 1}
+            for task_id, worklog_id in worklog_ids.items()
+        ]
+    )
+
+
+def enqueue_worklog(task_id):
+    """Queue a task for JIRA sync; does nothing if it is already queued"""
+    try:
+        session = Session()
+        exists = session.query(WorklogOutbox).filter_by(task_id=task_id).first()
+        if not exists:
+            now = datetime.now()
+            session.add(
+                WorklogOutbox(task_id=task_id, next_attempt_at=now, created_at=now)
+            )
+            session.commit()
+            logger.info(f"Queued task {task_id} for JIRA sync")
+        session.close()
+    except Exception as e:
+        logger.error(f"Error queueing task {task_id} for JIRA sync: {e}")
+        raise
+
+
+def get_due_outbox_entries(now=None, limit=100):
+    """Return outbox entries whose next attempt is due, oldest first"""
+    try:
+        session = Session()
+        entries = (
+            session.query(WorklogOutbox)
+            .filter(WorklogOutbox.next_attempt_at <= (now or datetime.now()))
+            .order_by(WorklogOutbox.next_attempt_at)
+            .limit(limit)
+            .all()
+        )
+        session.close()
+        return entries
+    except Exception as e:
+        logger.error(f"Error retrieving outbox entries: {e}")
+        raise
+
+
+def get_next_outbox_attempt():
+    """Return the earliest scheduled outbox attempt, or None if it is empty"""
+    try:
+        session = Session()
+        next_attempt = session.query(func.min(WorklogOutbox.next_attempt_at)).scalar()
+        session.close()
+        return next_attempt
+    except Exception as e:
+        logger.error(f"Error retrieving next outbox attempt: {e}")
+        raise
+
+
+def get_outbox_size():
+    """Return the number of worklogs waiting in the outbox"""
+    try:
+        session = Session()
+        size = session.query(func.count(WorklogOutbox.outbox_id)).scalar()
+        session.close()
+        return size
+    except Exception as e:
+        logger.error(f"Error counting outbox entries: {e}")
+        raise
+
+
+def remove_outbox_entries(task_ids):
+    """Remove the outbox entries of the given tasks"""
+    if not task_ids:
+        return
+
+    try:
+        session = Session()
+        session.query(WorklogOutbox).filter(
+            WorklogOutbox.task_id.in_(list(task_ids))
+        ).delete(synchronize_session=False)
+        session.commit()
+        session.close()
+    except Exception as e:
+        logger.error(f"Error removing outbox entries: {e}")
+        raise
+
+
+def reschedule_outbox_entries(retries):
+    """
+    Record failed attempts and schedule the next ones in one transaction
+
+    Args:
+        retries: List of dicts with ``outbox_id``, ``attempts``,
+            ``next_attempt_at`` and ``last_error``
+    """
+    if not retries:
+        return
+
+    try:
+        session = Session()
+        session.execute(update(WorklogOutbox), retries)
+        session.commit()
+        session.close()
+    except Exception as e:
+        logger.error(f"Error rescheduling outbox entries: {e}")
+        raise
+
+
+# Segments inserted per executemany batch when seeding them
+SEED_BATCH_SIZE = 5000
+
+
+def legacy_segments(task_id, start_time, end_time, duration):
+    """
+    Return segment rows standing in for the time a task recorded without
+    segments, e.g. before task_segments existed or in an import
+
+    The recorded duration becomes one closed segment from the task's
+    start_time. A task that was left running (end_time is NULL) gets an open
+    segment from its start_time, which was when it was last resumed, and its
+    earlier duration goes right before it.
+    """
+    if not start_time:
+        return []
+    start = datetime.fromisoformat(start_time)
+    hours = timedelta(hours=duration or 0)
+    segments = []
+    if end_time is None:
+        if hours:
+            segments.append(
+                {"task_id": task_id, "start_time": start - hours, "end_time": start}
+            )
+        segments.append({"task_id": task_id, "start_time": start, "end_time": None})
+    elif hours:
+        segments.append(
+            {"task_id": task_id, "start_time": start, "end_time": start + hours}
+        )
+    return segments
+
+
+def seed_segments(session, *criteria):
+    """
+    Give the tasks matching ``criteria`` that have no segments their
+    ``legacy_segments``, so their recorded time survives being resumed or
+    stopped
+
+    Args:
+        session: Session or Connection to run the statements in
+        *criteria: Extra WHERE clauses on Task, e.g. ``Task.task_id == 1``
+
+    Returns:
+        int: Number of segments inserted
+    """
+    has_segments = select(TaskSegment.segment_id).where(
+        TaskSegment.task_id == Task.task_id
+    )
+    rows = session.execute(
+        select(Task.task_id, Task.start_time, Task.end_time, Task.duration).where(
+            Task.start_time.is_not(None), ~has_segments.exists(), *criteria
+        )
+    )
+    segments = [segment for row in rows for segment in legacy_segments(*row)]
+    for i in range(0, len(segments), SEED_BATCH_SIZE):
+        session.execute(insert(TaskSegment), segments[i : i + SEED_BATCH_SIZE])
+    return len(segments)
+
+
+def start_segment(task_id, start_time=None):
+    """
+    Open a new segment for a task when it is started or resumed
+
+    The task's start_time is only set the first time, so it keeps pointing at
+    the beginning of the work; end_time is cleared while the task runs.
+    """
+    start_time = start_time or datetime.now()
+    try:
+        session = Session()
+        seed_segments(session, Task.task_id == task_id)
+        result = session.execute(
+            update(Task)
+            .where(Task.task_id == task_id)
+            .values(
+                start_time=func.coalesce(Task.start_time, start_time.isoformat()),
+                end_time=None,
+            )
+        )
+        if not result.rowcount:
+            session.close()
+            raise ValueError(f"Task {task_id} not found")
+        session.add(TaskSegment(task_id=task_id, start_time=start_time))
+        session.commit()
+        session.close()
+    except Exception as e:
+        logger.error(f"Error starting segment for task {task_id}: {e}")
+        raise
+
+
+def end_segment(task_id, end_time=None, require_open=True):
+    """
+    Close the running segment of a task and return its total duration in hours
+
+    The task's cached duration and end_time are refreshed from the segment
+    totals in the same transaction. Time the task recorded without segments
+    is kept (see ``seed_segments``).
+
+    Args:
+        task_id: Task ID
+        end_time: When the segment ended. Defaults to now
+        require_open: Raise ValueError if the task has no running segment
+    """
+    end_time = end_time or datetime.now()
+    try:
+        session = Session()
+        seed_segments(session, Task.task_id == task_id)
+        result = session.execute(
+            update(TaskSegment)
+            .where(TaskSegment.task_id == task_id, TaskSegment.end_time.is_(None))
+            .values(end_time=end_time)
+        )
+        if require_open and not result.rowcount:
+            session.close()
+            raise ValueError(f"Task {task_id} is not running")
+
+        duration = (
+            session.query(func.sum(segment_hours(end_time)))
+            .filter(TaskSegment.task_id == task_id)
+            .scalar()
+        )
+        values = {"end_time": end_time.isoformat()}
+        if duration is None:
+            # Nothing was ever tracked for the task; keep what is recorded
+            duration = session.get(Task, task_id).duration or 0.0
+        else:
+            values["duration"] = duration
+        session.execute(update(Task).where(Task.task_id == task_id).values(values))
+        refresh_daily_rollups(session, task_days(session, [task_id]))
+        session.commit()
+        session.close()
+        return duration
+    except Exception as e:
+        logger.error(f"Error ending segment for task {task_id}: {e}")
+        raise
+
+
+def get_segment_durations(task_ids):
+    """
+    Return the summed segment durations in hours of the given tasks
+
+    Tasks without any recorded segments are not included in the result.
+    """
+    try:
+        session = Session()
+        rows = (
+            session.query(TaskSegment.task_id, func.sum(segment_hours()))
+            .filter(TaskSegment.task_id.in_(list(task_ids)))
+            .group_by(TaskSegment.task_id)
+            .all()
+        )
+        session.close()
+        return dict(rows)
+    except Exception as e:
+        logger.error(f"Error retrieving segment durations: {e}")
+        raise
+
+
+def get_task_segments(task_id):
+    """Retrieve the segments of a task in chronological order"""
+    try:
+        session = Session()
+        segments = (
+            session.query(TaskSegment)
+            .filter(TaskSegment.task_id == task_id)
+            .order_by(TaskSegment.start_time)
+            .all()
+        )
+        session.close()
+        return segments
+    except Exception as e:
+        logger.error(f"Error retrieving segments for task {task_id}: {e}")
+        raise
+
+
+def get_running_tasks():
+    """Return the tasks that have an open segment, most recently started first"""
+    try:
+        session = Session()
+        tasks = (
+            session.query(Task)
+            .join(TaskSegment, TaskSegment.task_id == Task.task_id)
+            .filter(TaskSegment.end_time.is_(None))
+            .order_by(TaskSegment.start_time.desc())
             .all()
         )
         session.close()
         return tasks
+    except Exception as e:
+        logger.error(f"Error retrieving running tasks: {e}")
+        raise
+
+
+def get_queued_task_ids(since):
+    """
+    Return the IDs of tasks created since a date whose worklogs are waiting in
+    the outbox, oldest first
+
+    Tasks are only queued once they are stopped, so paused tasks are never
+    included; tasks that were resumed after stopping are skipped while they
+    run.
+    """
+    try:
+        session = Session()
+        start, _ = day_bounds(since)
+        running = select(TaskSegment.task_id).where(TaskSegment.end_time.is_(None))
+        task_ids = (
+            session.query(Task.task_id)
+            .join(WorklogOutbox, WorklogOutbox.task_id == Task.task_id)
+            .filter(Task.created_at >= start, Task.task_id.not_in(running))
+            .order_by(Task.created_at)
+            .all()
+        )
+        session.close()
+        return [task_id for (task_id,) in task_ids]
+    except Exception as e:
+        logger.error(f"Error retrieving queued tasks since {since}: {e}")
+        raise
+
+
+def get_tasks_for_date(date):
+    """Retrieve all tasks for a specific date"""
+    try:
+        return get_tasks_for_range(date, date)
     except Exception as e:
         logger.error(f"Error retrieving tasks for date {date}: {e}")
         raise
 
 
+def get_tasks_for_range(start_date, end_date, after=None, limit=None):
+    """
+    Retrieve tasks created between two dates (both inclusive), newest first
+
+    Results are ordered by (created_at, task_id) descending so they can be
+    paged with a keyset cursor instead of OFFSET, which keeps every page an
+    index range scan no matter how deep into the range it is.
+
+    Args:
+        start_date: First date of the range
+        end_date: Last date of the range
+        after: Optional (created_at, task_id) of the last task of the previous
+            page; only tasks ordered after it are returned
+        limit: Maximum number of tasks to return
+    """
+    try:
+        session = Session()
+        start, _ = day_bounds(start_date)
+        _, end = day_bounds(end_date)
+        query = session.query(Task).filter(
+            Task.created_at >= start, Task.created_at < end
+        )
+        if after is not None:
+            created_at, task_id = after
+            query = query.filter(
+                or_(
+                    Task.created_at < created_at,
+                    and_(Task.created_at == created_at, Task.task_id < task_id),
+                )
+            )
+        query = query.order_by(Task.created_at.desc(), Task.task_id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        tasks = query.all()
+        session.close()
+        return tasks
+    except Exception as e:
+        logger.error(
+            f"Error retrieving tasks for range {start_date} - {end_date}: {e}"
+        )
+        raise
+
+
+def get_total_duration_for_range(start_date, end_date):
+    """Return the summed duration in hours of tasks between two dates"""
+    try:
+        session = Session()
+        total = (
+            session.query(func.coalesce(func.sum(DailyRollup.total_duration), 0.0))
+            .filter(DailyRollup.day >= start_date, DailyRollup.day <= end_date)
+            .scalar()
+        )
+        session.close()
+        return total
+    except Exception as e:
+        logger.error(
+            f"Error retrieving total duration for {start_date} - {end_date}: {e}"
+        )
+        raise
+
+
 def delete_tasks(task_ids):
     """Delete multiple tasks by their IDs"""
     try:
         session = Session()
-        session.query(Task).filter(Task.task_id.in_(task_ids)).delete(
-            synchronize_session=False
-        )
+        days = task_days(session, task_ids)
+        for model in (TaskSegment, WorklogOutbox, Task):
+            session.query(model).filter(model.task_id.in_(task_ids)).delete(
+                synchronize_session=False
+            )
+        refresh_daily_rollups(session, days)
         session.commit()
         session.close()
         logger.info(f"Deleted tasks: {task_ids}")
@@ -0,0 +1,139 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+# Repository root, so benchmarks can import the app modules and run them in
+# child processes regardless of the current working directory
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def git_revision():
+    """
+    Return the current commit of the repository
+
+    Returns:
+        dict: ``commit`` hash (None outside a git checkout) and ``dirty`` flag
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        return {"commit": commit, "dirty": bool(status.strip())}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def environment_info():
+    """Describe the machine and revision a benchmark ran on"""
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        **git_revision(),
+    }
+
+
+def percentile(values, pct):
+    """
+    Return the ``pct`` percentile of ``values`` using linear interpolation
+
+    Args:
+        values: Non-empty sequence of numbers
+        pct: Percentile between 0 and 100
+
+    Returns:
+        float: The interpolated percentile
+    """
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(values):
+    """
+    Summarize a list of timings
+
+    Returns:
+        dict: Sample count, min, p50, p95, p99, max and mean, or only the count if
+        there are no samples
+    """
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "min": min(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values),
+        "mean": sum(values) / len(values),
+    }
+
+
+def write_report(report, path=None):
+    """Write a report as JSON to ``path``, or to stdout if no path is given"""
+    text = json.dumps(report, indent=2, default=str)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Report written to {path}")
+    else:
+        print(text)
+
+
+def load_report(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_summaries(baseline, current, key="p50"):
+    """
+    Compare two ``{name: summary}`` mappings produced by ``summarize``
+
+    Args:
+        baseline: Summaries from the reference report
+        current: Summaries from the new report
+        key: Statistic to compare
+
+    Returns:
+        list: ``(name, baseline value, current value, change in percent)``
+        tuples for every name present in both mappings
+    """
+    rows = []
+    for name, summary in current.items():
+        old = baseline.get(name, {}).get(key)
+        new = summary.get(key)
+        if old is None or new is None:
+            continue
+        change = (new - old) / old * 100 if old else 0.0
+        rows.append((name, old, new, change))
+    return rows
+
+
+def print_comparison(rows, unit="ms", scale=1000):
+    """Print the rows returned by ``compare_summaries`` as a table"""
+    width = max([len(name) for name, *_ in rows] + [5])
+    print(f"{'metric':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}")
+    for name, old, new, change in rows:
+        print(
+            f"{name:<{width}}  {old * scale:>8.1f}{unit}  "
+            f"{new * scale:>8.1f}{unit}  {change:>+7.1f}%"
+        )
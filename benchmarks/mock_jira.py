@@ -0,0 +1,446 @@
+"""
+Local stand-in for the parts of the JIRA Cloud REST API the app uses.
+
+Serves the current user, issue search and lookups, and worklog
+create/list/get/update/delete from memory, with configurable latency, server
+errors and 429 rate limiting, so the sync and import paths can be tested and
+benchmarked without an Atlassian instance. Point the
+app at it by setting ``JIRA_DOMAIN`` to the server URL, e.g.
+``JIRA_DOMAIN=http://127.0.0.1:8080``.
+
+Usage (from the repository root):
+
+    python -m benchmarks.mock_jira --port 8080 --latency 0.05 --rate-limit 0.05
+"""
+
+import argparse
+import base64
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+MYSELF_PATH = re.compile(r"^/rest/api/3/myself$")
+SEARCH_PATH = re.compile(r"^/rest/api/3/search/jql$")
+ISSUE_PATH = re.compile(r"^/rest/api/3/issue/(?P<key>[^/]+)$")
+WORKLOGS_PATH = re.compile(r"^/rest/api/3/issue/(?P<key>[^/]+)/worklog$")
+WORKLOG_PATH = re.compile(
+    r"^/rest/api/3/issue/(?P<key>[^/]+)/worklog/(?P<worklog_id>\d+)$"
+)
+# Issue keys that exist on the mock server; anything else is a 404
+ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+
+
+class MockJiraState:
+    """
+    Worklogs, fault injection settings and request counters of a server
+
+    Args:
+        latency: Seconds added to every response
+        jitter: Maximum random seconds added on top of ``latency``
+        error_rate: Fraction of requests answered with 500
+        rate_limit: Fraction of requests answered with 429
+        retry_after: Retry-After value sent with 429 responses, in seconds
+        seed: Seed for the fault injection random generator
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        rate_limit=0.0,
+        retry_after=1.0,
+        seed=None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.lock = threading.Lock()
+        self.random = random.Random(seed)
+        self.worklogs = {}  # worklog_id -> worklog dict
+        self.next_worklog_id = 10000
+        self.requests = 0
+        self.responses = {}  # status code -> count
+
+    def issue_id(self, key):
+        return str(zlib.crc32(key.encode("utf-8")) % 100000)
+
+    def user(self, email):
+        """Return the JIRA user for an email address"""
+        return {
+            "accountId": f"mock-{zlib.crc32(email.encode('utf-8')):08x}",
+            "emailAddress": email,
+            "displayName": email.split("@")[0],
+        }
+
+    def record(self, status):
+        with self.lock:
+            self.responses[status] = self.responses.get(status, 0) + 1
+
+    def stats(self):
+        """Return request counters and the number of stored worklogs"""
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "responses": {str(k): v for k, v in sorted(self.responses.items())},
+                "worklogs": len(self.worklogs),
+            }
+
+    def reset(self):
+        """Forget all worklogs and counters"""
+        with self.lock:
+            self.worklogs.clear()
+            self.requests = 0
+            self.responses.clear()
+
+    def injected_fault(self):
+        """Decide whether this request fails; returns a status code or None"""
+        with self.lock:
+            self.requests += 1
+            roll = self.random.random()
+        if roll < self.rate_limit:
+            return 429
+        if roll < self.rate_limit + self.error_rate:
+            return 500
+        return None
+
+    def create_worklog(self, key, body, base_url, author):
+        with self.lock:
+            worklog_id = str(self.next_worklog_id)
+            self.next_worklog_id += 1
+            now = datetime.now().astimezone().strftime("%Y-%m-%dT%H:%M:%S.000%z")
+            worklog = {
+                "self": f"{base_url}/rest/api/3/issue/{key}/worklog/{worklog_id}",
+                "id": worklog_id,
+                "issueId": self.issue_id(key),
+                "issueKey": key,
+                "author": author,
+                "comment": body.get("comment"),
+                "started": body.get("started"),
+                "timeSpentSeconds": int(body.get("timeSpentSeconds", 0)),
+                "created": now,
+                "updated": now,
+            }
+            self.worklogs[worklog_id] = worklog
+            return worklog
+
+
+class MockJiraHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockJira/1.0"
+    # Headers and body are written separately; without TCP_NODELAY every
+    # response would wait for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        """Keep request logging out of benchmark output"""
+
+    def send_json(self, status, body=None, headers=None):
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+        self.state.record(status)
+
+    def send_error_json(self, status, message, headers=None):
+        self.send_json(status, {"errorMessages": [message], "errors": {}}, headers)
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        return json.loads(self.rfile.read(length))
+
+    def handle_request(self, method):
+        # Always consume the body so keep-alive connections stay in sync
+        try:
+            body = self.read_json() if method in ("POST", "PUT") else {}
+        except ValueError:
+            self.send_error_json(400, "Invalid JSON body")
+            return
+
+        delay = self.state.latency
+        if self.state.jitter:
+            delay += self.state.random.uniform(0, self.state.jitter)
+        if delay:
+            time.sleep(delay)
+
+        author = self.authenticated_user()
+        if author is None:
+            self.send_error_json(401, "Authentication required")
+            return
+
+        fault = self.state.injected_fault()
+        if fault == 429:
+            self.send_error_json(
+                429,
+                "Rate limit exceeded",
+                {"Retry-After": f"{self.state.retry_after:g}"},
+            )
+            return
+        if fault == 500:
+            self.send_error_json(500, "Injected server error")
+            return
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if MYSELF_PATH.match(url.path):
+            self.send_json(200, author)
+            return
+        if SEARCH_PATH.match(url.path):
+            self.search(query, author)
+            return
+        for pattern, handler in (
+            (ISSUE_PATH, self.issue),
+            (WORKLOGS_PATH, self.worklogs),
+            (WORKLOG_PATH, self.worklog),
+        ):
+            match = pattern.match(url.path)
+            if match:
+                key = match.group("key")
+                if not ISSUE_KEY.match(key):
+                    self.send_error_json(404, "Issue does not exist")
+                    return
+                handler(method, body, query, author, **match.groupdict())
+                return
+        self.send_error_json(404, f"No route for {method} {url.path}")
+
+    def authenticated_user(self):
+        """Return the user of the Basic auth header, or None without one"""
+        scheme, _, credentials = self.headers.get("Authorization", "").partition(" ")
+        if scheme != "Basic":
+            return None
+        try:
+            email = base64.b64decode(credentials).decode("utf-8").partition(":")[0]
+        except ValueError:
+            return None
+        return self.state.user(email)
+
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def search(self, query, author):
+        """
+        Answer a JQL search with the issues the user logged work on
+
+        The JQL itself is not parsed; callers filter worklogs by author and
+        date themselves, as they must against JIRA too.
+        """
+        with self.state.lock:
+            keys = sorted(
+                {
+                    worklog["issueKey"]
+                    for worklog in self.state.worklogs.values()
+                    if worklog["author"]["accountId"] == author["accountId"]
+                }
+            )
+        start_at = int(query.get("nextPageToken", ["0"])[0])
+        max_results = int(query.get("maxResults", ["50"])[0])
+        page = keys[start_at : start_at + max_results]
+        next_start = start_at + len(page)
+        body = {
+            "issues": [{"id": self.state.issue_id(key), "key": key} for key in page],
+            "isLast": next_start >= len(keys),
+        }
+        if not body["isLast"]:
+            body["nextPageToken"] = str(next_start)
+        self.send_json(200, body)
+
+    def issue(self, method, body, query, author, key):
+        if method != "GET":
+            self.send_error_json(405, "Method not allowed")
+            return
+        self.send_json(
+            200,
+            {
+                "id": self.state.issue_id(key),
+                "key": key,
+                "self": f"{self.base_url()}/rest/api/3/issue/{key}",
+                "fields": {"summary": f"Mock issue {key}"},
+            },
+        )
+
+    def worklogs(self, method, body, query, author, key):
+        if method == "POST":
+            if "timeSpentSeconds" not in body or "started" not in body:
+                self.send_error_json(400, "timeSpentSeconds and started are required")
+                return
+            self.send_json(
+                201, self.state.create_worklog(key, body, self.base_url(), author)
+            )
+            return
+        if method != "GET":
+            self.send_error_json(405, "Method not allowed")
+            return
+
+        start_at = int(query.get("startAt", ["0"])[0])
+        max_results = int(query.get("maxResults", ["5000"])[0])
+        started_after = None
+        if "startedAfter" in query:
+            started_after = datetime.fromtimestamp(
+                int(query["startedAfter"][0]) / 1000, timezone.utc
+            )
+        with self.state.lock:
+            issue_worklogs = [
+                worklog
+                for worklog in self.state.worklogs.values()
+                if worklog["issueKey"] == key
+                and (
+                    started_after is None
+                    or datetime.strptime(worklog["started"], "%Y-%m-%dT%H:%M:%S.%f%z")
+                    >= started_after
+                )
+            ]
+        self.send_json(
+            200,
+            {
+                "startAt": start_at,
+                "maxResults": max_results,
+                "total": len(issue_worklogs),
+                "worklogs": issue_worklogs[start_at : start_at + max_results],
+            },
+        )
+
+    def worklog(self, method, body, query, author, key, worklog_id):
+        with self.state.lock:
+            worklog = self.state.worklogs.get(worklog_id)
+            if worklog is not None and worklog["issueKey"] != key:
+                worklog = None
+            if worklog is not None and method == "PUT":
+                for field in ("comment", "started", "timeSpentSeconds"):
+                    if field in body:
+                        worklog[field] = body[field]
+                worklog["updated"] = datetime.now().astimezone().strftime(
+                    "%Y-%m-%dT%H:%M:%S.000%z"
+                )
+            if worklog is not None and method == "DELETE":
+                del self.state.worklogs[worklog_id]
+
+        if worklog is None:
+            self.send_error_json(404, "Worklog does not exist")
+        elif method == "DELETE":
+            self.send_json(204)
+        elif method in ("GET", "PUT"):
+            self.send_json(200, worklog)
+        else:
+            self.send_error_json(405, "Method not allowed")
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def do_PUT(self):
+        self.handle_request("PUT")
+
+    def do_DELETE(self):
+        self.handle_request("DELETE")
+
+
+class MockJiraServer(ThreadingHTTPServer):
+    """
+    Threaded mock JIRA server; use as a context manager to run it in the
+    background
+
+    Args:
+        host: Interface to listen on
+        port: Port to listen on; 0 picks a free port
+        **settings: Fault injection settings passed to ``MockJiraState``
+    """
+
+    daemon_threads = True
+    # Allow as many queued connections as a large sync pool may open at once
+    request_queue_size = 128
+
+    def __init__(self, host="127.0.0.1", port=0, **settings):
+        super().__init__((host, port), MockJiraHandler)
+        self.state = MockJiraState(**settings)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve requests from a background thread"""
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="MockJiraServer", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a local mock JIRA server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Seconds added to each response"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Random extra seconds, at most"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction answered with 500"
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, default=0.0, help="Fraction answered with 429"
+    )
+    parser.add_argument(
+        "--retry-after", type=float, default=1.0, help="Retry-After sent with 429"
+    )
+    args = parser.parse_args(argv)
+
+    server = MockJiraServer(
+        args.host,
+        args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+    )
+    print(f"Mock JIRA listening on {server.url} (JIRA_DOMAIN={server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Stats: {json.dumps(server.state.stats())}")
+
+
+if __name__ == "__main__":
+    main()
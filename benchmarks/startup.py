@@ -0,0 +1,346 @@
+"""
+Startup benchmark for the TimeTracker app.
+
+Launches the app offscreen (``QT_QPA_PLATFORM=offscreen``) in fresh Python
+processes, records the per-phase timings collected by ``TimeTrackerApp`` and
+an ``-X importtime`` profile, and writes a JSON report that can be compared
+across commits.
+
+Usage (from the repository root):
+
+    python -m benchmarks.startup --runs 10 --output startup.json
+    python -m benchmarks.startup --compare startup.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import (
+    REPO_ROOT,
+    compare_summaries,
+    environment_info,
+    load_report,
+    print_comparison,
+    summarize,
+    write_report,
+)
+
+# Marker prefixing the JSON line the child process prints on success
+REPORT_MARKER = "STARTUP_REPORT "
+
+# Runs in the child process: starts the app, waits until deferred
+# initialization has finished and prints the collected timings
+CHILD_SCRIPT = """
+import json, sys, time
+
+started_wall = time.time()
+started = time.perf_counter()
+import main
+import_seconds = time.perf_counter() - started
+
+from PyQt6.QtCore import QTimer
+
+app = main.TimeTrackerApp()
+timer = QTimer()
+
+
+def check_ready():
+    if "deferred_init" in app.startup_timings:
+        app.app.quit()
+
+
+timer.timeout.connect(check_ready)
+timer.start(5)
+QTimer.singleShot(int(sys.argv[1]) * 1000, app.app.quit)
+exit_code = app.run()
+print(
+    "{marker}"
+    + json.dumps(
+        {{
+            "started_wall": started_wall,
+            "import_seconds": import_seconds,
+            "phases": app.startup_timings,
+            "exit_code": exit_code,
+        }}
+    ),
+    flush=True,
+)
+""".format(
+    marker=REPORT_MARKER
+)
+
+DUMMY_ENV = """JIRA_DOMAIN=benchmark.atlassian.net
+JIRA_EMAIL=benchmark@example.com
+JIRA_API_TOKEN=benchmark-token
+"""
+
+
+def prepare_workdir(path):
+    """
+    Populate a working directory the app can start from without prompting
+
+    The app reads ``.env``, ``tasks_new.json`` and ``static/`` relative to the
+    working directory and writes its logs there, so each benchmark gets its
+    own copy instead of touching the checkout.
+    """
+    with open(os.path.join(path, ".env"), "w", encoding="utf-8") as f:
+        f.write(DUMMY_ENV)
+    shutil.copy(os.path.join(REPO_ROOT, "tasks_new.json"), path)
+    shutil.copytree(os.path.join(REPO_ROOT, "static"), os.path.join(path, "static"))
+
+
+def child_env(workdir):
+    env = dict(os.environ)
+    env["QT_QPA_PLATFORM"] = "offscreen"
+    env["TIMETRACKER_DB_PATH"] = os.path.join(workdir, "timetracker.db")
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [REPO_ROOT, env.get("PYTHONPATH")])
+    )
+    return env
+
+
+def phase_durations(phases):
+    """
+    Convert cumulative phase end times into per-phase durations
+
+    Args:
+        phases: ``{phase: seconds since main.py was imported}``, in order
+
+    Returns:
+        dict: ``{phase: seconds spent in that phase}``
+    """
+    durations = {}
+    previous = 0.0
+    for phase, finished_at in sorted(phases.items(), key=lambda item: item[1]):
+        durations[phase] = finished_at - previous
+        previous = finished_at
+    return durations
+
+
+def run_once(workdir, timeout, extra_args=()):
+    """
+    Start the app once and return its timings
+
+    Returns:
+        tuple: (parsed child report or None, child stderr)
+    """
+    launched_wall = time.time()
+    launched = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, *extra_args, "-c", CHILD_SCRIPT, str(timeout)],
+        cwd=workdir,
+        env=child_env(workdir),
+        capture_output=True,
+        text=True,
+        timeout=timeout + 30,
+    )
+    process_seconds = time.perf_counter() - launched
+
+    for line in proc.stdout.splitlines():
+        if line.startswith(REPORT_MARKER):
+            report = json.loads(line[len(REPORT_MARKER) :])
+            break
+    else:
+        return None, proc.stderr
+
+    # Time from launching the interpreter until main.py started importing
+    interpreter = report["started_wall"] - launched_wall
+    offset = interpreter + report["import_seconds"]
+    report["interpreter_seconds"] = interpreter
+    report["process_seconds"] = process_seconds
+    report["since_launch"] = {
+        phase: offset + seconds for phase, seconds in report["phases"].items()
+    }
+    return report, proc.stderr
+
+
+def parse_importtime(stderr, top=30):
+    """
+    Parse ``-X importtime`` output
+
+    Args:
+        stderr: Captured stderr of a process run with ``-X importtime``
+        top: Number of modules to keep in each ranking
+
+    Returns:
+        dict: Total import time, the cumulative time of ``main`` and the
+        modules with the largest self and cumulative times (microseconds)
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        except ValueError:
+            continue
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append(
+            {
+                "module": name.strip(),
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": depth,
+            }
+        )
+
+    top_level = [module for module in modules if module["depth"] == 0]
+    main_module = next((m for m in top_level if m["module"] == "main"), None)
+    return {
+        "module_count": len(modules),
+        "total_us": sum(module["self_us"] for module in modules),
+        "main_cumulative_us": main_module["cumulative_us"] if main_module else None,
+        "top_self": sorted(modules, key=lambda m: m["self_us"], reverse=True)[:top],
+        "top_level": sorted(
+            top_level, key=lambda m: m["cumulative_us"], reverse=True
+        )[:top],
+    }
+
+
+def run_benchmark(runs, warmup, timeout, fresh_db):
+    """
+    Run the startup benchmark
+
+    Args:
+        runs: Number of measured launches
+        warmup: Launches to discard first (to warm the OS file cache)
+        timeout: Seconds to wait for one launch to finish initializing
+        fresh_db: Start every launch with an empty database
+
+    Returns:
+        dict: The benchmark report
+    """
+    samples = []
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="timetracker-startup-") as workdir:
+        prepare_workdir(workdir)
+
+        for index in range(warmup + runs):
+            if fresh_db:
+                for suffix in ("", "-wal", "-shm"):
+                    db_file = os.path.join(workdir, "timetracker.db" + suffix)
+                    if os.path.exists(db_file):
+                        os.remove(db_file)
+
+            report, stderr = run_once(workdir, timeout)
+            if report is None or report["exit_code"] != 0:
+                failures.append(stderr[-2000:])
+                print(f"Run {index + 1} failed", file=sys.stderr)
+                continue
+            if index >= warmup:
+                samples.append(report)
+                since_launch = report["since_launch"]
+                print(
+                    f"Run {index + 1 - warmup}/{runs}: first paint after "
+                    f"{since_launch['first_paint'] * 1000:.1f} ms, ready after "
+                    f"{since_launch['deferred_init'] * 1000:.1f} ms",
+                    file=sys.stderr,
+                )
+
+        _, importtime_stderr = run_once(
+            workdir, timeout, extra_args=("-X", "importtime")
+        )
+
+    phase_names = []
+    for sample in samples:
+        for phase in sample["phases"]:
+            if phase not in phase_names:
+                phase_names.append(phase)
+
+    def collect(getter):
+        return [getter(sample) for sample in samples]
+
+    summary = {
+        "interpreter": summarize(collect(lambda s: s["interpreter_seconds"])),
+        "import_main": summarize(collect(lambda s: s["import_seconds"])),
+        "time_to_first_paint": summarize(
+            collect(lambda s: s["since_launch"].get("first_paint", 0.0))
+        ),
+        "time_to_ready": summarize(
+            collect(lambda s: s["since_launch"].get("deferred_init", 0.0))
+        ),
+        "process_total": summarize(collect(lambda s: s["process_seconds"])),
+    }
+    phases = {
+        phase: summarize(
+            [
+                phase_durations(sample["phases"])[phase]
+                for sample in samples
+                if phase in sample["phases"]
+            ]
+        )
+        for phase in phase_names
+    }
+
+    return {
+        "benchmark": "startup",
+        "environment": environment_info(),
+        "config": {
+            "runs": runs,
+            "warmup": warmup,
+            "fresh_db": fresh_db,
+            "qt_platform": "offscreen",
+        },
+        "units": "seconds",
+        "summary": summary,
+        "phases": phases,
+        "importtime": parse_importtime(importtime_stderr),
+        "samples": samples,
+        "failures": failures,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark TimeTracker startup")
+    parser.add_argument("--runs", type=int, default=5, help="Measured launches")
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="Launches discarded before measuring"
+    )
+    parser.add_argument(
+        "--timeout", type=int, default=30, help="Seconds allowed per launch"
+    )
+    parser.add_argument(
+        "--fresh-db",
+        action="store_true",
+        help="Delete the database before every launch (measures first start)",
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument(
+        "--compare", help="Baseline report to compare the median timings against"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        help="Exit with status 1 if a median regresses by more than this percent",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.runs, args.warmup, args.timeout, args.fresh_db)
+    write_report(report, args.output)
+
+    if not report["samples"]:
+        print("No successful launches", file=sys.stderr)
+        return 1
+
+    if args.compare:
+        baseline = load_report(args.compare)
+        rows = compare_summaries(
+            {**baseline["summary"], **baseline["phases"]},
+            {**report["summary"], **report["phases"]},
+        )
+        print_comparison(rows)
+        if args.max_regression is not None and any(
+            change > args.max_regression for _, _, _, change in rows
+        ):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,415 @@
+"""
+Storage benchmark for the alchemy.py CRUD and query paths.
+
+Synthesizes SQLite databases of 10k, 100k and 1M tasks (one segment per task,
+``--tasks-per-day`` tasks per day going back from ``--end-date``), times each
+database operation and the MainWindow load path, and writes p50/p95 timings
+as JSON. Generated databases are kept in ``--data-dir`` and reused by later
+runs with the same parameters.
+
+Usage (from the repository root):
+
+    python -m benchmarks.storage --output storage.json
+    python -m benchmarks.storage --sizes 10000 100000 --compare storage.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from benchmarks.common import (
+    REPO_ROOT,
+    compare_summaries,
+    environment_info,
+    load_report,
+    print_comparison,
+    summarize,
+    write_report,
+)
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+JIRA_KEYS = [f"WPM-{number}" for number in range(100, 150)]
+# Bumped whenever the generated data changes so cached databases are rebuilt
+DATA_VERSION = 2
+
+
+def load_task_names():
+    """Use the sample task names so the data resembles real usage"""
+    try:
+        with open(os.path.join(REPO_ROOT, "tasks_new.json"), encoding="utf-8") as f:
+            names = [str(name) for name in json.load(f)["tasks"]]
+    except (OSError, KeyError, TypeError, ValueError):
+        names = []
+    return names or ["Code", "Code Review", "Meeting", "Testing", "Documentation"]
+
+
+def database_path(data_dir, task_count, tasks_per_day, end_date):
+    name = (
+        f"tasks-v{DATA_VERSION}-{task_count}-{tasks_per_day}-"
+        f"{end_date.isoformat()}.db"
+    )
+    return os.path.join(data_dir, name)
+
+
+def date_range(task_count, tasks_per_day, end_date):
+    """Return the first and last day covered by a synthesized database"""
+    days = -(-task_count // tasks_per_day)
+    return end_date - timedelta(days=days - 1), end_date
+
+
+def build_database(path, task_count, tasks_per_day, end_date, batch_size=20_000):
+    """
+    Create a database with ``task_count`` synthetic tasks
+
+    Rows are inserted with Core executemany in large batches; the data goes
+    through the same schema (``init_db``) as the app so all indexes exist.
+    The database is built under a temporary name and only moved to ``path``
+    once complete, so an interrupted build is never reused.
+
+    Args:
+        path: Database file to create
+        task_count: Number of tasks
+        tasks_per_day: Tasks created per day, newest day being ``end_date``
+        end_date: Last day with tasks
+        batch_size: Rows per executemany call
+
+    Returns:
+        float: Seconds spent building the database
+    """
+    import alchemy
+    from sqlalchemy import insert
+
+    started = time.perf_counter()
+    partial_path = path + ".partial"
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(partial_path + suffix):
+            os.remove(partial_path + suffix)
+    alchemy.configure_engine(partial_path)
+    alchemy.init_db()
+
+    rng = random.Random(task_count)
+    task_names = load_task_names()
+    first_day, _ = date_range(task_count, tasks_per_day, end_date)
+    # Each day mostly revolves around a handful of tickets and activities,
+    # like real usage; the rest of the tasks are picked at random
+    working_set = []
+    # Spread a day's tasks over a nine hour working day
+    spacing = timedelta(minutes=540 / tasks_per_day)
+    synced_before = end_date - timedelta(days=7)
+
+    task_id = 0
+    with alchemy.engine.begin() as connection:
+        while task_id < task_count:
+            tasks, segments = [], []
+            for _ in range(min(batch_size, task_count - task_id)):
+                task_id += 1
+                index = task_id - 1
+                day = first_day + timedelta(days=index // tasks_per_day)
+                if index % tasks_per_day == 0:
+                    working_set = [
+                        (rng.choice(JIRA_KEYS), rng.choice(task_names))
+                        for _ in range(5)
+                    ]
+                start = datetime.combine(day, datetime.min.time()) + timedelta(
+                    hours=9
+                )
+                start += spacing * (index % tasks_per_day)
+                hours = rng.uniform(0.05, spacing.total_seconds() / 3600)
+                end = start + timedelta(hours=hours)
+                if rng.random() < 0.85:
+                    jira_key, task_name = rng.choice(working_set)
+                else:
+                    jira_key, task_name = None, rng.choice(task_names)
+                synced = int(jira_key is not None and day < synced_before)
+                tasks.append(
+                    {
+                        "task_id": task_id,
+                        "task_name": task_name,
+                        "start_time": start.isoformat(),
+                        "end_time": end.isoformat(),
+                        "duration": hours,
+                        "jira_key": jira_key,
+                        "created_date": start.isoformat(),
+                        "created_at": start,
+                        "synced": synced,
+                        "worklog_id": 10_000 + task_id if synced else None,
+                    }
+                )
+                segments.append(
+                    {"task_id": task_id, "start_time": start, "end_time": end}
+                )
+            connection.execute(insert(alchemy.Task), tasks)
+            connection.execute(insert(alchemy.TaskSegment), segments)
+
+    alchemy.rebuild_daily_rollups()
+    with alchemy.engine.connect() as connection:
+        connection.exec_driver_sql("ANALYZE")
+        connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    alchemy.engine.dispose()
+    os.replace(partial_path, path)
+    return time.perf_counter() - started
+
+
+def time_calls(function, iterations):
+    """
+    Call ``function(i)`` for each iteration and return the durations in ms
+    """
+    durations = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        function(i)
+        durations.append((time.perf_counter() - started) * 1000)
+    return durations
+
+
+def benchmark_operations(task_count, first_day, last_day, iterations, seed):
+    """
+    Time the alchemy.py operations against the currently configured database
+
+    Tasks created by the benchmark are deleted again by the ``delete_tasks``
+    step, so a cached database keeps its size across runs.
+
+    Returns:
+        dict: ``{operation: summary of durations in milliseconds}``
+    """
+    import alchemy
+    import reporting
+
+    rng = random.Random(seed)
+    span = (last_day - first_day).days
+    created = []
+
+    def random_task_id(_):
+        return rng.randint(1, task_count)
+
+    def random_day():
+        return first_day + timedelta(days=rng.randint(0, span))
+
+    def month_of(day):
+        start = day.replace(day=1)
+        return start, (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+    def create(i):
+        created.append(alchemy.create_task(f"Benchmark {i}", jira_key="WPM-1"))
+
+    operations = {
+        "create_task": create,
+        "start_segment": lambda i: alchemy.start_segment(created[i]),
+        "end_segment": lambda i: alchemy.end_segment(created[i]),
+        "update_task": lambda i: alchemy.update_task(
+            random_task_id(i), notes=f"benchmark {i}"
+        ),
+        "get_task": lambda i: alchemy.get_task(random_task_id(i)),
+        "get_tasks_for_date": lambda i: alchemy.get_tasks_for_date(random_day()),
+        "get_tasks_for_range_month_page": lambda i: alchemy.get_tasks_for_range(
+            *month_of(random_day()), limit=500
+        ),
+        "get_total_duration_for_range_month": (
+            lambda i: alchemy.get_total_duration_for_range(*month_of(random_day()))
+        ),
+        "delete_tasks": lambda i: alchemy.delete_tasks([created[i]]),
+        "report_year_by_jira_key": lambda i: reporting.get_totals(
+            last_day - timedelta(days=364), last_day, group_by=("jira_key",)
+        ),
+        "report_all_by_week": lambda i: reporting.get_totals(
+            first_day, last_day, group_by=(), period="week"
+        ),
+    }
+    return {
+        name: summarize(time_calls(function, iterations))
+        for name, function in operations.items()
+    }
+
+
+def benchmark_main_window(first_day, last_day, iterations, seed):
+    """
+    Time opening the main window and loading a day and a month into it
+
+    Returns:
+        dict: ``{step: summary of durations in milliseconds}``
+    """
+    from PyQt6.QtCore import QDate
+    from PyQt6.QtWidgets import QApplication
+
+    from gui.main_window import MainWindow
+
+    app = QApplication.instance() or QApplication([])
+    rng = random.Random(seed)
+    span = (last_day - first_day).days
+
+    def open_window(_):
+        window = MainWindow()
+        window.show()
+        app.processEvents()
+        window.is_quitting = True
+        window.close()
+        window.deleteLater()
+
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+
+    def load(range_name):
+        def run(_):
+            day = first_day + timedelta(days=rng.randint(0, span))
+            window.range_selector.setCurrentText(range_name)
+            window.date_selector.setDate(QDate(day.year, day.month, day.day))
+            window.load_tasks_for_date()
+            app.processEvents()
+
+        return run
+
+    results = {
+        "main_window_open": summarize(time_calls(open_window, min(iterations, 10))),
+        "main_window_load_day": summarize(time_calls(load("Day"), iterations)),
+        "main_window_load_month": summarize(time_calls(load("Month"), iterations)),
+    }
+    window.is_quitting = True
+    window.close()
+    return results
+
+
+def run_benchmark(sizes, tasks_per_day, end_date, iterations, data_dir, gui, seed):
+    """
+    Build (or reuse) a database per size and benchmark it
+
+    Returns:
+        dict: The benchmark report
+    """
+    import alchemy
+
+    results = {}
+    for task_count in sizes:
+        path = database_path(data_dir, task_count, tasks_per_day, end_date)
+        build_seconds = None
+        if not os.path.exists(path):
+            print(f"Building database with {task_count} tasks...", file=sys.stderr)
+            build_seconds = build_database(path, task_count, tasks_per_day, end_date)
+        alchemy.configure_engine(path)
+        alchemy.init_db()
+
+        first_day, last_day = date_range(task_count, tasks_per_day, end_date)
+        print(f"Benchmarking {task_count} tasks...", file=sys.stderr)
+        operations = benchmark_operations(
+            task_count, first_day, last_day, iterations, seed
+        )
+        if gui:
+            operations.update(
+                benchmark_main_window(first_day, last_day, iterations, seed)
+            )
+        alchemy.engine.dispose()
+
+        results[str(task_count)] = {
+            "database": path,
+            "database_bytes": os.path.getsize(path),
+            "build_seconds": build_seconds,
+            "first_day": first_day.isoformat(),
+            "last_day": last_day.isoformat(),
+            "operations": operations,
+        }
+
+    return {
+        "benchmark": "storage",
+        "environment": environment_info(),
+        "config": {
+            "sizes": list(sizes),
+            "tasks_per_day": tasks_per_day,
+            "end_date": end_date.isoformat(),
+            "iterations": iterations,
+            "seed": seed,
+            "gui": gui,
+        },
+        "units": "milliseconds",
+        "results": results,
+    }
+
+
+def flatten_results(report):
+    """Map ``"<size>/<operation>"`` to each operation summary of a report"""
+    return {
+        f"{size}/{operation}": summary
+        for size, result in report["results"].items()
+        for operation, summary in result["operations"].items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the database layer")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="Numbers of tasks to benchmark against",
+    )
+    parser.add_argument("--tasks-per-day", type=int, default=20)
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        default=date(2025, 12, 31),
+        help="Last day with tasks (YYYY-MM-DD)",
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=200, help="Timed calls per operation"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--data-dir",
+        default=os.path.join(tempfile.gettempdir(), "timetracker-benchmarks"),
+        help="Where generated databases are kept between runs",
+    )
+    parser.add_argument(
+        "--no-gui", action="store_true", help="Skip the MainWindow benchmarks"
+    )
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument(
+        "--compare", help="Baseline report to compare the median timings against"
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        help="Exit with status 1 if a median regresses by more than this percent",
+    )
+    args = parser.parse_args(argv)
+
+    output = os.path.abspath(args.output) if args.output else None
+    compare = os.path.abspath(args.compare) if args.compare else None
+    data_dir = os.path.abspath(args.data_dir)
+    os.makedirs(data_dir, exist_ok=True)
+
+    # The app modules log to ./logs; keep that out of the checkout
+    os.chdir(data_dir)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+    report = run_benchmark(
+        args.sizes,
+        args.tasks_per_day,
+        args.end_date,
+        args.iterations,
+        data_dir,
+        not args.no_gui,
+        args.seed,
+    )
+    write_report(report, output)
+
+    if compare:
+        rows = compare_summaries(
+            flatten_results(load_report(compare)), flatten_results(report)
+        )
+        print_comparison(rows, scale=1)
+        if args.max_regression is not None and any(
+            change > args.max_regression for _, _, _, change in rows
+        ):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
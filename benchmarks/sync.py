@@ -0,0 +1,255 @@
+"""
+JIRA sync throughput benchmark.
+
+Starts the mock JIRA server from ``benchmarks/mock_jira.py``, fills a temporary
+database with tasks and drives ``jira_sync.sync_worklogs`` against the server
+at several concurrency levels. Reports worklogs per second and per-worklog
+latency (including retries after injected 429s) as JSON.
+
+Usage (from the repository root):
+
+    python -m benchmarks.sync --tasks 1000 --concurrency 1 4 8 16
+    python -m benchmarks.sync --latency 0.2 --rate-limit 0.05 --output sync.json
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import (
+    REPO_ROOT,
+    compare_summaries,
+    environment_info,
+    load_report,
+    print_comparison,
+    summarize,
+    write_report,
+)
+from benchmarks.mock_jira import MockJiraServer
+
+
+def create_tasks(task_count):
+    """
+    Insert unsynced tasks with JIRA keys into the configured database
+
+    Returns:
+        list: IDs of the inserted tasks
+    """
+    import alchemy
+    from sqlalchemy import insert, select
+
+    started = datetime.now().replace(microsecond=0) - timedelta(days=1)
+    tasks = []
+    for index in range(task_count):
+        start = started + timedelta(minutes=index)
+        tasks.append(
+            {
+                "task_name": f"Benchmark task {index}",
+                "start_time": start.isoformat(),
+                "end_time": (start + timedelta(minutes=30)).isoformat(),
+                "duration": 0.5,
+                "jira_key": f"BENCH-{index % 50 + 1}",
+                "created_date": start.isoformat(),
+                "created_at": start,
+                "synced": 0,
+            }
+        )
+    with alchemy.engine.begin() as connection:
+        connection.execute(insert(alchemy.Task), tasks)
+        return connection.execute(select(alchemy.Task.task_id)).scalars().all()
+
+
+def reset_tasks(task_ids):
+    """Mark the benchmark tasks as not synced again"""
+    import alchemy
+
+    alchemy.bulk_update_tasks(
+        [
+            {"task_id": task_id, "synced": 0, "worklog_id": None}
+            for task_id in task_ids
+        ]
+    )
+
+
+def write_env(server, concurrency):
+    """Point the app's .env at the mock server with a sync concurrency"""
+    with open(".env", "w", encoding="utf-8") as f:
+        f.write(
+            f"JIRA_DOMAIN={server.url}\n"
+            "JIRA_EMAIL=benchmark@example.com\n"
+            "JIRA_API_TOKEN=benchmark-token\n"
+            f"JIRA_SYNC_CONCURRENCY={concurrency}\n"
+        )
+
+
+def run_scenario(server, task_ids, concurrency, max_retries):
+    """
+    Sync every task once with ``JIRA_SYNC_CONCURRENCY`` set to ``concurrency``
+
+    Uses the app's shared client and lets ``sync_worklogs`` pick the worker
+    count, so levels above the client's connection pool size measure the
+    capped worker count the app would use.
+
+    Returns:
+        dict: Throughput, latency summary (ms) and server counters
+    """
+    from jira_client import get_jira_client, invalidate_jira_config
+    from jira_sync import sync_worklogs
+
+    reset_tasks(task_ids)
+    server.state.reset()
+    write_env(server, concurrency)
+    invalidate_jira_config()
+    client = get_jira_client()
+    client.max_retries = max_retries
+
+    # Time every worklog post, including waits for Retry-After windows
+    latencies = []
+    post_worklog = client.post_worklog
+
+    def timed_post_worklog(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return post_worklog(*args, **kwargs)
+        finally:
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    client.post_worklog = timed_post_worklog
+
+    started = time.perf_counter()
+    result = sync_worklogs(task_ids)
+    elapsed = time.perf_counter() - started
+    del client.post_worklog  # Back to the class method for the next scenario
+
+    return {
+        "concurrency": concurrency,
+        "workers": min(concurrency, client.pool_size),
+        "elapsed_seconds": elapsed,
+        "synced": len(result.synced),
+        "failed": len(result.failed),
+        "worklogs_per_second": len(result.synced) / elapsed if elapsed else 0.0,
+        "latency_ms": summarize(latencies),
+        "server": server.state.stats(),
+    }
+
+
+def run_benchmark(task_count, concurrency_levels, server_settings, max_retries):
+    """
+    Run the sync benchmark against a freshly started mock server
+
+    Returns:
+        dict: The benchmark report
+    """
+    import alchemy
+    from jira_client import get_jira_client
+
+    scenarios = {}
+    with MockJiraServer(**server_settings) as server:
+        alchemy.configure_engine(os.path.abspath("benchmark.db"))
+        alchemy.init_db()
+        task_ids = create_tasks(task_count)
+
+        for concurrency in concurrency_levels:
+            print(f"Syncing {task_count} worklogs at concurrency {concurrency}...")
+            scenario = run_scenario(server, task_ids, concurrency, max_retries)
+            scenarios[f"concurrency_{concurrency}"] = scenario
+            print(
+                f"  {scenario['workers']} workers, "
+                f"{scenario['worklogs_per_second']:.1f} worklogs/s, "
+                f"p50 {scenario['latency_ms']['p50']:.1f} ms, "
+                f"p99 {scenario['latency_ms']['p99']:.1f} ms, "
+                f"{scenario['failed']} failed"
+            )
+        get_jira_client().close()
+        alchemy.engine.dispose()
+
+    return {
+        "benchmark": "sync",
+        "environment": environment_info(),
+        "config": {
+            "tasks": task_count,
+            "concurrency": list(concurrency_levels),
+            "max_retries": max_retries,
+            "server": server_settings,
+        },
+        "scenarios": scenarios,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark JIRA worklog sync")
+    parser.add_argument("--tasks", type=int, default=500, help="Worklogs to sync")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 4, 8, 16],
+        help="Worker counts to benchmark",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="Server latency in seconds"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.02, help="Random extra latency, at most"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Fraction answered with 500"
+    )
+    parser.add_argument(
+        "--rate-limit", type=float, default=0.0, help="Fraction answered with 429"
+    )
+    parser.add_argument(
+        "--retry-after", type=float, default=0.2, help="Retry-After sent with 429"
+    )
+    parser.add_argument("--max-retries", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument(
+        "--compare", help="Baseline report to compare the median latencies against"
+    )
+    args = parser.parse_args(argv)
+
+    output = os.path.abspath(args.output) if args.output else None
+    compare = os.path.abspath(args.compare) if args.compare else None
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+    server_settings = {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "rate_limit": args.rate_limit,
+        "retry_after": args.retry_after,
+        "seed": args.seed,
+    }
+    # The client reads .env from, and the app modules log to, the working
+    # directory; keep both out of the checkout
+    with tempfile.TemporaryDirectory(prefix="timetracker-sync-") as workdir:
+        os.chdir(workdir)
+        report = run_benchmark(
+            args.tasks, args.concurrency, server_settings, args.max_retries
+        )
+        os.chdir(REPO_ROOT)
+    write_report(report, output)
+
+    if compare:
+        baseline = load_report(compare)
+        rows = compare_summaries(
+            {
+                name: scenario["latency_ms"]
+                for name, scenario in baseline["scenarios"].items()
+            },
+            {
+                name: scenario["latency_ms"]
+                for name, scenario in report["scenarios"].items()
+            },
+        )
+        print_comparison(rows, scale=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+import argparse
+import os
+import sys
+from datetime import date
+
+# Only the standard library is imported up front. When the app is running,
+# commands are sent to it over its control socket, so neither SQLAlchemy nor
+# PyQt6 is imported; otherwise the commands that need the database import it
+# themselves. Either way commands start quickly enough for shell prompts and
+# git hooks.
+
+
+def app_dir():
+    """Return the directory the app's .env and logs live in"""
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def running_task_id():
+    """Return the ID of the most recently started running task, or None"""
+    from alchemy import get_running_tasks
+
+    tasks = get_running_tasks()
+    return tasks[0].task_id if tasks else None
+
+
+def ensure_not_running():
+    task_id = running_task_id()
+    if task_id is not None:
+        raise ValueError(f"Task {task_id} is already running; pause or stop it")
+
+
+def local_start(task_name, jira_key=None):
+    from time_tracking import describe_task, start_task
+
+    ensure_not_running()
+    return describe_task(start_task(task_name, jira_key=jira_key))
+
+
+def local_pause():
+    from time_tracking import describe_task, pause_task
+
+    task_id = running_task_id()
+    if task_id is None:
+        raise ValueError("No task is running")
+    pause_task(task_id)
+    return describe_task(task_id)
+
+
+def local_resume(task_id=None):
+    from time_tracking import describe_task, resume_task
+
+    if task_id is None:
+        raise ValueError("Pass the ID of the paused task to resume")
+    ensure_not_running()
+    task = describe_task(task_id)
+    resume_task(task_id)
+    return task
+
+
+def local_stop(task_id=None):
+    from time_tracking import describe_task, stop_task
+
+    if task_id is None:
+        task_id = running_task_id()
+        if task_id is None:
+            raise ValueError("No task is running; pass the ID of a paused task")
+    stop_task(task_id)
+    task = describe_task(task_id)
+    # stop_task queues the worklog of tasks with a JIRA key
+    task["queued"] = bool(task["jira_key"])
+    return task
+
+
+def local_status():
+    from time_tracking import get_status
+
+    return get_status()
+
+
+def local_sync(since=None):
+    from alchemy import get_queued_task_ids, remove_outbox_entries
+    from jira_sync import sync_worklogs
+
+    task_ids = get_queued_task_ids(since or date.today())
+    if not task_ids:
+        return {"synced": 0, "failed": {}}
+    result = sync_worklogs(task_ids)
+    # Failed worklogs stay queued for the app's outbox drainer to retry
+    remove_outbox_entries(list(result.synced) + result.skipped)
+    return {
+        "synced": len(result.synced),
+        "failed": {str(task_id): error for task_id, error in result.failed.items()},
+    }
+
+
+LOCAL_COMMANDS = {
+    "start": local_start,
+    "pause": local_pause,
+    "resume": local_resume,
+    "stop": local_stop,
+    "status": local_status,
+    "sync": local_sync,
+}
+
+
+def run_command(command, local_params=None, **params):
+    """
+    Run a command in the running app, or directly on the database if the app
+    is not running
+
+    Args:
+        command: Command name, see ``control.COMMANDS``
+        local_params: Extra arguments only used when running locally
+        **params: Command arguments
+
+    Returns:
+        dict: The command's result
+    """
+    from control import ControlUnavailable, send_command
+
+    try:
+        return send_command(command, **params)
+    except ControlUnavailable:
+        pass
+
+    from alchemy import init_db
+
+    init_db()
+    return LOCAL_COMMANDS[command](**params, **(local_params or {}))
+
+
+def format_hours(hours):
+    from utils import format_duration
+
+    return format_duration(hours or 0)
+
+
+def describe(task):
+    key = f" ({task['jira_key']})" if task["jira_key"] else ""
+    return f"task {task['task_id']} '{task['task_name']}'{key}"
+
+
+def cmd_start(args):
+    task = run_command("start", task_name=args.task_name, jira_key=args.jira_key)
+    print(f"Started {describe(task)}")
+
+
+def cmd_pause(args):
+    task = run_command("pause")
+    print(
+        f"Paused {describe(task)} at {format_hours(task['duration'])}; "
+        f"continue it with 'resume {task['task_id']}'"
+    )
+
+
+def cmd_resume(args):
+    task = run_command("resume", task_id=args.task_id)
+    print(f"Resumed {describe(task)}")
+
+
+def cmd_stop(args):
+    task = run_command("stop", task_id=args.task_id)
+    queued = " and queued its worklog for JIRA" if task.get("queued") else ""
+    print(f"Stopped {describe(task)} at {format_hours(task['duration'])}{queued}")
+
+
+def cmd_status(args):
+    status = run_command("status")
+    task = status["task"]
+    if task is None:
+        print("No task is running")
+    else:
+        state = "Running" if task["running"] else "Paused"
+        print(f"{state}: {describe(task)}, {format_hours(task['elapsed'])}")
+    print(f"Today: {format_hours(status['today'])}")
+    if status["queued"]:
+        print(f"Worklogs waiting to be synced: {status['queued']}")
+
+
+def cmd_sync(args):
+    result = run_command("sync", local_params={"since": args.since})
+    if result.get("background"):
+        # The running app posts its outbox itself
+        print(f"Asked the app to sync {result['queued']} queued worklogs")
+        return 0
+    print(f"Synced {result['synced']} worklogs, {len(result['failed'])} failed")
+    for task_id, error in result["failed"].items():
+        print(f"  task {task_id}: {error}", file=sys.stderr)
+    return 1 if result["failed"] else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Track time from the terminal, sharing the app's database"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    start_parser = subparsers.add_parser("start", help="Start a new task")
+    start_parser.add_argument("task_name")
+    start_parser.add_argument("jira_key", nargs="?")
+    start_parser.set_defaults(handler=cmd_start)
+
+    pause_parser = subparsers.add_parser("pause", help="Pause the running task")
+    pause_parser.set_defaults(handler=cmd_pause)
+
+    resume_parser = subparsers.add_parser(
+        "resume", help="Resume a paused task; the ID is optional with the app open"
+    )
+    resume_parser.add_argument("task_id", type=int, nargs="?")
+    resume_parser.set_defaults(handler=cmd_resume)
+
+    stop_parser = subparsers.add_parser(
+        "stop", help="Stop the running task, or a paused one by ID"
+    )
+    stop_parser.add_argument("task_id", type=int, nargs="?")
+    stop_parser.set_defaults(handler=cmd_stop)
+
+    status_parser = subparsers.add_parser(
+        "status", help="Show the current task and today's total"
+    )
+    status_parser.set_defaults(handler=cmd_status)
+
+    sync_parser = subparsers.add_parser(
+        "sync", help="Post the queued worklogs of stopped tasks to JIRA now"
+    )
+    sync_parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        default=date.today(),
+        help="YYYY-MM-DD, defaults to today; ignored while the app is running",
+    )
+    sync_parser.set_defaults(handler=cmd_sync)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    # Use the same .env, logs and database as the app, wherever the command is
+    # run from
+    db_path = os.environ.get("TIMETRACKER_DB_PATH")
+    if db_path:
+        os.environ["TIMETRACKER_DB_PATH"] = os.path.abspath(os.path.expanduser(db_path))
+    os.chdir(app_dir())
+    from logging_setup import get_logger
+
+    logger = get_logger(__name__)
+    try:
+        return args.handler(args) or 0
+    except Exception as e:
+        logger.error(f"Error running '{args.command}': {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
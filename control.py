@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import socket
+import sys
+import tempfile
+
+from utils import default_db_path
+
+# Commands the running app accepts over its control socket (see
+# control_server.py). Each request is one JSON object per line, e.g.
+#   {"command": "start", "task_name": "Code", "jira_key": "WPM-1"}
+# and each response is one JSON object per line, either
+#   {"ok": true, "result": {...}} or {"ok": false, "error": "..."}
+COMMANDS = ("start", "pause", "resume", "stop", "status", "sync", "activate")
+
+# Seconds to wait for the running app to answer
+DEFAULT_TIMEOUT = 5.0
+
+
+class ControlUnavailable(Exception):
+    """Raised when no running app is listening on the control socket"""
+
+
+class ControlError(Exception):
+    """Raised when the running app rejects a command"""
+
+
+def instance_id(db_path=None):
+    """
+    Return the name identifying the app instance of a database
+
+    Each database gets its own instance, so apps using different databases
+    (e.g. through TIMETRACKER_DB_PATH) do not talk to or block each other.
+    """
+    db_path = os.path.normcase(db_path or default_db_path())
+    digest = hashlib.sha1(db_path.encode("utf-8")).hexdigest()[:12]
+    return f"timetracker-{digest}"
+
+
+def runtime_dir():
+    """Return the directory for the user's sockets and lock files"""
+    return os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+
+
+def control_name(db_path=None):
+    """
+    Return the control server name for a database
+
+    On Windows this is a named pipe name; elsewhere it is the path of a Unix
+    domain socket in the user's runtime directory.
+    """
+    name = instance_id(db_path)
+    if sys.platform == "win32":
+        return name
+    return os.path.join(runtime_dir(), f"{name}.sock")
+
+
+def send_command(command, timeout=DEFAULT_TIMEOUT, db_path=None, **params):
+    """
+    Send a command to the running app and return its result
+
+    Args:
+        command: One of ``COMMANDS``
+        timeout: Seconds to wait for the connection and the response
+        db_path: Database whose app to contact. Defaults to the configured one
+        **params: Command arguments, e.g. ``task_name`` and ``jira_key``
+
+    Returns:
+        dict: The command's result
+
+    Raises:
+        ControlUnavailable: If no app is running for the database
+        ControlError: If the app could not run the command
+    """
+    request = json.dumps({"command": command, **params}).encode("utf-8") + b"\n"
+    name = control_name(db_path)
+
+    if sys.platform == "win32":
+        try:
+            pipe = open(rf"\\.\pipe\{name}", "r+b", buffering=0)
+        except OSError as e:
+            raise ControlUnavailable(str(e)) from None
+        with pipe:
+            pipe.write(request)
+            response = pipe.readline()
+    else:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        try:
+            connection.connect(name)
+        except OSError as e:
+            connection.close()
+            raise ControlUnavailable(str(e)) from None
+        with connection, connection.makefile("rwb") as stream:
+            stream.write(request)
+            stream.flush()
+            response = stream.readline()
+
+    if not response:
+        raise ControlUnavailable("The app closed the connection")
+    response = json.loads(response)
+    if not response.get("ok"):
+        raise ControlError(response.get("error", "Unknown error"))
+    return response.get("result", {})
@@ -0,0 +1,94 @@
+import json
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtNetwork import QLocalServer
+
+from control import COMMANDS, control_name
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+class ControlServer(QObject):
+    """
+    Local socket server letting the CLI, scripts and editor plugins drive the
+    running app.
+
+    Listens on ``control.control_name()`` (a Unix domain socket, or a named
+    pipe on Windows) that only the current user can open. Requests are read
+    on the Qt event loop, so handlers run on the GUI thread and can update
+    the widget directly. Clients may keep a connection open and send several
+    requests, one JSON object per line; see ``control.py`` for the protocol.
+    """
+
+    def __init__(self, parent=None, name=None):
+        super().__init__(parent)
+        self.name = name or control_name()
+        self.handlers = {}  # command -> callable(**params) returning a dict
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self.accept_connections)
+
+    def register(self, command, handler):
+        """Handle ``command`` with ``handler(**params)``, which returns a dict
+        and raises to reject the command"""
+        self.handlers[command] = handler
+
+    def start(self):
+        """Start listening; returns False if the server could not be started"""
+        # A socket file left behind by a crashed instance blocks listen().
+        # main() holds the instance lock (see single_instance.py), so the
+        # socket can only belong to a process that is gone
+        QLocalServer.removeServer(self.name)
+        if not self.server.listen(self.name):
+            logger.error(
+                f"Could not start control server on {self.name}: "
+                f"{self.server.errorString()}"
+            )
+            return False
+        logger.info(f"Control server listening on {self.server.fullServerName()}")
+        return True
+
+    def stop(self):
+        self.server.close()
+
+    def accept_connections(self):
+        while self.server.hasPendingConnections():
+            connection = self.server.nextPendingConnection()
+            connection.readyRead.connect(
+                lambda connection=connection: self.read_requests(connection)
+            )
+            connection.disconnected.connect(connection.deleteLater)
+            # Data may have arrived before readyRead was connected
+            if connection.bytesAvailable():
+                self.read_requests(connection)
+
+    def read_requests(self, connection):
+        while connection.canReadLine():
+            line = bytes(connection.readLine()).strip()
+            if not line:
+                continue
+            response = self.handle_request(line)
+            connection.write(json.dumps(response).encode("utf-8") + b"\n")
+            connection.flush()
+
+    def handle_request(self, line):
+        """Run one request line and return the response dict"""
+        try:
+            request = json.loads(line)
+            command = request.pop("command")
+        except (ValueError, KeyError, AttributeError, TypeError):
+            return {"ok": False, "error": "Requests must be JSON with a command"}
+
+        handler = self.handlers.get(command)
+        if handler is None and command in COMMANDS:
+            # Registered once the app has finished initializing
+            return {"ok": False, "error": "The app is still starting; try again"}
+        if handler is None:
+            return {"ok": False, "error": f"Unknown command: {command}"}
+
+        try:
+            return {"ok": True, "result": handler(**request)}
+        except Exception as e:
+            logger.error(f"Error handling control command {command}: {e}")
+            return {"ok": False, "error": str(e)}
@@ -0,0 +1,229 @@
+import argparse
+import csv
+import json
+import os
+import time
+from datetime import date
+
+from sqlalchemy import select
+
+from alchemy import Session, Task, day_bounds, init_db
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Task columns written to every export, in order
+EXPORT_COLUMNS = [
+    "task_id",
+    "task_name",
+    "jira_key",
+    "start_time",
+    "end_time",
+    "duration",
+    "created_date",
+    "created_at",
+    "synced",
+    "worklog_id",
+    "notes",
+]
+CREATED_AT = EXPORT_COLUMNS.index("created_at")
+
+# Rows fetched from the database cursor per batch
+DEFAULT_BATCH_SIZE = 2000
+
+
+def iter_task_batches(start_date, end_date, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Yield the tasks created between two dates (both inclusive) in batches
+
+    Rows are streamed from the database cursor with ``yield_per`` and only
+    the export columns are selected, so memory use depends on ``batch_size``
+    rather than on the size of the range. Tasks are ordered oldest first.
+
+    Args:
+        start_date: First date of the range
+        end_date: Last date of the range
+        batch_size: Rows per batch
+
+    Yields:
+        list: Up to ``batch_size`` rows, tuples in ``EXPORT_COLUMNS`` order
+    """
+    start, _ = day_bounds(start_date)
+    _, end = day_bounds(end_date)
+    statement = (
+        select(*[getattr(Task, column) for column in EXPORT_COLUMNS])
+        .where(Task.created_at >= start, Task.created_at < end)
+        .order_by(Task.created_at, Task.task_id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    session = Session()
+    try:
+        for partition in session.execute(statement).partitions():
+            yield partition
+    except Exception as e:
+        logger.error(f"Error reading tasks for {start_date} - {end_date}: {e}")
+        raise
+    finally:
+        session.close()
+
+
+def text_rows(batch):
+    """Yield rows as lists with ``created_at`` in ISO 8601, for text formats"""
+    for row in batch:
+        row = list(row)
+        if row[CREATED_AT] is not None:
+            row[CREATED_AT] = row[CREATED_AT].isoformat()
+        yield row
+
+
+def write_csv(batches, path):
+    """Write batches of task rows to a CSV file with a header row"""
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_COLUMNS)
+        for batch in batches:
+            writer.writerows(text_rows(batch))
+            count += len(batch)
+    return count
+
+
+def write_jsonl(batches, path):
+    """Write batches of task rows to a JSON Lines file, one task per line"""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for batch in batches:
+            f.writelines(
+                json.dumps(dict(zip(EXPORT_COLUMNS, row))) + "\n"
+                for row in text_rows(batch)
+            )
+            count += len(batch)
+    return count
+
+
+def write_parquet(batches, path):
+    """
+    Write batches of task rows to a Parquet file, one row group per batch
+
+    Requires the optional ``pyarrow`` package.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError(
+            "Parquet export needs pyarrow; install it with 'pip install pyarrow'"
+        ) from None
+
+    schema = pa.schema(
+        [
+            ("task_id", pa.int64()),
+            ("task_name", pa.string()),
+            ("jira_key", pa.string()),
+            ("start_time", pa.string()),
+            ("end_time", pa.string()),
+            ("duration", pa.float64()),
+            ("created_date", pa.string()),
+            ("created_at", pa.timestamp("us")),
+            ("synced", pa.int64()),
+            ("worklog_id", pa.int64()),
+            ("notes", pa.string()),
+        ]
+    )
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in batches:
+            arrays = [
+                pa.array(values, field.type)
+                for values, field in zip(zip(*batch), schema)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            count += len(batch)
+    return count
+
+
+FORMATS = {
+    "csv": write_csv,
+    "jsonl": write_jsonl,
+    "parquet": write_parquet,
+}
+
+
+def format_for_path(path):
+    """Return the export format matching a file extension, e.g. "csv" """
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "json":
+        extension = "jsonl"
+    if extension not in FORMATS:
+        raise ValueError(
+            f"Cannot tell the export format of {path}; "
+            f"use one of: {', '.join(FORMATS)}"
+        )
+    return extension
+
+
+def export_tasks(start_date, end_date, path, fmt=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Export the tasks created between two dates (both inclusive) to a file
+
+    Args:
+        start_date: First date of the range
+        end_date: Last date of the range
+        path: File to write; replaced if it exists
+        fmt: "csv", "jsonl" or "parquet"; defaults to the file extension
+        batch_size: Rows fetched and written per batch
+
+    Returns:
+        int: Number of tasks written
+    """
+    fmt = fmt or format_for_path(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    try:
+        started = time.perf_counter()
+        count = FORMATS[fmt](iter_task_batches(start_date, end_date, batch_size), path)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Exported {count} tasks for {start_date} - {end_date} to {path} "
+            f"in {elapsed:.2f}s"
+        )
+        return count
+    except Exception as e:
+        logger.error(f"Error exporting tasks to {path}: {e}")
+        raise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export tracked time for a date range")
+    parser.add_argument(
+        "--start", type=date.fromisoformat, required=True, help="YYYY-MM-DD"
+    )
+    parser.add_argument(
+        "--end",
+        type=date.fromisoformat,
+        help="YYYY-MM-DD, inclusive; defaults to --start",
+    )
+    parser.add_argument("--output", "-o", required=True, help="File to write")
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="Export format; defaults to the output file extension",
+    )
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    init_db()
+    count = export_tasks(
+        args.start,
+        args.end or args.start,
+        args.output,
+        fmt=args.format,
+        batch_size=args.batch_size,
+    )
+    print(f"Exported {count} tasks to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
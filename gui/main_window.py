@@ -1,10 +1,16 @@
 import logging
+import os
+from datetime import timedelta
+from functools import partial
 
 from PyQt6.QtCore import QDate, Qt
-from PyQt6.QtGui import QFont, QColor, QBrush
+from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
+    QApplication,
     QCheckBox,
+    QComboBox,
     QDateEdit,
+    QFileDialog,
     QHBoxLayout,
     QHeaderView,
     QInputDialog,
@@ -15,32 +21,39 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QProgressDialog,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from alchemy import (
     Task,
+    bulk_update_tasks,
     delete_tasks,
     get_db_connection,
-    get_tasks_for_date,
+    get_segment_durations,
+    get_tasks_for_range,
+    get_total_duration_for_range,
+    rebuild_daily_rollups,
     update_task,
 )
-from jira_integration import JiraCredentialsDialog, log_work_to_jira
+from export import FORMATS, export_tasks
+from jira_integration import JiraCredentialsDialog
 from time_tracking import calculate_duration
 from utils import format_duration
 
+from .report_dialog import ReportDialog
+from .sync_worker import SyncWorker, start_sync_thread
+from .task_table_model import TaskTableModel
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.selected_tasks = set()
         self.logger = logging.getLogger(__name__)
-        self.edited_cells = set()  # Track edited cells
-        self.HIGHLIGHT_COLOR = QColor(217, 237, 255)  # Light blue color
-        self.loaded_tasks = []  # Store loaded tasks for comparison
+        self.sync_worker = None
+        self.sync_thread = None
+        self.sync_progress = None
 
         # Track if we're really quitting
         self.is_quitting = False
@@ -56,6 +69,10 @@ class MainWindow(QMainWindow):
             {"name": "Worklog ID", "attr": "worklog_id"},
         ]
 
+        self.task_model = TaskTableModel(self.table_headers, self)
+        self.task_model.checked_changed.connect(self.on_selection_changed)
+        self.selected_tasks = self.task_model.checked  # Checked task IDs
+
         self.create_menu_bar()
         self.initUI()
         self.load_tasks_for_date()
@@ -69,6 +86,10 @@ class MainWindow(QMainWindow):
         jira_settings_action = file_menu.addAction("JIRA Settings")
         jira_settings_action.triggered.connect(self.show_jira_settings)
 
+        # Add Export action
+        export_action = file_menu.addAction("Export Timesheet...")
+        export_action.triggered.connect(self.export_timesheet)
+
         # Add separator
         file_menu.addSeparator()
 
@@ -76,11 +97,60 @@ class MainWindow(QMainWindow):
         exit_action = file_menu.addAction("Exit")
         exit_action.triggered.connect(self.confirm_exit)
 
+        # Add Reports menu
+        reports_menu = menubar.addMenu("Reports")
+        time_report_action = reports_menu.addAction("Time Report")
+        time_report_action.triggered.connect(self.show_time_report)
+        rebuild_totals_action = reports_menu.addAction("Rebuild Totals")
+        rebuild_totals_action.triggered.connect(self.rebuild_totals)
+
     def show_jira_settings(self):
         """Show the JIRA credentials dialog"""
         dialog = JiraCredentialsDialog(self)
         dialog.exec()
 
+    def export_timesheet(self):
+        """Export the tasks of the selected range to a CSV, JSONL or Parquet file"""
+        start, end = self.selected_range()
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self,
+            "Export Timesheet",
+            f"timesheet-{start}-{end}.csv",
+            ";;".join(f"{fmt.upper()} (*.{fmt})" for fmt in FORMATS),
+        )
+        if not path:
+            return
+        if not os.path.splitext(path)[1]:
+            # The selected filter looks like "CSV (*.csv)"
+            path += selected_filter[selected_filter.rindex("*") + 1 : -1]
+
+        try:
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+            try:
+                count = export_tasks(start, end, path)
+            finally:
+                QApplication.restoreOverrideCursor()
+            QMessageBox.information(
+                self, "Export Complete", f"Exported {count} tasks to {path}"
+            )
+        except Exception as e:
+            self.logger.error(f"Error exporting timesheet: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
+
+    def show_time_report(self):
+        """Show totals per JIRA key, task or period for the selected range"""
+        dialog = ReportDialog(self, *self.selected_range())
+        dialog.exec()
+
+    def rebuild_totals(self):
+        """Recompute the daily rollups, e.g. after editing the database by hand"""
+        try:
+            rebuild_daily_rollups()
+            self.update_total_hours_label()
+        except Exception as e:
+            self.logger.error(f"Error rebuilding totals: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to rebuild totals: {str(e)}")
+
     def confirm_exit(self):
         """Show confirmation dialog before exiting"""
         reply = QMessageBox.question(
@@ -114,12 +184,25 @@ class MainWindow(QMainWindow):
         # Add stretch to push other controls to the right
         top_controls.addStretch()
 
+        # Add range selector
+        self.range_selector = QComboBox()
+        self.range_selector.addItems(["Day", "Week", "Month", "Custom"])
+        self.range_selector.currentTextChanged.connect(self.on_range_changed)
+        top_controls.addWidget(self.range_selector)
+
         # Add date selector
         self.date_selector = QDateEdit()
         self.date_selector.setCalendarPopup(True)  # Allows calendar popup
         self.date_selector.setDate(QDate.currentDate())
         top_controls.addWidget(self.date_selector)
 
+        # Add end date selector, only shown for custom ranges
+        self.end_date_selector = QDateEdit()
+        self.end_date_selector.setCalendarPopup(True)
+        self.end_date_selector.setDate(QDate.currentDate())
+        self.end_date_selector.setVisible(False)
+        top_controls.addWidget(self.end_date_selector)
+
         # Add apply button
         self.apply_button = QPushButton("Apply")
         self.apply_button.clicked.connect(self.load_tasks_for_date)
@@ -129,9 +212,12 @@ class MainWindow(QMainWindow):
         layout.addLayout(top_controls)
 
         # Create table
-        self.table = QTableWidget()
-        self.table.setColumnCount(len(self.table_headers))
-        self.table.setHorizontalHeaderLabels([h["name"] for h in self.table_headers])
+        self.table = QTableView()
+        self.table.setModel(self.task_model)
+        # Fixed row heights let the view skip measuring every row
+        self.table.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
 
         # Update header resize modes
         header = self.table.horizontalHeader()
@@ -144,10 +230,12 @@ class MainWindow(QMainWindow):
 
         for i in range(2, len(self.table_headers) - 1):  # Adjust range for new column
             header.setSectionResizeMode(i, QHeaderView.ResizeMode.ResizeToContents)
+        # Size columns from the visible rows only rather than sampling the model
+        header.setResizeContentsPrecision(0)
 
         self.table.setEditTriggers(
-            QTableWidget.EditTrigger.DoubleClicked
-            | QTableWidget.EditTrigger.EditKeyPressed
+            QTableView.EditTrigger.DoubleClicked
+            | QTableView.EditTrigger.EditKeyPressed
         )
 
         # Create bottom buttons
@@ -193,19 +281,23 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            for row in range(self.table.rowCount()):
-                task_id = self.table.item(row, 1).data(Qt.ItemDataRole.UserRole)
+            model = self.task_model
+            duration_col = model.attrs.index("duration")
+            # Exact totals from the recorded start/pause segments; tasks
+            # tracked before segments existed fall back to end minus start
+            segment_durations = get_segment_durations(self.selected_tasks)
+            for row in range(model.rowCount()):
+                task_id = model.task_id(row)
                 if task_id in self.selected_tasks:
-                    start_time = self.table.item(row, 2).text()
-                    end_time = self.table.item(row, 3).text()
+                    values = model.row_values(row)
+                    new_duration = segment_durations.get(task_id)
+                    if new_duration is None:
+                        new_duration = calculate_duration(
+                            values["start_time"], values["end_time"]
+                        )
 
-                    new_duration = calculate_duration(start_time, end_time)
-                    duration_item = self.table.item(row, 4)
-                    
-                    # Update the duration display with formatted text
-                    duration_item.setText(format_duration(new_duration))
-                    # Store the raw duration value for calculations
-                    duration_item.setData(Qt.ItemDataRole.UserRole, new_duration)
+                    # Update the stored duration; the view formats it
+                    model.set_value(row, duration_col, new_duration)
 
                     # Update the duration in the database
                     update_task(task_id, duration=new_duration)
@@ -223,167 +315,67 @@ class MainWindow(QMainWindow):
                 self, "Error", f"Failed to recalculate durations: {str(e)}"
             )
 
+    def on_range_changed(self, range_name):
+        self.end_date_selector.setVisible(range_name == "Custom")
+
+    def selected_range(self):
+        """Return the (start, end) dates, both inclusive, of the selected range"""
+        selected_date = self.date_selector.date().toPyDate()
+        range_name = self.range_selector.currentText()
+
+        if range_name == "Week":
+            start = selected_date - timedelta(days=selected_date.weekday())
+            return start, start + timedelta(days=6)
+        if range_name == "Month":
+            start = selected_date.replace(day=1)
+            next_month = (start + timedelta(days=32)).replace(day=1)
+            return start, next_month - timedelta(days=1)
+        if range_name == "Custom":
+            end_date = self.end_date_selector.date().toPyDate()
+            return min(selected_date, end_date), max(selected_date, end_date)
+        return selected_date, selected_date
+
     def load_tasks_for_date(self):
-        """Load tasks for the selected date"""
+        """Load tasks for the selected date range"""
         try:
-            selected_date = self.date_selector.date().toPyDate()
-            tasks = get_tasks_for_date(selected_date)
-            self.populate_table(tasks)
+            start, end = self.selected_range()
+            # Rows are fetched a page at a time as the table is scrolled
+            self.task_model.set_page_source(partial(get_tasks_for_range, start, end))
             # Update the total hours label
             self.update_total_hours_label()
         except Exception as e:
             self.logger.error(f"Error loading tasks for date: {e}")
             QMessageBox.critical(self, "Error", f"Failed to load tasks: {str(e)}")
 
-    def populate_table(self, tasks):
-        """Populate table with tasks and store them for comparison"""
-        self.loaded_tasks = tasks  # Store tasks for later comparison
-        self.edited_cells.clear()
-        self.table.setRowCount(len(tasks))
-
-        # Safely disconnect the itemChanged signal if it's connected
-        try:
-            self.table.itemChanged.disconnect(self.on_item_changed)
-        except TypeError:  # Signal was not connected
-            pass
-
-        for row, task in enumerate(tasks):
-            for col, header in enumerate(self.table_headers):
-                if header["attr"] is None:
-                    container = QWidget()
-                    layout = QHBoxLayout(container)
-                    layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    layout.setContentsMargins(0, 0, 0, 0)
-                    checkbox = QCheckBox()
-                    if task.task_id in self.selected_tasks:
-                        checkbox.setCheckState(Qt.CheckState.Checked)
-                    checkbox.stateChanged.connect(self.on_checkbox_changed)
-                    layout.addWidget(checkbox)
-                    self.table.setCellWidget(row, col, container)
-                else:
-                    value = getattr(task, header["attr"])
-                    if header["attr"] == "task_name":
-                        item = QTableWidgetItem(value)
-                        item.setData(Qt.ItemDataRole.UserRole, task.task_id)
-                    elif header["attr"] == "duration" and value is not None:
-                        formatted_duration = format_duration(value)
-                        item = QTableWidgetItem(formatted_duration)
-                        # Store the raw duration value for calculations
-                        item.setData(Qt.ItemDataRole.UserRole, value)
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    elif header["attr"] == "synced":
-                        item = QTableWidgetItem("Yes" if value else "No")
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    elif header["attr"] == "worklog_id":
-                        item = QTableWidgetItem(str(value or ""))
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    else:
-                        item = QTableWidgetItem(str(value or ""))
-                    self.table.setItem(row, col, item)
-
-        # Connect the itemChanged signal
-        self.table.itemChanged.connect(self.on_item_changed)
-
     def update_total_hours_label(self):
-        """Calculate and update the total hours label from current tasks"""
-        total_hours = 0.0
-        for row in range(self.table.rowCount()):
-            duration_item = self.table.item(row, 4)
-            if duration_item:
-                # Get the raw duration value stored in UserRole
-                duration = duration_item.data(Qt.ItemDataRole.UserRole)
-                if duration is not None:
-                    total_hours += duration
-
+        """Calculate and update the total hours label for the selected range"""
+        # Summed in the database since not every page may be loaded yet
+        total_hours = get_total_duration_for_range(*self.selected_range())
         formatted_total = format_duration(total_hours)
         self.total_hours_label.setText(f"Total Hours: {formatted_total}")
 
-    def on_checkbox_changed(self, state):
-        checkbox = self.sender()
-        row = self.get_checkbox_row(checkbox)
-        task_id = self.table.item(row, 1).data(Qt.ItemDataRole.UserRole)
-
-        if state == Qt.CheckState.Checked.value:
-            self.selected_tasks.add(task_id)
-        else:
-            self.selected_tasks.discard(task_id)
-
+    def on_selection_changed(self):
         self.delete_button.setVisible(len(self.selected_tasks) > 0)
 
-    def get_checkbox_row(self, checkbox):
-        for row in range(self.table.rowCount()):
-            container = self.table.cellWidget(row, 0)
-            if container and checkbox in container.children():
-                return row
-        return -1
-
-    def on_item_changed(self, item):
-        """Handle when a cell is edited by the user"""
-        if not item:
-            return
-
-        row = item.row()
-        col = item.column()
-        
-        # Don't track changes for certain columns
-        header_attr = self.table_headers[col]["attr"]
-        if header_attr in ["duration", "synced", "worklog_id"] or header_attr is None:
-            return
-
-        # Get the original value from loaded_tasks
-        task = self.loaded_tasks[row]
-        original_value = str(getattr(task, header_attr) or "")
-        current_value = item.text()
-
-        # Compare and highlight if different
-        if original_value != current_value:
-            cell_id = (row, col)
-            self.edited_cells.add(cell_id)
-            item.setBackground(QBrush(self.HIGHLIGHT_COLOR))
-        else:
-            cell_id = (row, col)
-            if cell_id in self.edited_cells:
-                self.edited_cells.remove(cell_id)
-            item.setBackground(QBrush())
-
     def save_all_changes(self):
         """Save all modified rows to the database"""
         try:
-            updates = []
-            for row in range(self.table.rowCount()):
-                task_id = self.table.item(row, 1).data(Qt.ItemDataRole.UserRole)
-                duration_item = self.table.item(row, 4)
-                duration = duration_item.data(Qt.ItemDataRole.UserRole) if duration_item else 0
-                
-                update_data = {
-                    "task_name": self.table.item(row, 1).text(),
-                    "start_time": self.table.item(row, 2).text(),
-                    "end_time": self.table.item(row, 3).text(),
-                    "duration": duration,
-                    "jira_key": self.table.item(row, 5).text(),
-                }
-                updates.append((task_id, update_data))
-
-            # Temporarily disconnect the itemChanged signal
-            self.table.itemChanged.disconnect(self.on_item_changed)
-
-            # Clear highlights from edited cells
-            for row, col in self.edited_cells:
-                item = self.table.item(row, col)
-                if item:
-                    item.setBackground(QBrush())
+            model = self.task_model
+            updates = {}
+            # Only the cells the user actually changed are written back
+            for row, col in model.edited_cells:
+                task_id = model.task_id(row)
+                update_data = updates.setdefault(task_id, {"task_id": task_id})
+                update_data[model.attrs[col]] = model.value(row, col)
 
-            self.edited_cells.clear()
+            bulk_update_tasks(list(updates.values()))
 
-            for task_id, update_data in updates:
-                update_task(task_id, **update_data)
+            # Clear highlights from edited cells
+            model.commit_edits()
 
             # Update the total hours label
             self.update_total_hours_label()
 
-            # Reconnect the itemChanged signal
-            self.table.itemChanged.connect(self.on_item_changed)
-
             QMessageBox.information(self, "Success", "All changes saved successfully")
         except Exception as e:
             self.logger.error(f"Error saving changes: {e}")
@@ -423,51 +415,102 @@ class MainWindow(QMainWindow):
             tasks = (
                 session.query(Task).filter(Task.task_id.in_(self.selected_tasks)).all()
             )
+            session.close()
+
+            # Ask for missing JIRA keys up front so the sync itself never
+            # stops to wait for user input
+            key_updates = []
+            for task in tasks:
+                if task.synced or task.jira_key:
+                    continue
+                jira_key, ok = QInputDialog.getText(
+                    self, "Enter JIRA Key", f"JIRA Key for '{task.task_name}':"
+                )
+                if ok and jira_key:
+                    key_updates.append({"task_id": task.task_id, "jira_key": jira_key})
+            # Saved through bulk_update_tasks so the daily rollups move the
+            # hours to the new key even if the sync then fails
+            bulk_update_tasks(key_updates)
+            task_ids = [task.task_id for task in tasks]
 
             # Create and configure progress dialog
-            progress = QProgressDialog(
-                "Syncing tasks to JIRA...", "Cancel", 0, len(tasks), self
+            self.sync_progress = QProgressDialog(
+                "Syncing tasks to JIRA...", "Cancel", 0, len(task_ids), self
+            )
+            self.sync_progress.setWindowModality(Qt.WindowModality.WindowModal)
+            self.sync_progress.setWindowTitle("Sync Progress")
+            self.sync_progress.setMinimumDuration(0)  # Show immediately
+            self.sync_progress.setAutoClose(False)
+            self.sync_progress.setAutoReset(False)
+
+            # Post the worklogs from a worker thread so the event loop (and the
+            # widget timer) keeps running during the sync
+            self.sync_worker = SyncWorker(task_ids)
+            self.sync_worker.progress.connect(self.on_sync_progress)
+            self.sync_worker.task_failed.connect(self.on_sync_task_failed)
+            self.sync_worker.error.connect(self.on_sync_error)
+            self.sync_worker.finished.connect(self.on_sync_finished)
+            # The worker's thread is busy in run() until the sync ends, so a
+            # queued call to cancel() would only arrive afterwards; call it
+            # directly from the GUI thread instead
+            self.sync_progress.canceled.connect(
+                self.sync_worker.cancel, Qt.ConnectionType.DirectConnection
             )
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.setWindowTitle("Sync Progress")
-            progress.setMinimumDuration(0)  # Show immediately
 
-            for i, task in enumerate(tasks):
-                if progress.wasCanceled():
-                    break
+            self.sync_button.setEnabled(False)
+            self.sync_thread = start_sync_thread(self.sync_worker, self)
 
-                if task.synced:
-                    progress.setValue(i + 1)
-                    continue
+        except Exception as e:
+            self.logger.error(f"Error syncing to JIRA: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to sync to JIRA: {str(e)}")
 
-                jira_key = task.jira_key
-                duration = task.duration or 0
-
-                if not jira_key:
-                    progress.close()  # Temporarily hide progress for input dialog
-                    jira_key, ok = QInputDialog.getText(
-                        self, "Enter JIRA Key", "JIRA Key:"
-                    )
-                    if ok:
-                        task.jira_key = jira_key
-                        session.commit()
-                    progress.show()  # Show progress again
-                    progress.setValue(i + 1)
-                    continue
+    def on_sync_progress(self, completed, total):
+        """Update the progress dialog as worklogs are posted"""
+        if self.sync_progress:
+            self.sync_progress.setMaximum(total)
+            self.sync_progress.setValue(completed)
 
-                if duration > 0:
-                    log_work_to_jira(task.task_id, duration, jira_key)
+    def on_sync_task_failed(self, task_id, error):
+        self.logger.warning(f"Task {task_id} failed to sync: {error}")
 
-                progress.setValue(i + 1)
+    def on_sync_error(self, error):
+        QMessageBox.critical(self, "Error", f"Failed to sync to JIRA: {error}")
 
-            progress.close()
-            session.close()
-            self.load_tasks_for_date()  # Refresh the table
-            QMessageBox.information(self, "Success", "Selected tasks synced to JIRA")
+    def on_sync_finished(self, result):
+        """Refresh the table and report the outcome of a background sync"""
+        if self.sync_progress:
+            self.sync_progress.close()
+            self.sync_progress = None
+        self.sync_worker = None
+        self.sync_thread = None
+        self.sync_button.setEnabled(True)
 
-        except Exception as e:
-            self.logger.error(f"Error syncing to JIRA: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to sync to JIRA: {str(e)}")
+        self.load_tasks_for_date()  # Refresh the table
+
+        if result is None:
+            return
+
+        if result.failed:
+            QMessageBox.warning(
+                self,
+                "Sync Incomplete",
+                f"{len(result.synced)} tasks synced, "
+                f"{len(result.failed)} failed:\n"
+                + "\n".join(result.failed.values()),
+            )
+        elif result.cancelled:
+            QMessageBox.information(
+                self, "Sync Cancelled", f"{len(result.synced)} tasks synced"
+            )
+        else:
+            message = f"{len(result.synced)} tasks synced"
+            if result.skipped:
+                message += (
+                    f", {len(result.skipped)} skipped (already synced, without "
+                    "a JIRA key or with no time tracked)"
+                )
+            title = "Success" if result.synced else "Nothing Synced"
+            QMessageBox.information(self, title, message)
 
     def closeEvent(self, event):
         """Handle window close event"""
@@ -0,0 +1,133 @@
+import logging
+import time
+
+from PyQt6.QtCore import QDate
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import (
+    QComboBox,
+    QDateEdit,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QMessageBox,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from reporting import get_totals
+from utils import format_duration
+
+# Report groupings offered in the dialog: label -> (group_by, period)
+GROUPINGS = {
+    "JIRA Key": (("jira_key",), None),
+    "Task": (("task_name",), None),
+    "Day": ((), "day"),
+    "Week": ((), "week"),
+    "Month": ((), "month"),
+    "JIRA Key per Week": (("jira_key",), "week"),
+    "Task per Month": (("task_name",), "month"),
+}
+
+COLUMN_NAMES = {
+    "period": "Period",
+    "jira_key": "JIRA Key",
+    "task_name": "Task",
+}
+
+
+class ReportDialog(QDialog):
+    """Shows time totals per JIRA key, task or period for a date range"""
+
+    def __init__(self, parent=None, start_date=None, end_date=None):
+        super().__init__(parent)
+        self.logger = logging.getLogger(__name__)
+        self.setWindowTitle("Time Report")
+        self.resize(700, 500)
+
+        layout = QVBoxLayout()
+
+        controls = QHBoxLayout()
+        today = QDate.currentDate()
+        self.start_selector = QDateEdit()
+        self.start_selector.setCalendarPopup(True)
+        self.start_selector.setDate(
+            QDate(start_date) if start_date else QDate(today.year(), today.month(), 1)
+        )
+        self.end_selector = QDateEdit()
+        self.end_selector.setCalendarPopup(True)
+        self.end_selector.setDate(QDate(end_date) if end_date else today)
+        self.grouping_selector = QComboBox()
+        self.grouping_selector.addItems(GROUPINGS)
+        self.grouping_selector.currentTextChanged.connect(self.load_report)
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.load_report)
+
+        controls.addWidget(QLabel("From"))
+        controls.addWidget(self.start_selector)
+        controls.addWidget(QLabel("To"))
+        controls.addWidget(self.end_selector)
+        controls.addStretch()
+        controls.addWidget(QLabel("Group by"))
+        controls.addWidget(self.grouping_selector)
+        controls.addWidget(refresh_button)
+        layout.addLayout(controls)
+
+        self.table = QTableWidget()
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table)
+
+        self.summary_label = QLabel()
+        self.summary_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        layout.addWidget(self.summary_label)
+
+        self.setLayout(layout)
+        self.load_report()
+
+    def load_report(self):
+        """Query the totals for the selected range and grouping"""
+        start = self.start_selector.date().toPyDate()
+        end = self.end_selector.date().toPyDate()
+        start, end = min(start, end), max(start, end)
+        group_by, period = GROUPINGS[self.grouping_selector.currentText()]
+
+        try:
+            started = time.perf_counter()
+            rows = get_totals(start, end, group_by=group_by, period=period)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        except Exception as e:
+            self.logger.error(f"Error loading report: {e}")
+            QMessageBox.critical(self, "Error", f"Failed to load report: {str(e)}")
+            return
+
+        keys = (["period"] if period else []) + list(group_by)
+        headers = [COLUMN_NAMES[key] for key in keys]
+        headers += ["Total", "Synced", "Unsynced", "Tasks"]
+
+        self.table.clear()
+        self.table.setColumnCount(len(headers))
+        self.table.setHorizontalHeaderLabels(headers)
+        self.table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            values = [str(row[key] or "(none)") for key in keys]
+            values += [
+                format_duration(row["total_hours"]),
+                format_duration(row["synced_hours"]),
+                format_duration(max(row["total_hours"] - row["synced_hours"], 0)),
+                str(row["task_count"]),
+            ]
+            for column, value in enumerate(values):
+                self.table.setItem(row_index, column, QTableWidgetItem(value))
+        self.table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+
+        total_hours = sum(row["total_hours"] for row in rows)
+        task_count = sum(row["task_count"] for row in rows)
+        self.summary_label.setText(
+            f"Total: {format_duration(total_hours)} across {task_count} tasks "
+            f"({elapsed_ms:.0f} ms)"
+        )
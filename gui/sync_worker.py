@@ -0,0 +1,83 @@
+import threading
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from jira_sync import sync_worklogs
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+class SyncWorker(QObject):
+    """
+    Runs a bulk JIRA worklog sync outside the GUI thread.
+
+    Signals are emitted from the worker thread and delivered to GUI slots
+    through queued connections, so the event loop (and the widget timer) keeps
+    running while worklogs are posted.
+    """
+
+    task_synced = pyqtSignal(int, str)  # task_id, worklog_id
+    task_failed = pyqtSignal(int, str)  # task_id, error message
+    progress = pyqtSignal(int, int)  # completed, total
+    finished = pyqtSignal(object)  # SyncResult, or None if the sync crashed
+    error = pyqtSignal(str)
+
+    def __init__(self, task_ids, max_workers=None):
+        super().__init__()
+        self.task_ids = list(task_ids)
+        self.max_workers = max_workers
+        self.cancel_event = threading.Event()
+        self.completed = 0
+
+    def run(self):
+        """Run the sync; called in the worker thread"""
+        result = None
+        try:
+            self.progress.emit(0, len(self.task_ids))
+            result = sync_worklogs(
+                self.task_ids,
+                max_workers=self.max_workers,
+                progress_callback=self._on_task_done,
+                cancel_event=self.cancel_event,
+            )
+        except Exception as e:
+            logger.error(f"Error in JIRA sync worker: {e}")
+            self.error.emit(str(e))
+        finally:
+            self.finished.emit(result)
+
+    def cancel(self):
+        """
+        Stop queued requests and abort pending retries
+
+        Thread-safe; connect to it with a direct connection, since the
+        worker's own thread is blocked in run() while the sync is running.
+        """
+        logger.info("JIRA sync cancellation requested")
+        self.cancel_event.set()
+
+    def _on_task_done(self, task_id, worklog_id, error):
+        self.completed += 1
+        if error:
+            self.task_failed.emit(task_id, error)
+        else:
+            self.task_synced.emit(task_id, str(worklog_id))
+        self.progress.emit(self.completed, len(self.task_ids))
+
+
+def start_sync_thread(worker, parent=None):
+    """
+    Move a SyncWorker to a new QThread and start it
+
+    The thread quits and both objects are scheduled for deletion once the
+    worker emits ``finished``. Returns the started QThread.
+    """
+    thread = QThread(parent)
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    worker.finished.connect(thread.quit)
+    worker.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+    thread.start()
+    return thread
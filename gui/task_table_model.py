@@ -0,0 +1,220 @@
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt6.QtGui import QBrush, QColor
+
+from utils import format_duration
+
+# Columns whose values the user may edit in place
+EDITABLE_ATTRS = {"task_name", "start_time", "end_time", "jira_key"}
+
+
+class TaskTableModel(QAbstractTableModel):
+    """
+    Table model for the main window task list.
+
+    Rows are stored as plain tuples of column values rather than per-cell
+    item objects, so the view only materialises the cells that are visible.
+    User edits are kept in an overlay keyed by (row, column) until saved, and
+    the first column is a checkbox backed by a set of task IDs.
+    """
+
+    checked_changed = pyqtSignal()
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.attrs = [header["attr"] for header in headers]
+        self.highlight_brush = QBrush(QColor(217, 237, 255))  # Light blue color
+        self._rows = []
+        self._edits = {}  # (row, col) -> edited value
+        self.checked = set()  # Checked task IDs
+
+        # Incremental loading: fetch_page(after, limit) returns the next page of
+        # tasks following the (created_at, task_id) cursor
+        self._fetch_page = None
+        self._cursor = None
+        self._has_more = False
+        self.page_size = 500
+
+    # Row store
+
+    def _to_row(self, task):
+        return (task.task_id,) + tuple(
+            getattr(task, attr) for attr in self.attrs if attr is not None
+        )
+
+    def set_tasks(self, tasks):
+        """Replace the model contents with the given Task objects"""
+        self.beginResetModel()
+        self._rows = [self._to_row(task) for task in tasks]
+        self._edits.clear()
+        self._fetch_page = None
+        self._has_more = False
+        self.endResetModel()
+
+    def set_page_source(self, fetch_page):
+        """
+        Replace the model contents with tasks loaded page by page
+
+        Only the first page is fetched immediately; the view requests further
+        pages through ``fetchMore`` as the user scrolls towards the end.
+        """
+        self.beginResetModel()
+        self._rows = []
+        self._edits.clear()
+        self._fetch_page = fetch_page
+        self._cursor = None
+        self._has_more = True
+        self.endResetModel()
+        self.fetchMore()
+
+    def fetch_all(self):
+        """Load every remaining page"""
+        while self.canFetchMore():
+            self.fetchMore()
+
+    def task_id(self, row):
+        return self._rows[row][0]
+
+    def original_value(self, row, col):
+        # Slot 0 of a stored row is the task ID, which replaces the checkbox
+        # column, so data columns map straight onto tuple positions
+        return self._rows[row][col]
+
+    def value(self, row, col):
+        """Return the current (possibly edited) raw value of a cell"""
+        return self._edits.get((row, col), self.original_value(row, col))
+
+    def row_values(self, row):
+        """Return the current values of a row keyed by attribute name"""
+        return {
+            attr: self.value(row, col)
+            for col, attr in enumerate(self.attrs)
+            if attr is not None
+        }
+
+    def set_value(self, row, col, value):
+        """Set a raw value without marking the cell as edited"""
+        values = list(self._rows[row])
+        values[col] = value
+        self._rows[row] = tuple(values)
+        self._edits.pop((row, col), None)
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index)
+
+    @property
+    def edited_cells(self):
+        return set(self._edits)
+
+    def edited_rows(self):
+        """Return the sorted rows that have unsaved edits"""
+        return sorted({row for row, _ in self._edits})
+
+    def commit_edits(self):
+        """Make the edited values the new originals and clear highlights"""
+        for (row, col), value in list(self._edits.items()):
+            self.set_value(row, col, value)
+
+    # QAbstractTableModel interface
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more:
+            return
+
+        tasks = self._fetch_page(after=self._cursor, limit=self.page_size)
+        self._has_more = len(tasks) == self.page_size
+        if not tasks:
+            return
+
+        self._cursor = (tasks[-1].created_at, tasks[-1].task_id)
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+        self._rows.extend(self._to_row(task) for task in tasks)
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.headers[section]["name"]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        attr = self.attrs[index.column()]
+        if attr is None:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        elif attr in EDITABLE_ATTRS:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, col = index.row(), index.column()
+        attr = self.attrs[col]
+
+        if attr is None:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                checked = self.task_id(row) in self.checked
+                return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+            return None
+
+        value = self.value(row, col)
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if attr == "duration":
+                return format_duration(value) if value is not None else ""
+            if attr == "synced":
+                return "Yes" if value else "No"
+            return str(value or "")
+
+        if role == Qt.ItemDataRole.UserRole:
+            if attr == "task_name":
+                return self.task_id(row)
+            return value
+
+        if role == Qt.ItemDataRole.BackgroundRole and (row, col) in self._edits:
+            return self.highlight_brush
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid():
+            return False
+
+        row, col = index.row(), index.column()
+        attr = self.attrs[col]
+
+        if attr is None and role == Qt.ItemDataRole.CheckStateRole:
+            task_id = self.task_id(row)
+            if Qt.CheckState(value) == Qt.CheckState.Checked:
+                self.checked.add(task_id)
+            else:
+                self.checked.discard(task_id)
+            self.dataChanged.emit(index, index, [role])
+            self.checked_changed.emit()
+            return True
+
+        if role == Qt.ItemDataRole.EditRole and attr in EDITABLE_ATTRS:
+            # Highlight the cell only while it differs from the loaded value
+            if str(self.original_value(row, col) or "") != value:
+                self._edits[(row, col)] = value
+            else:
+                self._edits.pop((row, col), None)
+            self.dataChanged.emit(index, index)
+            return True
+
+        return False
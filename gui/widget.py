@@ -1,6 +1,7 @@
 import json
+from datetime import datetime
 
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import QEvent, Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QIcon
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -18,10 +19,9 @@ from PyQt6.QtWidgets import (
 from logging_setup import get_logger
 from notification import NotificationManager
 from reminder_tracker import TimerReminderTracker
+from scheduler import Scheduler
 from utils import resource_path
 
-from .main_window import MainWindow
-
 logger = get_logger(__name__)
 
 
@@ -32,25 +32,28 @@ class TimeTrackerWidget(QWidget):
     stop_clicked = pyqtSignal()
     expand_clicked = pyqtSignal()
     visibility_changed = pyqtSignal(bool)
+    first_painted = pyqtSignal()  # Emitted once, after the first paint
 
-    def __init__(self):
+    def __init__(self, scheduler=None):
         super().__init__()
         self.main_window = None
-        self.blink_timer = QTimer()
-        self.blink_timer.timeout.connect(self.toggle_time_visibility)
+        self.painted = False
+        # All periodic work (display, blinking, notifications, reminders) runs
+        # from one scheduler timer instead of a QTimer each
+        self.scheduler = scheduler or Scheduler(self)
         self.blink_state = True
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_time)
-        self.elapsed_time = 0
+        # Elapsed time is derived from the wall clock rather than counted in
+        # ticks, so late or skipped ticks never make the display drift. It is
+        # the clock task segments are recorded with; a monotonic clock stops
+        # during suspend on Linux and would fall behind the stored duration.
+        self.accumulated_time = 0.0  # Seconds tracked before the current run
+        self.run_started_at = None  # datetime.now() when the run started
 
         self.notification_manager = NotificationManager()
         self.notification_manager.set_widget(self)
-        self.notification_timer = QTimer()
-        self.notification_timer.timeout.connect(self.check_notification_triggers)
-        self.notification_timer.start(60000)  # Check for notifications every minute
 
         # Add reminder tracker
-        self.reminder_tracker = TimerReminderTracker(self)
+        self.reminder_tracker = TimerReminderTracker(self, scheduler=self.scheduler)
         self.reminder_tracker.start()  # Start immediately to check periodically
 
         self.initUI()
@@ -189,9 +192,13 @@ class TimeTrackerWidget(QWidget):
         self.resize(300, 100)
         self.move(100, 100)
 
+    def is_timer_running(self):
+        """Return True while the timer is counting (not paused or stopped)"""
+        return self.run_started_at is not None
+
     def check_notification_triggers(self):
         """Check if notifications should be triggered based on timer state"""
-        if self.update_timer.isActive():
+        if self.is_timer_running():
             # Timer is running, send appropriate notification
             task_name = self.task_label.text()
             jira_key = self.jira_ticket.text()
@@ -210,7 +217,7 @@ class TimeTrackerWidget(QWidget):
     def on_jira_ticket_changed(self, text):
         """Handle JIRA ticket text changes"""
         # Only update button states if timer is not running
-        if not self.update_timer.isActive():
+        if not self.is_timer_running():
             self.update_button_states()
 
     def load_tasks(self):
@@ -266,15 +273,47 @@ class TimeTrackerWidget(QWidget):
     def handle_expand(self):
         """Open the main window when expand button is clicked"""
         if not self.main_window:
+            # Imported here so the database and JIRA modules are only loaded
+            # once the main window is first opened
+            from .main_window import MainWindow
+
             self.main_window = MainWindow()
         self.main_window.show()
         self.main_window.raise_()
         self.main_window.activateWindow()
 
-    def start_timer(self):
-        """Start the timer updates"""
-        self.elapsed_time = 0
-        self.update_timer.start(1000)  # Update every 1000ms (1 second)
+    @property
+    def elapsed_time(self):
+        """Whole seconds tracked for the current task, including earlier runs"""
+        elapsed = self.accumulated_time
+        if self.run_started_at is not None:
+            # Never count backwards if the clock is set back
+            elapsed += max((datetime.now() - self.run_started_at).total_seconds(), 0)
+        return int(elapsed)
+
+    def update_interval(self):
+        """Tick every second while visible, once a minute when hidden"""
+        visible = self.isVisible() and not self.isMinimized()
+        return 1000 if visible else 60000
+
+    def start_timer(self, accumulated_seconds=0):
+        """
+        Start the timer updates
+
+        Args:
+            accumulated_seconds: Time already tracked for the task, e.g. the
+                persisted duration of a paused task that is being resumed
+        """
+        self.accumulated_time = accumulated_seconds
+        self.run_started_at = datetime.now()
+        self.update_time()
+        self.scheduler.schedule(
+            "timer_display", self.update_interval(), self.update_time
+        )
+        # Check for running timer notifications every minute
+        self.scheduler.schedule(
+            "timer_notifications", 60000, self.check_notification_triggers
+        )
         self.reminder_tracker.stop()  # Stop reminders while timer is running
         # Disable task selection and JIRA ticket input
         self.task_dropdown.setEnabled(False)
@@ -282,12 +321,16 @@ class TimeTrackerWidget(QWidget):
 
     def pause_timer(self):
         """Pause the timer updates"""
-        self.update_timer.stop()
+        self.accumulated_time = self.elapsed_time
+        self.run_started_at = None
+        self.scheduler.cancel("timer_display")
+        self.scheduler.cancel("timer_notifications")
         self.reminder_tracker.start()  # Resume reminders when timer is paused
 
     def stop_timer(self):
         """Stop the timer and reset"""
-        self.update_timer.stop()
+        self.scheduler.cancel("timer_display")
+        self.scheduler.cancel("timer_notifications")
         self.reminder_tracker.start()  # Resume reminders when timer is stopped
 
         # Re-enable task selection and JIRA ticket input
@@ -295,14 +338,16 @@ class TimeTrackerWidget(QWidget):
         self.jira_ticket.setEnabled(True)
 
         # Only show notification if actual time was tracked
-        if self.elapsed_time > 60:  # Only notify if more than a minute tracked
+        elapsed_time = self.elapsed_time
+        if elapsed_time > 60:  # Only notify if more than a minute tracked
             task_name = self.task_dropdown.currentText()
             jira_key = self.jira_ticket.text()
             self.notification_manager.notify_timer_completed(
-                task_name, self.elapsed_time, jira_key
+                task_name, elapsed_time, jira_key
             )
 
-        self.elapsed_time = 0
+        self.accumulated_time = 0.0
+        self.run_started_at = None
         self.set_time("00:00:00")
 
     def set_time(self, time_str):
@@ -311,12 +356,18 @@ class TimeTrackerWidget(QWidget):
 
     def update_time(self):
         """Update the displayed time based on elapsed seconds"""
-        hours = self.elapsed_time // 3600
-        minutes = (self.elapsed_time % 3600) // 60
-        seconds = self.elapsed_time % 60
+        elapsed_time = self.elapsed_time
+        hours = elapsed_time // 3600
+        minutes = (elapsed_time % 3600) // 60
+        seconds = elapsed_time % 60
         time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         self.set_time(time_str)
-        self.elapsed_time += 1
+
+    def refresh_update_interval(self):
+        """Switch between per-second and coarse ticks as visibility changes"""
+        if self.is_timer_running():
+            self.scheduler.set_interval("timer_display", self.update_interval())
+            self.update_time()
 
     def toggle_time_visibility(self):
         """Toggle time label visibility for blinking effect"""
@@ -325,12 +376,13 @@ class TimeTrackerWidget(QWidget):
 
     def start_blinking(self):
         """Start blinking the time label"""
-        self.blink_timer.start(500)  # Blink every 500ms
+        self.scheduler.schedule("blink", 500, self.toggle_time_visibility)
 
     def stop_blinking(self):
         """Stop blinking the time label"""
-        self.blink_timer.stop()
+        self.scheduler.cancel("blink")
         self.blink_state = True
+        self.time_label.setVisible(True)
 
     def _handle_tray_activation(self, reason):
         """Handle tray icon activation"""
@@ -342,16 +394,31 @@ class TimeTrackerWidget(QWidget):
                 self.raise_()
                 self.activateWindow()
 
+    def paintEvent(self, event):
+        """Report the first paint so startup time can be measured"""
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            self.first_painted.emit()
+
     def showEvent(self, event):
         """Override showEvent to emit our custom signal"""
         super().showEvent(event)
+        self.refresh_update_interval()
         self.visibility_changed.emit(True)
 
     def hideEvent(self, event):
         """Override hideEvent to emit our custom signal"""
         super().hideEvent(event)
+        self.refresh_update_interval()
         self.visibility_changed.emit(False)
 
+    def changeEvent(self, event):
+        """Use coarse timer ticks while the widget is minimized"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.refresh_update_interval()
+
     def closeEvent(self, event):
         """Handle widget close event"""
         event.ignore()  # Prevent the widget from being destroyed
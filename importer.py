@@ -0,0 +1,362 @@
+import argparse
+import csv
+import json
+import os
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import func, insert, select
+
+from alchemy import Session, Task, init_db, refresh_daily_rollups, seed_segments
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Entries inserted per executemany batch
+DEFAULT_BATCH_SIZE = 5000
+
+# Format of the "started" field of JIRA worklogs
+JIRA_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+# Invalid entries listed in the summary, at most
+MAX_REPORTED_ERRORS = 20
+
+
+class ImportResult:
+    """Counters and timing of an import run"""
+
+    def __init__(self):
+        self.inserted = 0
+        self.duplicates = 0
+        self.errors = []  # (line number or source, message)
+        self.elapsed = 0.0
+
+    @property
+    def rate(self):
+        """Entries inserted per second"""
+        return self.inserted / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        lines = [
+            f"Imported {self.inserted} entries in {self.elapsed:.2f}s "
+            f"({self.rate:.0f} entries/s), skipped {self.duplicates} duplicates "
+            f"and {len(self.errors)} invalid entries"
+        ]
+        for source, message in self.errors[:MAX_REPORTED_ERRORS]:
+            lines.append(f"  {source}: {message}")
+        if len(self.errors) > MAX_REPORTED_ERRORS:
+            lines.append(f"  ... and {len(self.errors) - MAX_REPORTED_ERRORS} more")
+        return "\n".join(lines)
+
+
+def parse_datetime(value):
+    """Parse an ISO 8601 timestamp; aware values are converted to local time"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def validate_entry(entry):
+    """
+    Turn an imported entry into a row for the tasks table
+
+    Entries use the column names of ``export.py``. ``task_name`` and
+    ``start_time`` are required; the duration is computed from ``end_time``
+    when it is missing and vice versa.
+
+    Args:
+        entry: Dict of field name to value, or a JSON object as a string;
+            empty strings count as missing
+
+    Returns:
+        dict: Values for an INSERT into tasks
+
+    Raises:
+        ValueError: If the entry is incomplete or malformed
+    """
+    if isinstance(entry, str):
+        try:
+            entry = json.loads(entry)
+        except ValueError as e:
+            raise ValueError(f"invalid JSON: {e}") from None
+    if not isinstance(entry, dict):
+        raise ValueError("entry must be an object")
+
+    entry = {
+        key: value.strip() if isinstance(value, str) else value
+        for key, value in entry.items()
+        if value is not None and value != ""
+    }
+
+    task_name = entry.get("task_name")
+    if not task_name:
+        raise ValueError("task_name is required")
+    if "start_time" not in entry:
+        raise ValueError("start_time is required")
+    start = parse_datetime(entry["start_time"])
+
+    end = parse_datetime(entry["end_time"]) if "end_time" in entry else None
+    if "duration" in entry:
+        duration = float(entry["duration"])
+    elif end is not None:
+        duration = (end - start).total_seconds() / 3600
+    else:
+        raise ValueError("duration or end_time is required")
+    if duration < 0:
+        raise ValueError("duration is negative")
+    if end is None:
+        end = start + timedelta(hours=duration)
+
+    worklog_id = int(entry["worklog_id"]) if "worklog_id" in entry else None
+    synced = int(entry.get("synced", 1 if worklog_id is not None else 0))
+
+    return {
+        "task_name": task_name,
+        "start_time": start.isoformat(),
+        "end_time": end.isoformat(),
+        "duration": duration,
+        "jira_key": entry.get("jira_key"),
+        "created_date": start.isoformat(),
+        "created_at": start,
+        "synced": synced,
+        "notes": entry.get("notes"),
+        "worklog_id": worklog_id,
+    }
+
+
+def read_csv(path):
+    """Yield (line number, entry) pairs from a CSV file with a header row"""
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        for entry in reader:
+            yield reader.line_num, entry
+
+
+def read_jsonl(path):
+    """
+    Yield (line number, line) pairs from a JSON Lines file
+
+    Lines are decoded by ``validate_entry``, so a malformed line is reported
+    and skipped like any other invalid entry.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if line.strip():
+                yield line_number, line
+
+
+READERS = {
+    "csv": read_csv,
+    "jsonl": read_jsonl,
+}
+
+
+def read_file(path):
+    """Yield (source, entry) pairs from a CSV or JSON Lines file"""
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    if extension == "json":
+        extension = "jsonl"
+    if extension not in READERS:
+        raise ValueError(f"Cannot import {path}; use a .csv or .jsonl file")
+    for line_number, entry in READERS[extension](path):
+        yield f"{os.path.basename(path)}:{line_number}", entry
+
+
+def import_entries(entries, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Validate entries and insert them as tasks in a single transaction
+
+    Rows are inserted with executemany INSERT statements of ``batch_size``
+    rows. Entries whose ``worklog_id`` already exists in the database, or
+    earlier in the same import, are skipped, so a JIRA pull can be imported
+    again safely. Entries without a ``worklog_id`` (e.g. unsynced tasks in an
+    export) are never deduplicated and are inserted again on every import.
+    In the same transaction each imported task gets a segment covering its
+    duration, and the daily rollups of every affected day are refreshed.
+    Invalid entries are skipped and listed in the result; any database error
+    rolls back the whole import.
+
+    Args:
+        entries: Iterable of (source, entry dict) pairs, where source names
+            the entry in error messages (e.g. "tasks.csv:12")
+        batch_size: Rows per INSERT batch
+
+    Returns:
+        ImportResult: Counters and timing of the import
+    """
+    result = ImportResult()
+    started = time.perf_counter()
+    seen_worklog_ids = set()
+    days = set()
+
+    def insert_batch(connection, batch):
+        worklog_ids = [row["worklog_id"] for row in batch if row["worklog_id"]]
+        existing = set()
+        # Chunked to stay below SQLite's limit on bound parameters
+        for i in range(0, len(worklog_ids), 500):
+            existing.update(
+                connection.execute(
+                    select(Task.worklog_id).where(
+                        Task.worklog_id.in_(worklog_ids[i : i + 500])
+                    )
+                ).scalars()
+            )
+
+        rows = []
+        for row in batch:
+            worklog_id = row["worklog_id"]
+            if worklog_id is not None:
+                if worklog_id in existing or worklog_id in seen_worklog_ids:
+                    result.duplicates += 1
+                    continue
+                seen_worklog_ids.add(worklog_id)
+            rows.append(row)
+            days.add(row["created_at"].date())
+        if rows:
+            connection.execute(insert(Task), rows)
+            result.inserted += len(rows)
+
+    try:
+        session = Session()
+        connection = session.connection()
+        last_task_id = connection.execute(select(func.max(Task.task_id))).scalar()
+        batch = []
+        for source, entry in entries:
+            try:
+                batch.append(validate_entry(entry))
+            except (TypeError, ValueError) as e:
+                result.errors.append((source, str(e)))
+                continue
+            if len(batch) >= batch_size:
+                insert_batch(connection, batch)
+                batch = []
+        if batch:
+            insert_batch(connection, batch)
+
+        # Imported time is kept when a task is later resumed or stopped
+        seed_segments(connection, Task.task_id > (last_task_id or 0))
+        refresh_daily_rollups(session, days)
+        session.commit()
+        session.close()
+    except Exception as e:
+        logger.error(f"Error importing entries: {e}")
+        raise
+
+    result.elapsed = time.perf_counter() - started
+    logger.info(
+        f"Imported {result.inserted} entries ({result.rate:.0f}/s), "
+        f"{result.duplicates} duplicates, {len(result.errors)} invalid"
+    )
+    return result
+
+
+def import_files(paths, batch_size=DEFAULT_BATCH_SIZE):
+    """Import CSV and JSON Lines files in one transaction; see import_entries"""
+
+    def entries():
+        for path in paths:
+            yield from read_file(path)
+
+    return import_entries(entries(), batch_size)
+
+
+def worklog_comment(worklog):
+    """Return the plain text of a worklog's comment, which JIRA stores as an
+    Atlassian Document Format tree"""
+    parts = []
+    nodes = [worklog.get("comment") or {}]
+    while nodes:
+        node = nodes.pop()
+        if node.get("type") == "text":
+            parts.append(node.get("text", ""))
+        nodes.extend(reversed(node.get("content", [])))
+    return " ".join(part.strip() for part in parts if part.strip())
+
+
+def fetch_jira_worklogs(since, until=None, client=None):
+    """
+    Yield the JIRA worklogs of the configured user as import entries
+
+    Args:
+        since: First date to include
+        until: Last date to include, defaults to today
+        client: Optional JiraClient; a new one is created and closed otherwise
+
+    Yields:
+        tuple: (source, entry) pairs for ``import_entries``
+    """
+    from jira_client import JiraClient
+
+    until = until or date.today()
+    own_client = client is None
+    client = client or JiraClient()
+    try:
+        account_id = client.get_current_user()["accountId"]
+        started_after = datetime.combine(since, datetime.min.time())
+        jql = (
+            f'worklogAuthor = currentUser() AND worklogDate >= "{since}" '
+            f'AND worklogDate <= "{until}"'
+        )
+        for jira_key in client.search_issue_keys(jql):
+            for worklog in client.get_issue_worklogs(jira_key, started_after):
+                if worklog.get("author", {}).get("accountId") != account_id:
+                    continue
+                started = datetime.strptime(worklog["started"], JIRA_TIME_FORMAT)
+                started = started.astimezone().replace(tzinfo=None)
+                if started.date() > until:
+                    continue
+                yield f"{jira_key} worklog {worklog['id']}", {
+                    "task_name": worklog_comment(worklog) or jira_key,
+                    "jira_key": jira_key,
+                    "start_time": started.isoformat(),
+                    "duration": worklog["timeSpentSeconds"] / 3600,
+                    "worklog_id": worklog["id"],
+                    "synced": 1,
+                }
+    finally:
+        if own_client:
+            client.close()
+
+
+def import_jira_worklogs(
+    since, until=None, client=None, batch_size=DEFAULT_BATCH_SIZE
+):
+    """Import the configured user's JIRA worklogs between two dates; see
+    import_entries"""
+    return import_entries(fetch_jira_worklogs(since, until, client), batch_size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import historical time entries")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    files_parser = subparsers.add_parser(
+        "files", help="Import CSV or JSON Lines files, e.g. from export.py"
+    )
+    files_parser.add_argument("paths", nargs="+")
+
+    jira_parser = subparsers.add_parser(
+        "jira", help="Import your worklogs from JIRA, using the .env credentials"
+    )
+    jira_parser.add_argument(
+        "--since", type=date.fromisoformat, required=True, help="YYYY-MM-DD"
+    )
+    jira_parser.add_argument(
+        "--until", type=date.fromisoformat, help="YYYY-MM-DD, defaults to today"
+    )
+    args = parser.parse_args(argv)
+
+    init_db()
+    if args.command == "files":
+        result = import_files(args.paths, args.batch_size)
+    else:
+        result = import_jira_worklogs(
+            args.since, args.until, batch_size=args.batch_size
+        )
+    print(result.summary())
+
+
+if __name__ == "__main__":
+    main()
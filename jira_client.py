@@ -0,0 +1,326 @@
+import json
+import threading
+import time
+from datetime import datetime
+
+import environs
+
+from alchemy import get_task, update_task
+from logging_setup import get_logger
+from utils import resource_path
+
+logger = get_logger(__name__)
+
+
+class SyncCancelled(Exception):
+    """Raised when a JIRA sync is cancelled while waiting to retry"""
+
+
+class JiraConfig:
+    def __init__(self):
+        env = environs.Env()
+        env_path = resource_path(".env")
+        # Override so that credentials saved after startup take effect once the
+        # cached config is invalidated
+        env.read_env(env_path, override=True)
+
+        self.domain = env.str("JIRA_DOMAIN")
+        self.email = env.str("JIRA_EMAIL")
+        self.api_token = env.str("JIRA_API_TOKEN")
+
+        if not all([self.domain, self.email, self.api_token]):
+            raise ValueError("Missing JIRA credentials in .env file")
+
+        # JIRA_DOMAIN is normally a bare Atlassian domain, but a full URL such
+        # as http://127.0.0.1:8080 points the client at another server (e.g.
+        # the mock server in benchmarks/mock_jira.py)
+        if self.domain.startswith(("http://", "https://")):
+            self.base_url = self.domain.rstrip("/")
+        else:
+            self.base_url = f"https://{self.domain}"
+
+        # Number of worklogs posted in parallel by the bulk sync engine
+        self.sync_concurrency = env.int("JIRA_SYNC_CONCURRENCY", 4)
+
+        self.auth = (self.email, self.api_token)
+        self.headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+
+
+class JiraClient:
+    """
+    Long-lived JIRA REST client.
+
+    Keeps a pooled ``requests.Session`` so consecutive worklog requests reuse
+    the same keep-alive connection, and caches the parsed ``JiraConfig`` until
+    ``invalidate_config`` is called (e.g. after the credentials are changed).
+    """
+
+    # Status codes JIRA uses to ask clients to slow down
+    RETRY_STATUS_CODES = {429, 503}
+
+    def __init__(self, pool_size=10, timeout=30, max_retries=5):
+        # Connections kept alive per host; the bulk sync runs at most this
+        # many requests at once so none are discarded and reopened
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._config = None
+        self._lock = threading.Lock()
+        # Monotonic deadline before which no request may be sent; shared by all
+        # threads so one 429 response throttles the whole pool
+        self._retry_after_until = 0.0
+
+        # requests is only needed once something is synced, so it is kept off
+        # the startup path
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @property
+    def config(self):
+        """Return the cached JIRA config, loading it from .env on first use"""
+        with self._lock:
+            if self._config is None:
+                config = JiraConfig()
+                self.session.auth = config.auth
+                self.session.headers.update(config.headers)
+                self._config = config
+                logger.info(f"Loaded JIRA config for {config.domain}")
+            return self._config
+
+    def invalidate_config(self):
+        """Drop the cached config so the next request re-reads .env"""
+        with self._lock:
+            self._config = None
+        logger.info("JIRA config invalidated")
+
+    def worklog_url(self, jira_key):
+        return f"{self.config.base_url}/rest/api/3/issue/{jira_key}/worklog"
+
+    def _wait_for_rate_limit(self, cancel_event=None):
+        """Block until any Retry-After window announced by JIRA has passed"""
+        while True:
+            with self._lock:
+                delay = self._retry_after_until - time.monotonic()
+            if delay <= 0:
+                return
+            if cancel_event is not None:
+                if cancel_event.wait(delay):
+                    raise SyncCancelled()
+            else:
+                time.sleep(delay)
+
+    def _retry_delay(self, response, attempt):
+        """Return the number of seconds to wait before retrying a response"""
+        retry_after = response.headers.get("Retry-After")
+        try:
+            return max(float(retry_after), 0.0)
+        except (TypeError, ValueError):
+            return min(2**attempt, 60)
+
+    def post_worklog(
+        self, task_name, start_time, time_spent_hours, jira_key, cancel_event=None
+    ):
+        """
+        Post a worklog for a task and return the created worklog ID
+
+        Retries when JIRA responds with 429/503, honouring its Retry-After
+        header. Does not touch the local database.
+
+        Args:
+            task_name: Task name, used as the worklog comment
+            start_time: Task start time in isoformat
+            time_spent_hours: Time spent in hours
+            jira_key: JIRA issue key (e.g., 'PROJ-123')
+            cancel_event: Optional threading.Event that aborts pending retries
+        """
+        payload = json.dumps(
+            build_worklog_payload(task_name, start_time, time_spent_hours)
+        )
+        response = self._request(
+            "POST", self.worklog_url(jira_key), cancel_event, data=payload
+        )
+        if response.status_code == 201:
+            return response.json()["id"]
+        raise Exception(f"Failed to log work: {response.text}")
+
+    def _request(self, method, url, cancel_event=None, **kwargs):
+        """
+        Send a request, retrying while JIRA responds with 429/503
+
+        Honours the Retry-After header and returns the final response, which
+        the caller checks for success.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_rate_limit(cancel_event)
+            response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+
+            if (
+                response.status_code in self.RETRY_STATUS_CODES
+                and attempt < self.max_retries
+            ):
+                delay = self._retry_delay(response, attempt)
+                logger.warning(
+                    f"JIRA returned {response.status_code} for {method} {url}, "
+                    f"retrying in {delay:.1f}s"
+                )
+                with self._lock:
+                    self._retry_after_until = max(
+                        self._retry_after_until, time.monotonic() + delay
+                    )
+                continue
+            return response
+
+    def _get_json(self, path, params=None):
+        """GET a path below the REST API root and return the decoded body"""
+        url = f"{self.config.base_url}/rest/api/3/{path}"
+        response = self._request("GET", url, params=params)
+        if response.status_code != 200:
+            raise Exception(f"Failed to get {path}: {response.text}")
+        return response.json()
+
+    def get_current_user(self):
+        """Return the JIRA user the credentials belong to"""
+        return self._get_json("myself")
+
+    def search_issue_keys(self, jql, page_size=100):
+        """
+        Yield the keys of the issues matching a JQL query
+
+        Args:
+            jql: JQL query string
+            page_size: Issues requested per page
+        """
+        params = {"jql": jql, "fields": "key", "maxResults": page_size}
+        while True:
+            page = self._get_json("search/jql", params)
+            for issue in page.get("issues", []):
+                yield issue["key"]
+            if page.get("isLast", True) or not page.get("nextPageToken"):
+                return
+            params["nextPageToken"] = page["nextPageToken"]
+
+    def get_issue_worklogs(self, jira_key, started_after=None, page_size=1000):
+        """
+        Yield the worklogs of an issue
+
+        Args:
+            jira_key: JIRA issue key (e.g., 'PROJ-123')
+            started_after: Optional datetime; only worklogs started at or after
+                it are returned
+            page_size: Worklogs requested per page
+        """
+        params = {"startAt": 0, "maxResults": page_size}
+        if started_after is not None:
+            params["startedAfter"] = int(started_after.timestamp() * 1000)
+        while True:
+            page = self._get_json(f"issue/{jira_key}/worklog", params)
+            worklogs = page.get("worklogs", [])
+            yield from worklogs
+            params["startAt"] += len(worklogs)
+            if not worklogs or params["startAt"] >= page.get("total", 0):
+                return
+
+    def log_work(self, task_id, time_spent_hours, jira_key):
+        """
+        Log work to JIRA and store the worklog ID
+
+        Args:
+            task_id: Local task ID
+            time_spent_hours: Time spent in hours
+            jira_key: JIRA issue key (e.g., 'PROJ-123')
+        """
+        try:
+            task = get_task(task_id)
+
+            if not task:
+                raise ValueError(f"Task {task_id} not found")
+
+            worklog_id = self.post_worklog(task[1], task[2], time_spent_hours, jira_key)
+
+            # Store worklog ID in database
+            update_task(task_id, worklog_id=worklog_id, synced=1)
+
+            logger.info(f"Successfully logged work to JIRA issue {jira_key}")
+            return worklog_id
+
+        except Exception as e:
+            logger.error(f"Error logging work to JIRA: {e}")
+            raise
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_jira_client():
+    """Return the shared JiraClient instance, creating it on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = JiraClient()
+        return _client
+
+
+def invalidate_jira_config():
+    """Make the shared client re-read credentials on its next request"""
+    with _client_lock:
+        client = _client
+    if client is not None:
+        client.invalidate_config()
+
+
+def build_worklog_payload(task_name, start_time, time_spent_hours):
+    """
+    Build the JIRA worklog request body for a task
+
+    Args:
+        task_name: Task name, used as the worklog comment
+        start_time: Task start time in isoformat
+        time_spent_hours: Time spent in hours
+    """
+    # Convert hours to seconds
+    time_spent_seconds = int(time_spent_hours * 3600)
+
+    # Convert the start_date to the user's system timezone
+    start_time = datetime.fromisoformat(start_time)
+    start_time = start_time.astimezone()
+
+    return {
+        "comment": {
+            "content": [
+                {
+                    "content": [
+                        {"text": task_name, "type": "text"}  # task name as comment
+                    ],
+                    "type": "paragraph",
+                }
+            ],
+            "type": "doc",
+            "version": 1,
+        },
+        "started": start_time.strftime("%Y-%m-%dT%H:%M:%S.000%z"),
+        "timeSpentSeconds": time_spent_seconds,
+    }
+
+
+def log_work_to_jira(task_id, time_spent_hours, jira_key):
+    """
+    Log work to JIRA using the shared client and store the worklog ID
+
+    Args:
+        task_id: Local task ID
+        time_spent_hours: Time spent in hours
+        jira_key: JIRA issue key (e.g., 'PROJ-123')
+    """
+    return get_jira_client().log_work(task_id, time_spent_hours, jira_key)
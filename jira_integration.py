@@ -1,9 +1,6 @@
-import json
 import os
-from datetime import datetime
 
 import environs
-import requests
 from environs import Env
 from PyQt6.QtWidgets import (
     QDialog,
@@ -14,99 +11,22 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-from alchemy import get_task, update_task
+# The client lives in jira_client so it can be used without Qt (e.g. by the
+# CLI); re-exported so existing imports from this module keep working
+from jira_client import (  # noqa: F401
+    JiraClient,
+    JiraConfig,
+    SyncCancelled,
+    build_worklog_payload,
+    get_jira_client,
+    invalidate_jira_config,
+    log_work_to_jira,
+)
 from logging_setup import get_logger
 from utils import resource_path
 
 logger = get_logger(__name__)
 
-# Load environment variables
-
-
-class JiraConfig:
-    def __init__(self):
-        env = environs.Env()
-        env_path = resource_path(".env")
-        env.read_env(env_path)
-
-        self.domain = env.str("JIRA_DOMAIN")
-        self.email = env.str("JIRA_EMAIL")
-        self.api_token = env.str("JIRA_API_TOKEN")
-
-        if not all([self.domain, self.email, self.api_token]):
-            raise ValueError("Missing JIRA credentials in .env file")
-
-        self.auth = (self.email, self.api_token)
-        self.headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
-
-
-def log_work_to_jira(task_id, time_spent_hours, jira_key):
-    """
-    Log work to JIRA and store the worklog ID
-
-    Args:
-        task_id: Local task ID
-        time_spent_hours: Time spent in hours
-        jira_key: JIRA issue key (e.g., 'PROJ-123')
-    """
-    try:
-        config = JiraConfig()
-        task = get_task(task_id)
-
-        if not task:
-            raise ValueError(f"Task {task_id} not found")
-
-        # Convert hours to seconds
-        time_spent_seconds = int(time_spent_hours * 3600)
-
-        # Convert the start_date to the user's system timezone
-        start_time = datetime.fromisoformat(task[2])
-        start_time = start_time.astimezone()
-
-        # Prepare the worklog payload
-        payload = {
-            "comment": {
-                "content": [
-                    {
-                        "content": [
-                            {"text": task[1], "type": "text"}  # task name as comment
-                        ],
-                        "type": "paragraph",
-                    }
-                ],
-                "type": "doc",
-                "version": 1,
-            },
-            "started": start_time.strftime("%Y-%m-%dT%H:%M:%S.000%z"),
-            "timeSpentSeconds": time_spent_seconds,
-        }
-
-        # Make the API request
-        url = f"https://{config.domain}/rest/api/3/issue/{jira_key}/worklog"
-        response = requests.post(
-            url, data=json.dumps(payload), headers=config.headers, auth=config.auth
-        )
-
-        if response.status_code != 201:
-            raise Exception(f"Failed to log work: {response.text}")
-
-        # Get the worklog ID from response
-        worklog_data = response.json()
-        worklog_id = worklog_data["id"]
-
-        # Store worklog ID in database
-        update_task(task_id, worklog_id=worklog_id, synced=1)
-
-        logger.info(f"Successfully logged work to JIRA issue {jira_key}")
-        return worklog_id
-
-    except Exception as e:
-        logger.error(f"Error logging work to JIRA: {e}")
-        raise
-
 
 class JiraCredentialsDialog(QDialog):
     def __init__(self, parent=None):
@@ -206,6 +126,7 @@ class JiraCredentialsDialog(QDialog):
                 f.write(f"JIRA_API_TOKEN={api_token}\n")
 
             logger.info(f"Successfully saved JIRA credentials to {env_path}")
+            invalidate_jira_config()
             self.accept()
         except Exception as e:
             logger.error(f"Error saving JIRA credentials: {e}", exc_info=True)
@@ -344,6 +265,7 @@ def setup_jira_credentials():
                     f.write(f'JIRA_EMAIL={credentials["email"]}\n')
                     f.write(f'JIRA_API_TOKEN={credentials["token"]}\n')
                 logger.info(f"Successfully wrote credentials to {env_path}")
+                invalidate_jira_config()
 
                 # Read the new .env file
                 env.read_env(env_path)
@@ -0,0 +1,130 @@
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
+
+from alchemy import get_tasks_by_ids, mark_tasks_synced
+from jira_client import SyncCancelled, get_jira_client
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Only one bulk sync runs at a time, so the outbox drainer and a manual sync
+# never post the same task twice
+_sync_lock = threading.Lock()
+
+
+class SyncResult:
+    """Outcome of a bulk worklog sync"""
+
+    def __init__(self):
+        self.synced = {}  # task_id -> worklog_id
+        self.failed = {}  # task_id -> error message
+        self.skipped = []  # task_ids that were already synced or had no work
+        self.cancelled = False
+
+    @property
+    def total(self):
+        return len(self.synced) + len(self.failed) + len(self.skipped)
+
+
+def sync_worklogs(
+    task_ids,
+    max_workers=None,
+    client=None,
+    progress_callback=None,
+    cancel_event=None,
+):
+    """
+    Post worklogs for many tasks in parallel and record the results
+
+    Worklogs are posted through a bounded thread pool sharing one JiraClient
+    (and therefore one connection pool). Rate limiting responses are retried
+    by the client. The resulting worklog IDs are written back in a single
+    transaction once all requests have finished.
+
+    Args:
+        task_ids: IDs of the tasks to sync
+        max_workers: Number of concurrent requests. Defaults to
+            ``JIRA_SYNC_CONCURRENCY`` from the JIRA config, and is capped at
+            the client's connection pool size
+        client: JiraClient to use. Defaults to the shared client
+        progress_callback: Optional callable ``(task_id, worklog_id, error)``
+            invoked in the calling thread as each task finishes
+        cancel_event: Optional threading.Event; when set, tasks that have not
+            started are dropped and pending retries are aborted
+
+    Returns:
+        SyncResult: IDs of synced, failed and skipped tasks
+    """
+    with _sync_lock:
+        return _sync_worklogs(
+            task_ids, max_workers, client, progress_callback, cancel_event
+        )
+
+
+def _sync_worklogs(task_ids, max_workers, client, progress_callback, cancel_event):
+    client = client or get_jira_client()
+    cancel_event = cancel_event or threading.Event()
+    max_workers = max_workers or client.config.sync_concurrency
+    if max_workers > client.pool_size:
+        # More workers than pooled connections would open a new connection,
+        # with a new TLS handshake, for every request beyond the pool
+        logger.warning(
+            f"Limiting sync to {client.pool_size} workers, the size of the "
+            f"connection pool ({max_workers} requested)"
+        )
+        max_workers = client.pool_size
+    result = SyncResult()
+
+    pending = []
+    for task in get_tasks_by_ids(task_ids):
+        if task.synced or not task.jira_key or not (task.duration or 0) > 0:
+            result.skipped.append(task.task_id)
+            continue
+        pending.append(task)
+
+    def post(task):
+        if cancel_event.is_set():
+            raise SyncCancelled()
+        return client.post_worklog(
+            task.task_name,
+            task.start_time,
+            task.duration,
+            task.jira_key,
+            cancel_event=cancel_event,
+        )
+
+    logger.info(f"Syncing {len(pending)} worklogs with {max_workers} workers")
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(post, task): task for task in pending}
+            for future in as_completed(futures):
+                task = futures[future]
+                worklog_id, error = None, None
+                try:
+                    worklog_id = future.result()
+                    result.synced[task.task_id] = worklog_id
+                except (SyncCancelled, CancelledError):
+                    result.cancelled = True
+                    continue
+                except Exception as e:
+                    error = str(e)
+                    result.failed[task.task_id] = error
+                    logger.error(f"Error syncing task {task.task_id}: {e}")
+
+                if progress_callback:
+                    progress_callback(task.task_id, worklog_id, error)
+
+                if cancel_event.is_set():
+                    result.cancelled = True
+                    for pending_future in futures:
+                        pending_future.cancel()
+    finally:
+        # Persist whatever was posted, even if the sync was cancelled midway
+        mark_tasks_synced(result.synced)
+
+    logger.info(
+        f"Sync finished: {len(result.synced)} synced, "
+        f"{len(result.failed)} failed, {len(result.skipped)} skipped"
+    )
+    return result
@@ -1,30 +1,36 @@
 import os
 import sys
+import time
+from datetime import date
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication
 
-from alchemy import init_db
 from gui.widget import TimeTrackerWidget
-from jira_integration import setup_jira_credentials
 from logging_setup import get_logger
-from time_tracking import pause_task, resume_task, start_task, stop_task
+from scheduler import Scheduler
+from single_instance import claim_instance
 from tray_setup import setup_tray_icon
 from utils import resource_path
 
+# Only what is needed to paint the widget is imported above. The database,
+# JIRA client and sync modules are imported on first use, after the widget is
+# on screen.
+MODULE_LOADED_AT = time.perf_counter()
+
 
 class TimeTrackerApp:
     def __init__(self):
         self.logger = get_logger(__name__)
         self.current_task_id = None
+        # Seconds since main.py finished importing at which each startup phase
+        # finished, in order (see benchmarks/startup.py)
+        self.startup_timings = {}
 
         # Initialize Qt application
         self.app = QApplication(sys.argv)
-
-        # Setup JIRA credentials
-        if not setup_jira_credentials():
-            self.logger.error("JIRA credentials setup failed")
-            sys.exit(1)
+        self.mark_startup_phase("qapplication")
 
         # Set application icon
         icon_path = resource_path("static/icon.png")
@@ -32,11 +38,18 @@ class TimeTrackerApp:
             self.app.setWindowIcon(QIcon(icon_path))
         else:
             self.logger.warning(f"Icon not found at: {icon_path}")
+        self.mark_startup_phase("icon")
+
+        # Single timer driving every periodic job in the app
+        self.scheduler = Scheduler()
 
-        self.widget = TimeTrackerWidget()
+        self.widget = TimeTrackerWidget(scheduler=self.scheduler)
+        self.widget.first_painted.connect(self.handle_first_paint)
+        self.mark_startup_phase("widget")
 
         # Setup system tray
         self.tray_icon = setup_tray_icon(self.app, self.widget)
+        self.mark_startup_phase("tray")
 
         # Connect widget signals
         self.widget.start_clicked.connect(self.handle_start)
@@ -50,51 +63,264 @@ class TimeTrackerApp:
         # Track if we're really quitting
         self.is_quitting = False
 
+        # Posts worklogs of stopped tasks to JIRA in the background; created in
+        # deferred_init once the widget is on screen
+        self.outbox_drainer = None
+        # Accepts commands from the CLI and from later launches; created in
+        # run()
+        self.control_server = None
+        self.initialized = False
+
+    def mark_startup_phase(self, phase):
+        """Record the time a startup phase finished"""
+        self.startup_timings[phase] = time.perf_counter() - MODULE_LOADED_AT
+
+    def handle_first_paint(self):
+        self.mark_startup_phase("first_paint")
+        self.logger.info(
+            f"Time to first paint: {self.startup_timings['first_paint'] * 1000:.0f} ms"
+        )
+        # Let the paint reach the screen before doing the remaining work
+        QTimer.singleShot(0, self.deferred_init)
+
+    def deferred_init(self):
+        """
+        Finish startup once the widget has been shown
+
+        Checks the JIRA credentials, initializes the database and starts the
+        worklog outbox. Runs from the event loop after the widget's first
+        paint, so none of it delays the widget appearing.
+        """
+        if self.initialized:
+            return
+        self.initialized = True
+
+        from alchemy import init_db
+        from jira_integration import setup_jira_credentials
+        from outbox import OutboxDrainer
+
+        self.mark_startup_phase("deferred_imports")
+
+        # Setup JIRA credentials
+        if not setup_jira_credentials():
+            self.logger.error("JIRA credentials setup failed")
+            self.app.exit(1)
+            return
+        self.mark_startup_phase("jira_credentials")
+
+        # Initialize database
+        init_db()
+        self.mark_startup_phase("init_db")
+
+        self.adopt_running_task()
+        self.register_control_commands()
+
+        # Start flushing queued worklogs, including any left from a previous
+        # run; polled by the scheduler rather than waking up on its own
+        self.outbox_drainer = OutboxDrainer(poll_interval=None)
+        self.outbox_drainer.start()
+        self.scheduler.schedule("outbox_sync", 5 * 60 * 1000, self.outbox_drainer.wake)
+
+        self.mark_startup_phase("deferred_init")
+        self.logger.info(f"Startup timings (seconds): {self.startup_timings}")
+
     def handle_start(self):
         try:
             task_name, ticket_number = self.widget.get_task_and_ticket()
             if task_name == "Select a task":
                 return
-
-            # Check if there's a paused task
-            if self.current_task_id:
-                # Resume existing task
-                resume_task(self.current_task_id)
-            else:
-                # Start new task
-                self.current_task_id = start_task(task_name, jira_key=ticket_number)
-
-            self.widget.set_task_name(task_name)
-            self.widget.update_button_states(task_active=True)
-            self.widget.start_timer()
-            self.logger.info(f"Started/Resumed task: {task_name}")
+            self.start_or_resume(task_name, ticket_number)
         except Exception as e:
             self.logger.error(f"Error starting/resuming task: {e}")
 
+    def start_or_resume(self, task_name, jira_key):
+        """Resume the paused task, or start a new one; returns the task ID"""
+        from alchemy import get_task
+        from time_tracking import resume_task, start_task
+
+        # Check if there's a paused task
+        accumulated_hours = 0
+        if self.current_task_id:
+            # Resume existing task, continuing from its recorded duration
+            resume_task(self.current_task_id)
+            task = get_task(self.current_task_id)
+            task_name, accumulated_hours = task[1], task[4] or 0
+        else:
+            # Start new task
+            self.current_task_id = start_task(task_name, jira_key=jira_key)
+
+        self.widget.set_task_name(task_name)
+        self.widget.update_button_states(task_active=True)
+        self.widget.start_timer(accumulated_seconds=accumulated_hours * 3600)
+        self.logger.info(f"Started/Resumed task: {task_name}")
+        return self.current_task_id
+
     def handle_pause(self):
         try:
             if self.current_task_id:
-                duration = pause_task(self.current_task_id)
-                self.widget.update_button_states(task_active=False, task_paused=True)
-                self.widget.pause_timer()  # Pause the timer
-                self.logger.info(f"Task paused. Duration: {duration:.2f} hours")
+                self.pause_current()
         except Exception as e:
             self.logger.error(f"Error pausing task: {e}")
 
+    def pause_current(self):
+        """Pause the current task and return its duration"""
+        from time_tracking import pause_task
+
+        duration = pause_task(self.current_task_id)
+        self.widget.update_button_states(task_active=False, task_paused=True)
+        self.widget.pause_timer()  # Pause the timer
+        self.logger.info(f"Task paused. Duration: {duration:.2f} hours")
+        return duration
+
     def handle_stop(self):
         try:
             if self.current_task_id:
-                total_duration = stop_task(self.current_task_id)
-                self.current_task_id = None
-                self.widget.set_task_name("No active task")
-                self.widget.update_button_states(task_active=False)
-                self.widget.stop_timer()  # Stop and reset the timer
-                self.logger.info(
-                    f"Task stopped. Total duration: {total_duration:.2f} hours"
-                )
+                self.stop_current()
         except Exception as e:
             self.logger.error(f"Error stopping task: {e}")
 
+    def stop_current(self):
+        """Stop the current task and return its total duration"""
+        from time_tracking import stop_task
+
+        total_duration = stop_task(self.current_task_id)
+        self.current_task_id = None
+        self.widget.set_task_name("No active task")
+        self.widget.update_button_states(task_active=False)
+        self.widget.stop_timer()  # Stop and reset the timer
+        if self.outbox_drainer:
+            self.outbox_drainer.wake()
+        self.logger.info(f"Task stopped. Total duration: {total_duration:.2f} hours")
+        return total_duration
+
+    def adopt_running_task(self):
+        """Show a task left running by the CLI while the app was closed"""
+        from time_tracking import get_status
+
+        task = get_status()["task"]
+        if task is None:
+            return
+        self.current_task_id = task["task_id"]
+        self.widget.jira_ticket.setText(task["jira_key"] or "")
+        self.widget.set_task_name(task["task_name"])
+        self.widget.update_button_states(task_active=True)
+        self.widget.start_timer(accumulated_seconds=task["elapsed"] * 3600)
+        self.logger.info(f"Continuing running task {self.current_task_id}")
+
+    def start_control_server(self):
+        """
+        Let a second launch reach this instance
+
+        Started before the credentials check and database setup, so a second
+        launch is handed over even while the first run's credentials dialog
+        is open. Only ``activate`` is available until register_control_commands
+        runs at the end of initialization.
+        """
+        from control_server import ControlServer
+
+        self.control_server = ControlServer(self.app)
+        self.control_server.register("activate", self.control_activate)
+        self.control_server.start()
+
+    def register_control_commands(self):
+        """Let the CLI and other local clients drive this instance"""
+        self.control_server.register("start", self.control_start)
+        self.control_server.register("pause", self.control_pause)
+        self.control_server.register("resume", self.control_resume)
+        self.control_server.register("stop", self.control_stop)
+        self.control_server.register("status", self.control_status)
+        self.control_server.register("sync", self.control_sync)
+
+    def check_current_task(self, task_id=None, running=None):
+        """
+        Raise ValueError unless there is a current task matching a control
+        request
+
+        Args:
+            task_id: Task ID the client expects to be current, if any
+            running: Whether the task must be running (True) or paused (False)
+        """
+        if not self.current_task_id:
+            raise ValueError("No task is running or paused")
+        if task_id is not None and task_id != self.current_task_id:
+            raise ValueError(
+                f"Task {task_id} is not the current task ({self.current_task_id})"
+            )
+        if running is not None and self.widget.is_timer_running() != running:
+            state = "running" if self.widget.is_timer_running() else "paused"
+            raise ValueError(f"Task {self.current_task_id} is {state}")
+
+    def control_start(self, task_name, jira_key=None):
+        from time_tracking import describe_task
+
+        if self.current_task_id:
+            state = "running" if self.widget.is_timer_running() else "paused"
+            raise ValueError(f"Task {self.current_task_id} is {state}; stop it first")
+        self.widget.jira_ticket.setText(jira_key or "")
+        return describe_task(self.start_or_resume(task_name, jira_key))
+
+    def control_pause(self):
+        from time_tracking import describe_task
+
+        self.check_current_task(running=True)
+        task_id = self.current_task_id
+        self.pause_current()
+        return describe_task(task_id)
+
+    def control_resume(self, task_id=None):
+        from time_tracking import describe_task
+
+        self.check_current_task(task_id, running=False)
+        return describe_task(self.start_or_resume(None, None))
+
+    def control_stop(self, task_id=None):
+        from time_tracking import describe_task
+
+        self.check_current_task(task_id)
+        task_id = self.current_task_id
+        self.stop_current()
+        task = describe_task(task_id)
+        task["queued"] = bool(task["jira_key"])
+        return task
+
+    def control_status(self):
+        """Like time_tracking.get_status, but the current task comes from the
+        widget so only today's total and the outbox size are queried"""
+        from alchemy import get_outbox_size, get_total_duration_for_range
+
+        today = date.today()
+        # Rollups only include closed segments; running time is added below
+        today_hours = get_total_duration_for_range(today, today)
+        task = None
+        if self.current_task_id:
+            task = {
+                "task_id": self.current_task_id,
+                "task_name": self.widget.task_label.text(),
+                "jira_key": self.widget.jira_ticket.text() or None,
+                "duration": self.widget.accumulated_time / 3600,
+                "running": self.widget.is_timer_running(),
+                "elapsed": self.widget.elapsed_time / 3600,
+            }
+            if task["running"]:
+                today_hours += task["elapsed"] - task["duration"]
+
+        return {"task": task, "today": today_hours, "queued": get_outbox_size()}
+
+    def control_sync(self):
+        from alchemy import get_outbox_size
+
+        if self.outbox_drainer:
+            self.outbox_drainer.wake()
+        return {"queued": get_outbox_size(), "background": True}
+
+    def control_activate(self, argv=None):
+        """Bring the widget to the front when the app is launched again"""
+        self.widget.showNormal()
+        self.widget.raise_()
+        self.widget.activateWindow()
+        self.logger.info(f"Activated by a second launch with arguments {argv}")
+        return {"task_id": self.current_task_id}
+
     def handle_expand(self):
         """Handle expand button click"""
         try:
@@ -105,6 +331,11 @@ class TimeTrackerApp:
     def cleanup(self):
         """Clean up resources before quitting"""
         self.is_quitting = True
+        if self.control_server:
+            self.control_server.stop()
+        if self.outbox_drainer:
+            self.outbox_drainer.stop()
+        self.logger.info(f"Scheduler stats: {self.scheduler.stats()}")
         if self.widget:
             if self.widget.main_window:
                 self.widget.main_window.close()
@@ -118,19 +349,32 @@ class TimeTrackerApp:
         self.app.quit()
 
     def run(self):
-        # Initialize database
-        init_db()
-
-        # Show the widget
+        # Show the widget first; initialization continues after the first
+        # paint, or after a second if the widget is never painted
         self.widget.show()
+        self.start_control_server()
+        self.mark_startup_phase("control_server")
+        QTimer.singleShot(1000, self.deferred_init)
 
         # Start the application
         return self.app.exec()
 
 
 def main():
+    # A second launch hands its arguments to the running app and exits before
+    # any Qt or database setup
+    try:
+        instance_lock = claim_instance(sys.argv[1:])
+    except Exception as e:
+        get_logger(__name__).error(f"Error checking for a running instance: {e}")
+        sys.exit(1)
+    if instance_lock is None:
+        sys.exit(0)
+
     app = TimeTrackerApp()
-    sys.exit(app.run())
+    exit_code = app.run()
+    instance_lock.release()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -1,28 +1,154 @@
 import logging
 import os
 import platform
+import queue
+import subprocess
+import threading
+import time
 from datetime import timedelta
 
-from plyer import notification
-
 # Add imports for sound
 if platform.system() == "Windows":
     import winsound
-elif platform.system() in ["Darwin", "Linux"]:
-    from subprocess import call
-
-    # Add specific import for DBus notifications (for KDE)
-    try:
-        import dbus
 
-        DBUS_AVAILABLE = True
-    except ImportError:
-        DBUS_AVAILABLE = False
+# DBus (for Linux notifications) and plyer are imported on first use so they
+# stay off the startup path; see load_dbus()
+dbus = None
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
+def load_dbus():
+    """
+    Import the dbus module on first use
+
+    Returns:
+        module: The dbus module, or None if it is unavailable on this system
+    """
+    global dbus
+    if dbus is None:
+        dbus = False
+        if platform.system() in ["Darwin", "Linux"]:
+            try:
+                import dbus as dbus_module
+
+                dbus = dbus_module
+            except ImportError:
+                logger.debug("dbus module not available")
+    return dbus or None
+
+
+# Token bucket settings per notification category: (burst size, seconds to
+# earn one more notification). Categories not listed use DEFAULT_RATE_LIMIT.
+RATE_LIMITS = {
+    "idle_reminder": (1, 300),
+    "timer_running": (2, 900),
+}
+DEFAULT_RATE_LIMIT = (5, 60)
+
+# last_sent entries older than this are discarded
+LAST_SENT_TTL = 12 * 3600
+
+
+class TokenBucket:
+    """Simple token bucket used to rate limit a notification category"""
+
+    def __init__(self, capacity, refill_seconds):
+        self.capacity = capacity
+        self.refill_seconds = refill_seconds
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def consume(self):
+        """Take a token if one is available; returns False when rate limited"""
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed / self.refill_seconds)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+def spawn(args):
+    """Start a helper process without waiting for it to finish"""
+    return subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+class NotificationDispatcher(threading.Thread):
+    """
+    Background worker that delivers notifications off the GUI thread.
+
+    Jobs are queued in a bounded queue and executed one at a time; when the
+    queue is full new notifications are dropped rather than blocking the
+    caller. The worker also owns the DBus notification proxy so the session
+    bus connection is reused across notifications.
+    """
+
+    def __init__(self, max_queue=20):
+        super().__init__(name="NotificationDispatcher", daemon=True)
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._notify_interface = None
+        # DBus IDs of the notifications on screen, keyed by (app, category),
+        # so a new notification replaces the previous one of its category
+        self.replace_ids = {}
+
+    def submit(self, job):
+        """Queue a callable; returns False if the queue is full"""
+        try:
+            self._queue.put_nowait(job)
+            return True
+        except queue.Full:
+            logger.warning("Notification queue full, dropping notification")
+            return False
+
+    def run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Error dispatching notification: {e}")
+            finally:
+                self._queue.task_done()
+
+    def stop(self):
+        """Stop the worker once already queued notifications are sent"""
+        self._queue.put(None)
+
+    def notify_interface(self):
+        """Return the cached org.freedesktop.Notifications DBus interface"""
+        if self._notify_interface is None:
+            item = "org.freedesktop.Notifications"
+            self._notify_interface = dbus.Interface(
+                dbus.SessionBus().get_object(item, "/" + item.replace(".", "/")),
+                item,
+            )
+        return self._notify_interface
+
+    def reset_notify_interface(self):
+        """Drop the cached DBus interface, e.g. after the bus went away"""
+        self._notify_interface = None
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher():
+    """Return the shared notification dispatcher, starting it on first use"""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = NotificationDispatcher()
+            _dispatcher.start()
+        return _dispatcher
+
+
 class NotificationManager:
     """
     Cross-platform notification manager for time tracking notifications.
@@ -35,8 +161,10 @@ class NotificationManager:
         self.system = platform.system()
         self.enabled = True
         self.sound_enabled = True
-        # Track notification times to prevent spam
+        # Track notification times to prevent spam; keyed by notification type
+        # and holding (task identifier, elapsed seconds, monotonic time)
         self.last_sent = {}
+        self.rate_limits = {}  # category -> TokenBucket
         self.widget = None  # Reference to the TimeTrackerWidget
         logger.info(f"Notification system initialized for {self.system}")
 
@@ -68,24 +196,25 @@ class NotificationManager:
 
         try:
             if self.system == "Windows":
+                flags = winsound.SND_ALIAS | winsound.SND_ASYNC
                 if sound_type == "warning":
-                    winsound.PlaySound("SystemHand", winsound.SND_ALIAS)
+                    winsound.PlaySound("SystemHand", flags)
                 elif sound_type == "error":
-                    winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
+                    winsound.PlaySound("SystemExclamation", flags)
                 else:
-                    winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS)
+                    winsound.PlaySound("SystemAsterisk", flags)
 
             elif self.system == "Darwin":  # macOS
                 sound_name = "Ping" if sound_type == "default" else "Basso"
-                os.system(f"afplay /System/Library/Sounds/{sound_name}.aiff")
+                spawn(["afplay", f"/System/Library/Sounds/{sound_name}.aiff"])
 
             elif self.system == "Linux":
                 # Use paplay if available (PulseAudio), otherwise fall back to aplay
                 sound_file = "/usr/share/sounds/freedesktop/stereo/message.oga"
                 if os.path.exists("/usr/bin/paplay"):
-                    call(["paplay", sound_file])
+                    spawn(["paplay", sound_file])
                 else:
-                    call(["aplay", "-q", sound_file])
+                    spawn(["aplay", "-q", sound_file])
 
         except Exception as e:
             logger.error(f"Failed to play notification sound: {e}")
@@ -135,33 +264,40 @@ class NotificationManager:
             logger.warning(f"Failed to send Windows notification: {e}")
             return False
 
-    def _send_kde_notification(self, title, message, timeout=10, priority="normal"):
+    def _send_dbus_notification(
+        self, title, message, timeout=10, priority="normal", category=None
+    ):
         """
-        Send a notification specifically for KDE desktop environment using DBus
+        Send a notification through the org.freedesktop.Notifications DBus
+        service, which KDE, GNOME, Unity, Cinnamon and most other Linux
+        desktops provide
+
+        A notification replaces the one previously shown for the same category
+        instead of stacking up next to it.
 
         Args:
             title: Notification title
             message: Notification message
             timeout: How long the notification should remain visible (seconds)
             priority: Priority level ("low", "normal", "high")
+            category: Optional category used for coalescing
 
         Returns:
             bool: True if the notification was sent successfully, False otherwise
         """
-        if not DBUS_AVAILABLE:
-            logger.debug("DBus not available, can't send KDE notification")
+        if load_dbus() is None:
+            logger.debug("DBus not available, can't send DBus notification")
             return False
 
         try:
             # Convert timeout to milliseconds
             timeout_ms = int(timeout * 1000)
             
-            # Set up DBus interface
-            item = "org.freedesktop.Notifications"
-            notify_interface = dbus.Interface(
-                dbus.SessionBus().get_object(item, "/"+item.replace(".", "/")),
-                item
-            )
+            # Reuse the dispatcher's DBus interface
+            dispatcher = get_dispatcher()
+            notify_interface = dispatcher.notify_interface()
+            replace_key = (self.app_name, category)
+            replaces_id = dispatcher.replace_ids.get(replace_key, 0) if category else 0
 
             # Map priority to urgency level (0=low, 1=normal, 2=critical)
             urgency = 1  # default normal
@@ -176,9 +312,9 @@ class NotificationManager:
             }
 
             # Send notification
-            notify_interface.Notify(
+            notification_id = notify_interface.Notify(
                 self.app_name,  # App name
-                0,              # Replaces ID
+                replaces_id,    # Replaces ID
                 "",            # Icon (empty for default)
                 title,         # Summary/title
                 message,       # Body/message
@@ -186,16 +322,19 @@ class NotificationManager:
                 hints,        # Hints dictionary
                 timeout_ms    # Timeout in milliseconds
             )
+            if category:
+                dispatcher.replace_ids[replace_key] = int(notification_id)
 
             # Play sound based on priority
             sound_type = "warning" if priority == "high" else "default"
             self.play_sound(sound_type)
 
-            logger.debug(f"KDE notification sent via DBus: {title}")
+            logger.debug(f"Notification sent via DBus: {title}")
             return True
 
         except Exception as e:
-            logger.warning(f"Failed to send KDE notification via DBus: {e}")
+            logger.warning(f"Failed to send notification via DBus: {e}")
+            get_dispatcher().reset_notify_interface()
             return False
 
     def _send_unity_notification(self, title, message, timeout=10, priority="normal"):
@@ -213,8 +352,6 @@ class NotificationManager:
         """
         try:
             # Unity uses the notify-send command
-            import subprocess
-
             full_title = f"{self.app_name}: {title}"
 
             # Map priority to urgency levels
@@ -224,8 +361,8 @@ class NotificationManager:
             elif priority == "low":
                 urgency = "low"
 
-            # Use notify-send command
-            subprocess.run(
+            # Use notify-send command without waiting for it to exit
+            spawn(
                 [
                     "notify-send",
                     full_title,
@@ -234,8 +371,7 @@ class NotificationManager:
                     str(int(timeout * 1000)),  # Convert to milliseconds
                     "-u",
                     urgency,
-                ],
-                check=True,
+                ]
             )
 
             # Play sound based on priority
@@ -252,31 +388,70 @@ class NotificationManager:
         """Set the reference to the TimeTrackerWidget"""
         self.widget = widget
 
-    def send_notification(self, title, message, timeout=10, priority="normal"):
+    def allow_notification(self, category):
+        """Return False if the category has exceeded its rate limit"""
+        bucket = self.rate_limits.get(category)
+        if bucket is None:
+            capacity, refill_seconds = RATE_LIMITS.get(category, DEFAULT_RATE_LIMIT)
+            bucket = self.rate_limits[category] = TokenBucket(capacity, refill_seconds)
+        return bucket.consume()
+
+    def send_notification(
+        self, title, message, timeout=10, priority="normal", category=None
+    ):
         """
         Send a desktop notification
 
+        Delivery happens on the background dispatcher thread, so this returns
+        immediately without waiting for notification tools or sounds.
+
         Args:
             title: Notification title
             message: Notification message
             timeout: How long the notification should remain visible (seconds)
             priority: Priority level ("low", "normal", "high")
+            category: Optional category; notifications of a category are rate
+                limited and replace each other on screen where supported
+
+        Returns:
+            bool: True if the notification was queued for delivery
         """
         if not self.enabled:
-            return
+            return False
+
+        if category and not self.allow_notification(category):
+            logger.debug(f"Rate limited {category} notification: {title}")
+            return False
 
+        queued = get_dispatcher().submit(
+            lambda: self._dispatch_notification(
+                title, message, timeout, priority, category
+            )
+        )
+
+        # Grab attention if widget is available and priority is high
+        if self.widget and priority == "high":
+            if hasattr(self.widget, "grab_attention"):
+                self.widget.grab_attention()
+
+        return queued
+
+    def _dispatch_notification(self, title, message, timeout, priority, category):
+        """Deliver a notification; runs on the dispatcher thread"""
         try:
             # Detect desktop environment for Linux
             if self.system == "Linux":
                 desktop_env = os.environ.get("XDG_CURRENT_DESKTOP", "").upper()
 
-                # Try KDE-specific notification
-                if desktop_env == "KDE":
-                    if self._send_kde_notification(title, message, timeout, priority):
-                        return
+                # Prefer DBus wherever it is available: unlike notify-send
+                # it can replace the previous notification of a category
+                if self._send_dbus_notification(
+                    title, message, timeout, priority, category
+                ):
+                    return
 
-                # Try Unity-specific notification
-                elif desktop_env in ["UNITY", "GNOME", "X-CINNAMON"]:
+                # Fall back to notify-send on desktops that ship it
+                if desktop_env in ["UNITY", "GNOME", "X-CINNAMON"]:
                     if self._send_unity_notification(title, message, timeout, priority):
                         return
 
@@ -286,6 +461,8 @@ class NotificationManager:
                     return
 
             # Fall back to plyer for other platforms or if specific implementations fail
+            from plyer import notification
+
             notification.notify(
                 title=f"{self.app_name}: {title}",
                 message=message,
@@ -299,10 +476,6 @@ class NotificationManager:
 
             logger.debug(f"Notification sent via plyer: {title}")
 
-            # Grab attention if widget is available and priority is high
-            if self.widget and priority == "high":
-                self.widget.grab_attention()
-
         except Exception as e:
             logger.error(f"Failed to send notification: {e}")
 
@@ -330,24 +503,52 @@ class NotificationManager:
         if hours >= 1:
             # High priority notification for timers running > 1 hour
             # Only send once per 30 minutes after the first hour
-            notification_key = f"long_timer_{task_identifier}"
-            last_time = self.last_sent.get(notification_key, 0)
+            notification_key = "long_timer"
+            last_time = self.last_sent_elapsed(notification_key, task_identifier)
 
             if elapsed_time - last_time >= 1800:  # 30 minutes in seconds
                 title = "Timer Running for a Long Time"
                 message = f"Task '{task_identifier}' has been running for {time_str}"
-                self.send_notification(title, message, priority="high")
-                self.last_sent[notification_key] = elapsed_time
+                if self.send_notification(
+                    title, message, priority="high", category="timer_running"
+                ):
+                    self.mark_sent(notification_key, task_identifier, elapsed_time)
         else:
             # Low priority periodic notification (every 15 minutes)
-            notification_key = f"periodic_{task_identifier}"
-            last_time = self.last_sent.get(notification_key, 0)
+            notification_key = "periodic"
+            last_time = self.last_sent_elapsed(notification_key, task_identifier)
 
             if elapsed_time - last_time >= 900:  # 15 minutes in seconds
                 title = "Timer Running"
                 message = f"Task '{task_identifier}' has been running for {time_str}"
-                self.send_notification(title, message, priority="low")
-                self.last_sent[notification_key] = elapsed_time
+                if self.send_notification(
+                    title, message, priority="low", category="timer_running"
+                ):
+                    self.mark_sent(notification_key, task_identifier, elapsed_time)
+
+    def last_sent_elapsed(self, notification_key, task_identifier):
+        """
+        Return the elapsed time at which a notification type was last sent for
+        the task, or 0 if it was last sent for another task (or never)
+        """
+        self.evict_stale_last_sent()
+        entry = self.last_sent.get(notification_key)
+        if entry is None or entry[0] != task_identifier:
+            return 0
+        return entry[1]
+
+    def mark_sent(self, notification_key, task_identifier, elapsed_time):
+        self.last_sent[notification_key] = (
+            task_identifier,
+            elapsed_time,
+            time.monotonic(),
+        )
+
+    def evict_stale_last_sent(self):
+        """Drop last_sent entries older than LAST_SENT_TTL"""
+        cutoff = time.monotonic() - LAST_SENT_TTL
+        for key in [k for k, entry in self.last_sent.items() if entry[2] < cutoff]:
+            del self.last_sent[key]
 
     def notify_timer_completed(self, task_name, elapsed_time, jira_key=None):
         """
@@ -378,4 +579,6 @@ class NotificationManager:
         title = "Timer Completed"
         message = f"You spent {time_str} on '{task_identifier}'"
 
-        self.send_notification(title, message, priority="normal")
+        self.send_notification(
+            title, message, priority="normal", category="timer_completed"
+        )
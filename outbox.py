@@ -0,0 +1,132 @@
+import threading
+from datetime import datetime, timedelta
+
+from alchemy import (
+    get_due_outbox_entries,
+    get_next_outbox_attempt,
+    remove_outbox_entries,
+    reschedule_outbox_entries,
+)
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+class OutboxDrainer(threading.Thread):
+    """
+    Background thread that posts queued worklogs to JIRA.
+
+    Stopped tasks with a JIRA key are queued in the ``worklog_outbox`` table.
+    The drainer sleeps until the earliest entry is due (or until ``wake`` is
+    called), syncs all due entries, and reschedules failures with exponential
+    backoff. Because the queue lives in the database it survives restarts.
+
+    With ``poll_interval=None`` an empty outbox is never polled; the owner is
+    expected to call ``wake`` (e.g. from the app scheduler) instead.
+    """
+
+    def __init__(
+        self,
+        poll_interval=300,
+        base_backoff=30,
+        max_backoff=3600,
+        batch_size=100,
+    ):
+        super().__init__(name="OutboxDrainer", daemon=True)
+        self.poll_interval = poll_interval
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.batch_size = batch_size
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+
+    def wake(self):
+        """Drain the outbox now instead of waiting for the next due entry"""
+        self._wake_event.set()
+
+    def stop(self):
+        """Stop the drainer thread"""
+        self._stop_event.set()
+        self._wake_event.set()
+
+    def run(self):
+        logger.info("Outbox drainer started")
+        while not self._stop_event.is_set():
+            try:
+                self.drain()
+            except Exception as e:
+                logger.error(f"Error draining worklog outbox: {e}")
+
+            self._wake_event.wait(self._seconds_until_next_attempt())
+            self._wake_event.clear()
+        logger.info("Outbox drainer stopped")
+
+    def _seconds_until_next_attempt(self):
+        try:
+            next_attempt = get_next_outbox_attempt()
+        except Exception:
+            return self.poll_interval
+        if next_attempt is None:
+            return self.poll_interval
+        delay = max((next_attempt - datetime.now()).total_seconds(), 0)
+        if self.poll_interval is None:
+            return delay
+        return min(delay, self.poll_interval)
+
+    def backoff(self, attempts):
+        """Return the delay in seconds before retry number ``attempts``"""
+        return min(self.base_backoff * 2 ** (attempts - 1), self.max_backoff)
+
+    def drain(self):
+        """Sync all due outbox entries once; returns the number synced"""
+        # Imported here so the JIRA client is only loaded once there is work
+        from jira_sync import sync_worklogs
+
+        synced_total = 0
+        while not self._stop_event.is_set():
+            entries = get_due_outbox_entries(limit=self.batch_size)
+            if not entries:
+                break
+
+            task_ids = [entry.task_id for entry in entries]
+            try:
+                result = sync_worklogs(task_ids, cancel_event=self._stop_event)
+                failed = result.failed
+            except Exception as e:
+                # Typically missing credentials or no network at all
+                logger.warning(f"Outbox sync failed: {e}")
+                result = None
+                failed = {task_id: str(e) for task_id in task_ids}
+
+            # Synced, skipped (already synced, no key) and deleted tasks leave
+            # the outbox; failures stay queued with a later attempt time
+            done = [task_id for task_id in task_ids if task_id not in failed]
+            if result is not None and result.cancelled:
+                done = list(result.synced) + result.skipped
+            remove_outbox_entries(done)
+
+            now = datetime.now()
+            retries = []
+            for entry in entries:
+                if entry.task_id not in failed:
+                    continue
+                attempts = entry.attempts + 1
+                retries.append(
+                    {
+                        "outbox_id": entry.outbox_id,
+                        "attempts": attempts,
+                        "next_attempt_at": now
+                        + timedelta(seconds=self.backoff(attempts)),
+                        "last_error": failed[entry.task_id],
+                    }
+                )
+            reschedule_outbox_entries(retries)
+
+            if result is not None:
+                synced_total += len(result.synced)
+            if retries or (result is not None and result.cancelled):
+                break
+
+        if synced_total:
+            logger.info(f"Outbox drainer synced {synced_total} worklogs")
+        return synced_total
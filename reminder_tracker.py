@@ -1,8 +1,7 @@
-import time
-
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal
 
 from notification import NotificationManager
+from scheduler import Scheduler
 
 
 class TimerReminderTracker(QObject):
@@ -13,26 +12,27 @@ class TimerReminderTracker(QObject):
 
     reminder_triggered = pyqtSignal()  # Signal emitted when reminder is sent
 
-    def __init__(self, parent=None, reminder_interval=60):  # 300 seconds = 5 minutes
+    def __init__(self, parent=None, reminder_interval=60, scheduler=None):
         super().__init__(parent)
         self.notification_manager = NotificationManager()
         self.reminder_interval = reminder_interval
         self.is_running = False
         self.timer_widget = parent
 
-        # Setup timer for periodic reminder checks
-        self.reminder_timer = QTimer(self)
-        self.reminder_timer.timeout.connect(self.check_timer_status)
+        # Periodic reminder checks run as a job on the shared scheduler
+        self.scheduler = scheduler or Scheduler(self)
 
     def start(self):
         """Start the reminder tracker"""
         self.is_running = True
-        self.reminder_timer.start(self.reminder_interval * 1000)  # Convert to ms
+        self.scheduler.schedule(
+            "idle_reminder", self.reminder_interval * 1000, self.check_timer_status
+        )  # Convert to ms
 
     def stop(self):
         """Stop the reminder tracker"""
         self.is_running = False
-        self.reminder_timer.stop()
+        self.scheduler.cancel("idle_reminder")
 
     def check_timer_status(self):
         """Check if user has an active timer and send reminder if not"""
@@ -41,8 +41,8 @@ class TimerReminderTracker(QObject):
 
         # Check if the timer in the parent widget is active
         if (
-            hasattr(self.timer_widget, "update_timer")
-            and not self.timer_widget.update_timer.isActive()
+            hasattr(self.timer_widget, "is_timer_running")
+            and not self.timer_widget.is_timer_running()
         ):
             self.send_reminder()
 
@@ -52,5 +52,6 @@ class TimerReminderTracker(QObject):
             "Time Tracking Reminder",
             "You're not tracking any activity. Don't forget to log your time!",
             timeout=10,
+            category="idle_reminder",
         )
         self.reminder_triggered.emit()
@@ -0,0 +1,122 @@
+import argparse
+from datetime import date
+
+from sqlalchemy import func
+
+from alchemy import DailyRollup, Session, init_db, rebuild_daily_rollups
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# SQL expressions mapping a date column to the first day of its period.
+# Weeks start on Monday: 'weekday 0' moves forward to Sunday (or stays on it)
+# and '-6 days' goes back to that week's Monday.
+PERIODS = {
+    "day": lambda column: func.date(column),
+    "week": lambda column: func.date(column, "weekday 0", "-6 days"),
+    "month": lambda column: func.strftime("%Y-%m-01", column),
+}
+
+# Columns a report can be grouped by
+DIMENSIONS = {
+    "jira_key": DailyRollup.jira_key,
+    "task_name": DailyRollup.task_name,
+}
+
+
+def get_totals(start_date, end_date, group_by=("jira_key",), period=None):
+    """
+    Return time totals for tasks created between two dates (both inclusive)
+
+    Totals are summed from the pre-aggregated ``daily_rollups`` table with a
+    single GROUP BY query, so the cost depends on the number of days in the
+    range rather than the number of tasks.
+
+    Args:
+        start_date: First date of the range
+        end_date: Last date of the range
+        group_by: Columns to group by, any of ``DIMENSIONS``
+        period: Optional "day", "week" or "month" to also group by the
+            period each task was created in
+
+    Returns:
+        list: One dict per group with the group values (``period`` as a date
+        when requested), ``total_hours``, ``synced_hours`` and ``task_count``,
+        ordered by period and then by total hours, largest first
+    """
+    unknown = [name for name in group_by if name not in DIMENSIONS]
+    if unknown:
+        raise ValueError(f"Unknown report grouping: {', '.join(unknown)}")
+    if period is not None and period not in PERIODS:
+        raise ValueError(f"Unknown report period: {period}")
+
+    try:
+        session = Session()
+
+        columns = [DIMENSIONS[name].label(name) for name in group_by]
+        if period is not None:
+            columns.insert(0, PERIODS[period](DailyRollup.day).label("period"))
+
+        total_hours = func.coalesce(func.sum(DailyRollup.total_duration), 0.0)
+        query = (
+            session.query(
+                *columns,
+                total_hours.label("total_hours"),
+                func.coalesce(func.sum(DailyRollup.synced_duration), 0.0).label(
+                    "synced_hours"
+                ),
+                func.coalesce(func.sum(DailyRollup.task_count), 0).label(
+                    "task_count"
+                ),
+            )
+            .filter(DailyRollup.day >= start_date, DailyRollup.day <= end_date)
+            .group_by(*[column.name for column in columns])
+        )
+        order_by = [total_hours.desc()]
+        if period is not None:
+            order_by.insert(0, "period")
+        rows = query.order_by(*order_by).all()
+        session.close()
+
+        results = []
+        for row in rows:
+            result = row._asdict()
+            if period is not None:
+                result["period"] = date.fromisoformat(result["period"])
+            results.append(result)
+        return results
+    except Exception as e:
+        logger.error(f"Error computing totals for {start_date} - {end_date}: {e}")
+        raise
+
+
+def totals_by_jira_key(start_date, end_date):
+    """Return totals per JIRA key; tasks without a key are grouped under None"""
+    return get_totals(start_date, end_date, group_by=("jira_key",))
+
+
+def totals_by_task_name(start_date, end_date):
+    """Return totals per task name (the task type picked in the widget)"""
+    return get_totals(start_date, end_date, group_by=("task_name",))
+
+
+def totals_by_period(start_date, end_date, period="day"):
+    """Return totals per day, week or month"""
+    return get_totals(start_date, end_date, group_by=(), period=period)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time tracker reporting tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser(
+        "rebuild-rollups", help="Recompute the daily rollups from all tasks"
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "rebuild-rollups":
+        init_db()
+        print(f"Rebuilt {rebuild_daily_rollups()} daily rollup rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import time
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+class Scheduler(QObject):
+    """
+    Runs periodic jobs from a single timer.
+
+    Instead of one QTimer per job, the scheduler keeps the next deadline of
+    every job and arms one single-shot timer for the earliest of them. Jobs
+    that fall due within ``coalesce_ms`` of each other run in the same wakeup,
+    so an idle app only wakes when something actually has to happen.
+    """
+
+    def __init__(self, parent=None, coalesce_ms=100):
+        super().__init__(parent)
+        self.coalesce_ms = coalesce_ms
+        self._jobs = {}  # name -> {"interval", "callback", "next_due", "runs"}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._timer.timeout.connect(self._run_due_jobs)
+        self.wakeups = 0
+        self.started_at = time.monotonic()
+
+    @staticmethod
+    def _now_ms():
+        return time.monotonic() * 1000
+
+    def schedule(self, name, interval_ms, callback, delay_ms=None):
+        """
+        Run ``callback`` every ``interval_ms``, replacing any job with the name
+
+        Args:
+            name: Unique job name
+            interval_ms: Period between runs in milliseconds
+            callback: Callable invoked without arguments
+            delay_ms: Delay before the first run. Defaults to ``interval_ms``
+        """
+        delay_ms = interval_ms if delay_ms is None else delay_ms
+        self._jobs[name] = {
+            "interval": interval_ms,
+            "callback": callback,
+            "next_due": self._now_ms() + delay_ms,
+            "runs": 0,
+        }
+        self._rearm()
+
+    def cancel(self, name):
+        """Remove a job; does nothing if it isn't scheduled"""
+        if self._jobs.pop(name, None) is not None:
+            self._rearm()
+
+    def is_scheduled(self, name):
+        return name in self._jobs
+
+    def set_interval(self, name, interval_ms):
+        """Change the period of a job, keeping its last run as the reference"""
+        job = self._jobs.get(name)
+        if job is None or job["interval"] == interval_ms:
+            return
+        job["next_due"] += interval_ms - job["interval"]
+        job["interval"] = interval_ms
+        self._rearm()
+
+    def stats(self):
+        """Return wakeup counters for measuring how often the app wakes up"""
+        uptime = time.monotonic() - self.started_at
+        return {
+            "uptime_seconds": uptime,
+            "wakeups": self.wakeups,
+            "wakeups_per_minute": self.wakeups / uptime * 60 if uptime else 0.0,
+            "jobs": {name: job["runs"] for name, job in self._jobs.items()},
+        }
+
+    def _rearm(self):
+        if not self._jobs:
+            self._timer.stop()
+            return
+        next_due = min(job["next_due"] for job in self._jobs.values())
+        self._timer.start(max(0, int(next_due - self._now_ms())))
+
+    def _run_due_jobs(self):
+        self.wakeups += 1
+        now = self._now_ms()
+
+        due = [
+            (name, job)
+            for name, job in self._jobs.items()
+            if job["next_due"] <= now + self.coalesce_ms
+        ]
+        for name, job in due:
+            # Advance from the previous deadline to avoid drift, but skip
+            # missed periods instead of running them back to back
+            job["next_due"] += job["interval"]
+            if job["next_due"] <= now:
+                job["next_due"] = now + job["interval"]
+            job["runs"] += 1
+
+        for name, job in due:
+            # A previous callback may have cancelled or replaced this job
+            if self._jobs.get(name) is not job:
+                continue
+            try:
+                job["callback"]()
+            except Exception as e:
+                logger.error(f"Error running scheduled job {name}: {e}")
+
+        self._rearm()
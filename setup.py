@@ -41,7 +41,21 @@ build_exe_options = {
     ],
     "excludes": [],
     "include_files": [*get_static_files(), "tasks_new.json", ".env.example"],
-    "includes": ["jira_integration"],  # Include the jira_integration module
+    # Modules imported lazily after startup, which cx_Freeze cannot detect
+    "includes": [
+        "alchemy",
+        "control",
+        "control_server",
+        "export",
+        "gui.main_window",
+        "gui.sync_worker",
+        "gui.task_table_model",
+        "jira_integration",
+        "jira_sync",
+        "outbox",
+        "plyer.platforms",
+        "time_tracking",
+    ],
     "build_exe": "dist",  # Output directory
     "optimize": 2,
     "include_msvcr": True,  # Include Microsoft Visual C++ runtime
@@ -65,6 +79,13 @@ setup(
             target_name="TimeTracker",
             shortcut_name="TimeTracker",
             shortcut_dir="DesktopFolder",
-        )
+        ),
+        # Console entry point for scripts and git hooks; never imports Qt
+        Executable(
+            "cli.py",
+            base=None,
+            icon="static/icon.png",
+            target_name="timetracker-cli",
+        ),
     ],
 )
@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+
+from control import ControlUnavailable, instance_id, runtime_dir, send_command
+from logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds a second launch waits for an app that is still starting up to open
+# its control socket
+STARTUP_WAIT = 10.0
+
+# Seconds between attempts to reach an app that is starting up
+RETRY_INTERVAL = 0.1
+
+
+class InstanceLock:
+    """
+    Exclusive lock on a file, held by the running app for as long as its
+    process lives
+
+    The operating system releases the lock when the process exits or
+    crashes, so a lock file left behind never blocks the next launch.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.fd = None
+
+    def acquire(self):
+        """Try to take the lock without waiting; returns True on success"""
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        # The PID is only for people looking at the file
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        self.fd = fd
+        return True
+
+    def release(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+def lock_path(db_path=None):
+    """Return the path of the instance lock file for a database"""
+    return os.path.join(runtime_dir(), f"{instance_id(db_path)}.lock")
+
+
+def forward_to_running_instance(argv, db_path=None):
+    """Ask the running app to come to the front; returns False if none is
+    listening"""
+    try:
+        send_command("activate", db_path=db_path, argv=argv)
+    except ControlUnavailable:
+        return False
+    logger.info(f"Forwarded {argv} to the running instance")
+    return True
+
+
+def claim_instance(argv, db_path=None, wait=STARTUP_WAIT):
+    """
+    Make this process the only app instance for a database
+
+    The running app is found through its control socket, which only needs
+    the standard library, so a second launch hands over its arguments and
+    exits before creating a QApplication or opening the database. The lock
+    file covers the moments before the first instance starts listening, e.g.
+    two launches at once: whoever takes the lock starts the app, and the
+    other one waits for its socket.
+
+    Args:
+        argv: Command line arguments to forward to the running app
+        db_path: Database of the instance. Defaults to the configured one
+        wait: Seconds to wait for an instance that is still starting up
+
+    Returns:
+        InstanceLock: The lock to hold while the app runs, or None if the
+        arguments were forwarded to the running app
+
+    Raises:
+        RuntimeError: If another instance holds the lock but never answers
+    """
+    if forward_to_running_instance(argv, db_path):
+        return None
+
+    lock = InstanceLock(lock_path(db_path))
+    deadline = time.monotonic() + wait
+    while not lock.acquire():
+        # Another instance is starting and not listening yet
+        if time.monotonic() > deadline:
+            raise RuntimeError(
+                f"Another instance holds {lock.path} but does not answer on "
+                f"its control socket"
+            )
+        time.sleep(RETRY_INTERVAL)
+        if forward_to_running_instance(argv, db_path):
+            return None
+    return lock
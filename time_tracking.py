@@ -1,7 +1,18 @@
 import sqlite3
-from datetime import datetime
-
-from alchemy import create_task, get_db_connection, get_task, update_task
+from datetime import date, datetime
+
+from alchemy import (
+    create_task,
+    end_segment,
+    enqueue_worklog,
+    get_db_connection,
+    get_outbox_size,
+    get_running_tasks,
+    get_segment_durations,
+    get_task,
+    get_total_duration_for_range,
+    start_segment,
+)
 from logging_setup import get_logger
 
 logger = get_logger(__name__)
@@ -11,8 +22,7 @@ def start_task(task_name, jira_key=None, notes=None):
     """Start a new task and return its ID"""
     try:
         task_id = create_task(task_name, jira_key, notes)
-        start_time = datetime.now().isoformat()
-        update_task(task_id, start_time=start_time)
+        start_segment(task_id)
         logger.info(f"Started task: {task_name} (ID: {task_id})")
         return task_id
     except Exception as e:
@@ -21,21 +31,9 @@ def start_task(task_name, jira_key=None, notes=None):
 
 
 def pause_task(task_id):
-    """Pause a running task and update its duration"""
+    """Pause a running task and return its total duration"""
     try:
-        task = get_task(task_id)
-        if not task:
-            raise ValueError(f"Task {task_id} not found")
-
-        start_time = datetime.fromisoformat(task[2]) if task[2] else None
-        if not start_time:
-            raise ValueError(f"Task {task_id} hasn't been started")
-
-        end_time = datetime.now()
-        new_duration = calculate_duration(start_time, end_time)
-        total_duration = (task[4] or 0) + new_duration
-
-        update_task(task_id, end_time=end_time.isoformat(), duration=total_duration)
+        total_duration = end_segment(task_id)
         logger.info(f"Paused task {task_id}")
         return total_duration
     except Exception as e:
@@ -46,12 +44,7 @@ def pause_task(task_id):
 def resume_task(task_id):
     """Resume a paused task"""
     try:
-        task = get_task(task_id)
-        if not task:
-            raise ValueError(f"Task {task_id} not found")
-
-        start_time = datetime.now().isoformat()
-        update_task(task_id, start_time=start_time, end_time=None)
+        start_segment(task_id)
         logger.info(f"Resumed task {task_id}")
     except Exception as e:
         logger.error(f"Error resuming task: {e}")
@@ -65,23 +58,69 @@ def stop_task(task_id):
         if not task:
             raise ValueError(f"Task {task_id} not found")
 
-        start_time = datetime.fromisoformat(task[2]) if task[2] else None
-        if not start_time:
+        if not task[2]:
             raise ValueError(f"Task {task_id} hasn't been started")
 
-        # Calculate final duration including any previous duration
-        end_time = datetime.now()
-        new_duration = calculate_duration(start_time, end_time)
-        total_duration = (task[4] or 0) + new_duration
-
-        update_task(task_id, end_time=end_time.isoformat(), duration=total_duration)
+        # A paused task has no running segment; its duration is already final
+        total_duration = end_segment(task_id, require_open=False)
         logger.info(f"Stopped task {task_id}")
+
+        # Hand the worklog to the background outbox drainer
+        if task[5]:
+            enqueue_worklog(task_id)
+
         return total_duration
     except Exception as e:
         logger.error(f"Error stopping task: {e}")
         raise
 
 
+def describe_task(task_id):
+    """Return the ID, name, JIRA key and recorded duration of a task as a dict"""
+    task = get_task(task_id)
+    if not task:
+        raise ValueError(f"Task {task_id} not found")
+    return {
+        "task_id": task[0],
+        "task_name": task[1],
+        "jira_key": task[5],
+        "duration": task[4] or 0.0,
+    }
+
+
+def get_status(task_id=None):
+    """
+    Summarize what is being tracked, for status displays
+
+    Args:
+        task_id: The task the caller treats as current, e.g. one paused in the
+            app. Defaults to the most recently started running task
+
+    Returns:
+        dict: ``task`` (None, or ``describe_task`` plus ``running`` and the
+        ``elapsed`` hours so far), ``today`` hours including the running
+        time, and the number of ``queued`` worklogs
+    """
+    running_ids = [task.task_id for task in get_running_tasks()]
+    if task_id is None and running_ids:
+        task_id = running_ids[0]
+
+    today = date.today()
+    # Rollups only include closed segments; running time is added below
+    today_hours = get_total_duration_for_range(today, today)
+    task = None
+    if task_id is not None:
+        task = describe_task(task_id)
+        task["running"] = task_id in running_ids
+        task["elapsed"] = get_segment_durations([task_id]).get(
+            task_id, task["duration"]
+        )
+        if task["running"]:
+            today_hours += task["elapsed"] - task["duration"]
+
+    return {"task": task, "today": today_hours, "queued": get_outbox_size()}
+
+
 def calculate_duration(start_time, end_time) -> float:
     """
     Calculate duration in hours between start and end times
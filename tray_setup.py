@@ -1,13 +1,19 @@
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QMenu, QSystemTrayIcon
 
-from jira_integration import JiraCredentialsDialog, setup_jira_credentials
 from logging_setup import get_logger
 from utils import resource_path
 
 logger = get_logger(__name__)
 
 
+def show_jira_credentials_dialog():
+    """Open the JIRA credentials dialog, loading the JIRA module on first use"""
+    from jira_integration import JiraCredentialsDialog
+
+    JiraCredentialsDialog().exec()
+
+
 def setup_tray_icon(app, widget):
     """
     Set up the system tray icon and its menu.
@@ -32,7 +38,7 @@ def setup_tray_icon(app, widget):
 
     # Add JIRA credentials configuration option to tray menu
     jira_config_action = tray_menu.addAction("Configure JIRA")
-    jira_config_action.triggered.connect(lambda: JiraCredentialsDialog().exec())
+    jira_config_action.triggered.connect(show_jira_credentials_dialog)
 
     # Create show/hide action that toggles based on widget visibility
     show_hide_action = tray_menu.addAction("Hide")
@@ -17,6 +17,25 @@ def resource_path(relative_path):
 
     return os.path.join(base_path, relative_path)
 
+
+def default_db_path():
+    """
+    Return the database location
+
+    Uses TIMETRACKER_DB_PATH if set, otherwise timetracker.db next to the
+    application (the executable for cx_Freeze builds) rather than the CWD.
+    """
+    path = os.environ.get("TIMETRACKER_DB_PATH")
+    if path:
+        return os.path.abspath(os.path.expanduser(path))
+
+    if getattr(sys, "frozen", False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(base_path, "timetracker.db")
+
+
 def format_duration(hours):
     """Convert hours to a formatted duration string.
     
@@ -42,4 +61,5 @@ def format_duration(hours):
     if minutes > 0:
         parts.append(f"{minutes}m")
         
-    return " ".join(parts)
+    # Durations under a minute have no parts
+    return " ".join(parts) or "0m"